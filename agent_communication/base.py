@@ -1,27 +1,83 @@
 """Base classes for agent messaging system."""
 
 from abc import ABC, abstractmethod
-from typing import List, Type, Callable, Dict, Optional, TYPE_CHECKING
+import sys
+import warnings
+from typing import (
+    Any,
+    List,
+    Type,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    from agent_communication.channels import ChannelKey
     from agent_communication.routers.base import AbstractRouter
 
+# Every BaseMessage subclass by class name; later definitions win
+_MESSAGE_REGISTRY: Dict[str, Type["BaseMessage"]] = {}
+
+# (direction, session_id) pairs a declared channel_prefix is checked with
+_PREFIX_CHECKS = (("request", "session"), ("response", "*"), ("*", "*"))
+
 
 class BaseMessage(BaseModel, ABC):
     """Base class for all messages in the agent communication system.
 
     All message types must inherit from this class and implement the
     get_channel_pattern method to define their routing pattern.
+
+    Attributes:
+        durable: Whether brokers that support it should persist messages of
+            this type to disk. Off by default; enable it for messages that
+            must survive a broker restart.
+        channel_prefix: Opt-in fast path for routers building channels. Set
+            it only when ``get_channel_pattern()`` returns exactly
+            ``channel_prefix + direction + ":" + session_id``, e.g.
+            ``"OrderMessage:"``; routers then concatenate instead of calling
+            the pattern function. It is checked against the pattern when the
+            class is defined. None (the default) always uses the pattern.
     """
 
+    durable: ClassVar[bool] = False
+    channel_prefix: ClassVar[Optional[str]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Register each message class by name for deserialization.
+
+        Raises:
+            ValueError: If ``channel_prefix`` disagrees with the channel pattern
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        if cls.channel_prefix is not None:
+            pattern_func = cls.get_channel_pattern()
+            for direction, session_id in _PREFIX_CHECKS:
+                expected = pattern_func(direction, session_id)
+                if f"{cls.channel_prefix}{direction}:{session_id}" != expected:
+                    raise ValueError(
+                        f"{cls.__name__}.channel_prefix {cls.channel_prefix!r} "
+                        f"does not match its channel pattern {expected!r}"
+                    )
+        _MESSAGE_REGISTRY[cls.__name__] = cls
+
     @classmethod
     @abstractmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
         """Return a function that generates the channel pattern for this message type.
 
         The returned function should accept 'direction' and 'session_id' parameters
-        and return a formatted channel string.
+        and return a formatted channel string. It is called on every publish,
+        so implementations may build it once per class and return the same
+        function each time; it must depend only on the class and its two
+        arguments.
 
         Returns:
             A function that takes (direction: str, session_id: str) and returns
@@ -45,19 +101,96 @@ class BaseAgent(ABC):
 
     Agents can optionally be associated with a router for automatic
     subscription management and message publishing.
+
+    ``messages`` and ``sending_messages`` are read into per-class lookup sets
+    when the class is defined. Change them on the class, never on an
+    instance, and call ``refresh_message_sets()`` afterwards; until then the
+    agent keeps validating against the old lists. Unless Python runs with
+    ``-O``, validating or subscribing an agent whose lists no longer match
+    its lookup sets emits a RuntimeWarning.
+
+    Instance state lives in slots. Subclasses that declare their own
+    ``__slots__`` avoid a per-instance ``__dict__`` entirely; those that
+    don't keep one as usual.
     """
 
+    __slots__ = ("_router", "_subscribed", "_batch_publishes", "__weakref__")
+
     messages: List[Type[BaseMessage]] = []
     sending_messages: List[Type[BaseMessage]] = []
 
-    def __init__(self, router: Optional["AbstractRouter"] = None) -> None:
+    _messages_set: FrozenSet[Type[BaseMessage]] = frozenset()
+    _sending_messages_set: FrozenSet[Type[BaseMessage]] = frozenset()
+    # The lists the sets were built from and their lengths, to detect
+    # changes made without a refresh
+    _message_lists: Tuple[List[Type[BaseMessage]], int, List[Type[BaseMessage]], int] = (
+        [],
+        0,
+        [],
+        0,
+    )
+    # Built on first use by subscription_patterns(), per class
+    _subscription_patterns: Optional[Tuple[str, ...]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the message type lookups for each agent subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.refresh_message_sets()
+
+    @classmethod
+    def refresh_message_sets(cls) -> None:
+        """Rebuild the message type lookup sets and subscription patterns.
+
+        Call this after changing ``messages`` or ``sending_messages`` on an
+        agent class at runtime. Lists assigned on an instance are never
+        picked up.
+        """
+        cls._messages_set = frozenset(cls.messages)
+        cls._sending_messages_set = frozenset(cls.sending_messages)
+        cls._message_lists = (
+            cls.messages,
+            len(cls.messages),
+            cls.sending_messages,
+            len(cls.sending_messages),
+        )
+        cls._subscription_patterns = None
+
+    def _check_message_lists(self) -> None:
+        """Warn if messages or sending_messages changed without a refresh.
+
+        Catches lists reassigned on the class or set on an instance, and
+        items added to or removed from the lists in place.
+        """
+        messages, length, sending, sending_length = self._message_lists
+        if (
+            self.messages is not messages
+            or len(messages) != length
+            or self.sending_messages is not sending
+            or len(sending) != sending_length
+        ):
+            warnings.warn(
+                f"{type(self).__name__}.messages or sending_messages changed "
+                "without refresh_message_sets(); the agent still uses the "
+                "lists it had when last refreshed. Change them on the class "
+                "and call refresh_message_sets().",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def __init__(
+        self, router: Optional["AbstractRouter"] = None, batch_publishes: bool = False
+    ) -> None:
         """Initialize the agent.
 
         Args:
             router: Optional router for automatic subscription management
+            batch_publishes: If True, publish and broadcast queue messages on
+                the router and return immediately; queued messages are sent
+                in batches (see AbstractRouter.publish_nowait)
         """
         self._router = router
         self._subscribed = False
+        self._batch_publishes = batch_publishes
 
     @abstractmethod
     def handle_message(self, message: BaseMessage, context: Dict[str, str]) -> None:
@@ -69,6 +202,31 @@ class BaseAgent(ABC):
         """
         pass
 
+    def subscription_patterns(self) -> List[str]:
+        """Return the channel patterns this agent listens on.
+
+        One pattern per declared message type, matching any direction and
+        session, in declaration order and without duplicates. The patterns
+        are built on first use, once per agent class.
+
+        Returns:
+            List of channel patterns
+        """
+        if __debug__:
+            self._check_message_lists()
+        cls = type(self)
+        # Looked up on the class itself so a subclass never reuses its
+        # parent's patterns
+        patterns = cls.__dict__.get("_subscription_patterns")
+        if patterns is None:
+            patterns = cls._subscription_patterns = tuple(
+                dict.fromkeys(
+                    sys.intern(message_class.get_channel_pattern()("*", "*"))
+                    for message_class in cls.messages
+                )
+            )
+        return list(patterns)
+
     def validate_incoming_message(self, message: BaseMessage) -> bool:
         """Validate that this agent can handle the given message type.
 
@@ -78,7 +236,9 @@ class BaseAgent(ABC):
         Returns:
             True if the agent can handle this message type, False otherwise
         """
-        return type(message) in self.messages
+        if __debug__:
+            self._check_message_lists()
+        return type(message) in self._messages_set
 
     def validate_outgoing_message(self, message: BaseMessage) -> bool:
         """Validate that this agent is allowed to send the given message type.
@@ -89,7 +249,9 @@ class BaseAgent(ABC):
         Returns:
             True if the agent can send this message type, False otherwise
         """
-        return type(message) in self.sending_messages
+        if __debug__:
+            self._check_message_lists()
+        return type(message) in self._sending_messages_set
 
     async def subscribe(self, pattern: Optional[str] = None) -> None:
         """Subscribe to message channels.
@@ -133,16 +295,24 @@ class BaseAgent(ABC):
         if not self._router:
             raise RuntimeError("No router configured for this agent")
 
-        if not self.validate_outgoing_message(message):
+        # Skipped under python -O for trusted, high-throughput deployments
+        if __debug__ and not self.validate_outgoing_message(message):
             raise ValueError(
                 f"Agent {self.__class__.__name__} is not allowed to send "
                 f"messages of type {message.__class__.__name__}"
             )
 
-        await self._router.publish(message, channel)
+        if self._batch_publishes:
+            self._router.publish_nowait(message, channel)
+        else:
+            await self._router.publish(message, channel)
 
     async def broadcast(
-        self, message: BaseMessage, direction: str = "response", session_id: str = "*"
+        self,
+        message: BaseMessage,
+        direction: str = "response",
+        session_id: str = "*",
+        channel_key: Optional["ChannelKey"] = None,
     ) -> None:
         """Broadcast a message using its channel pattern.
 
@@ -150,17 +320,26 @@ class BaseAgent(ABC):
             message: Message to broadcast
             direction: Direction for the channel pattern
             session_id: Session ID for the channel pattern
+            channel_key: Optional pre-split (message_class, direction, session_id)
+                components, e.g. taken from a received message's channel
         """
         if not self._router:
             raise RuntimeError("No router configured for this agent")
 
-        if not self.validate_outgoing_message(message):
+        # Skipped under python -O for trusted, high-throughput deployments
+        if __debug__ and not self.validate_outgoing_message(message):
             raise ValueError(
                 f"Agent {self.__class__.__name__} is not allowed to send "
                 f"messages of type {message.__class__.__name__}"
             )
 
-        await self._router.broadcast(message, direction, session_id)
+        if self._batch_publishes:
+            channel = self._router.broadcast_channel(
+                message, direction, session_id, channel_key
+            )
+            self._router.publish_nowait(message, channel)
+        else:
+            await self._router.broadcast(message, direction, session_id, channel_key)
 
     @property
     def router(self) -> Optional["AbstractRouter"]:
@@ -1,7 +1,22 @@
 """Channel management utilities for agent communication."""
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import re
+import sys
+
+from agent_communication.exceptions import InvalidChannelFormat
+
+# (registration order, matcher, target patterns)
+Route = Tuple[int, Callable[[str], bool], List[str]]
+
+
+def _route_order(route: Route) -> int:
+    """Sort key putting routes in the order they were first added."""
+    return route[0]
+
+
+# Pre-split channel components: (message_class, direction, session_id)
+ChannelKey = Tuple[str, str, str]
 
 
 class ChannelManager:
@@ -21,7 +36,7 @@ class ChannelManager:
         Returns:
             Formatted channel name
         """
-        return f"{message_class}:{direction}:{session_id}"
+        return ":".join((message_class, direction, session_id))
 
     @staticmethod
     def parse_channel(channel: str) -> Dict[str, str]:
@@ -34,28 +49,45 @@ class ChannelManager:
             Dictionary with message_class, direction, and session_id
 
         Raises:
-            ValueError: If channel format is invalid
+            InvalidChannelFormat: If channel format is invalid
         """
-        parts = channel.split(":")
-        if len(parts) != 3:
-            raise ValueError(
-                f"Invalid channel format: {channel}. "
-                f"Expected: 'MessageClass:direction:session_id'"
-            )
-
+        message_class, direction, session_id = ChannelManager._split_channel(channel)
         return {
-            "message_class": parts[0],
-            "direction": parts[1],
-            "session_id": parts[2],
+            "message_class": message_class,
+            "direction": direction,
+            "session_id": session_id,
         }
 
+    @staticmethod
+    def _split_channel(channel: str) -> ChannelKey:
+        """Split a channel name into its three components.
+
+        Args:
+            channel: Channel name to split
+
+        Returns:
+            Tuple of (message_class, direction, session_id)
+
+        Raises:
+            InvalidChannelFormat: If channel format is invalid
+        """
+        first = channel.find(":")
+        if first < 0:
+            raise InvalidChannelFormat(channel)
+        second = channel.find(":", first + 1)
+        if second < 0 or channel.find(":", second + 1) >= 0:
+            raise InvalidChannelFormat(channel)
+        return channel[:first], channel[first + 1 : second], channel[second + 1 :]
+
     @staticmethod
     def match_pattern(channel: str, pattern: str) -> bool:
         """Check if a channel matches a pattern.
 
         Supports wildcards:
-        - * matches any single segment
-        - ** matches any number of segments
+        - * matches any single segment, or any run of characters within a
+          segment when combined with literal text (e.g. "Audio*")
+        - ** matches one or more trailing segments; it is only allowed as
+          the last segment of a pattern
 
         Args:
             channel: Channel name to check
@@ -63,15 +95,164 @@ class ChannelManager:
 
         Returns:
             True if channel matches pattern
+
+        Raises:
+            ValueError: If ** appears anywhere but as the last segment
         """
         if pattern == channel:
             return True
+        if "*" not in pattern:
+            return False
+
+        # Fast paths for the all-channels and per-class broadcast patterns
+        if pattern == "*:*:*":
+            return channel.count(":") == 2
+        if pattern.endswith(":*:*") and pattern.count(":") == 2:
+            if "*" not in pattern[:-4]:
+                return channel.startswith(pattern[:-3]) and channel.count(":") == 2
+
+        segments, trailing = ChannelManager._split_pattern(pattern)
+        parts = channel.split(":")
 
-        pattern_regex = pattern.replace("**", ".*")
-        pattern_regex = pattern_regex.replace("*", "[^:]*")
-        pattern_regex = f"^{pattern_regex}$"
+        if trailing:
+            if len(parts) <= len(segments):
+                return False
+        elif len(parts) != len(segments):
+            return False
 
-        return bool(re.match(pattern_regex, channel))
+        for segment, part in zip(segments, parts):
+            if segment == "*":
+                continue
+            if "*" in segment:
+                if not ChannelManager._match_segment_glob(segment, part):
+                    return False
+            elif segment != part:
+                return False
+        return True
+
+    @staticmethod
+    def _split_pattern(pattern: str) -> Tuple[List[str], bool]:
+        """Split a pattern into segments, detaching a trailing **.
+
+        Args:
+            pattern: Pattern to split
+
+        Returns:
+            Tuple of (segments without the trailing **, whether it had one)
+
+        Raises:
+            ValueError: If ** appears anywhere but as the last segment
+        """
+        segments = pattern.split(":")
+        trailing = segments[-1] == "**"
+        if trailing:
+            segments.pop()
+
+        for segment in segments:
+            if "**" in segment:
+                raise ValueError(
+                    f"Invalid pattern: {pattern}. "
+                    f"'**' is only allowed as the last segment"
+                )
+        return segments, trailing
+
+    @staticmethod
+    def _match_segment_glob(segment: str, part: str) -> bool:
+        """Match one channel segment against a segment containing *.
+
+        Args:
+            segment: Pattern segment with one or more * wildcards
+            part: Channel segment to check
+
+        Returns:
+            True if the channel segment matches
+        """
+        pieces = segment.split("*")
+        head, tail = pieces[0], pieces[-1]
+        if len(part) < len(head) + len(tail):
+            return False
+        if not part.startswith(head) or not part.endswith(tail):
+            return False
+
+        position = len(head)
+        end = len(part) - len(tail)
+        for piece in pieces[1:-1]:
+            if piece:
+                position = part.find(piece, position, end)
+                if position < 0:
+                    return False
+                position += len(piece)
+        return True
+
+    @staticmethod
+    def _translate_pattern(pattern: str) -> str:
+        """Translate a wildcard pattern into an unanchored regex source string.
+
+        Args:
+            pattern: Pattern to translate
+
+        Returns:
+            Regex source with literals escaped
+        """
+        return ".*".join(
+            "[^:]*".join(re.escape(piece) for piece in chunk.split("*"))
+            for chunk in pattern.split("**")
+        )
+
+    @staticmethod
+    def compile_pattern(pattern: str) -> Callable[[str], bool]:
+        """Build a reusable matcher for a pattern.
+
+        The returned callable has the same semantics as ``match_pattern``
+        but does all pattern analysis up front, so it is cheap to call
+        repeatedly against many channels.
+
+        Args:
+            pattern: Pattern to compile
+
+        Returns:
+            Callable taking a channel name and returning True on a match
+
+        Raises:
+            ValueError: If ** appears anywhere but as the last segment
+        """
+        if "*" not in pattern:
+            return pattern.__eq__
+
+        if pattern == "*:*:*":
+            return lambda channel: channel.count(":") == 2
+
+        prefix = pattern[:-3]
+        if pattern.endswith(":*:*") and "*" not in prefix and prefix.count(":") == 1:
+            return lambda channel: (
+                channel.startswith(prefix) and channel.count(":") == 2
+            )
+
+        segments, trailing = ChannelManager._split_pattern(pattern)
+        size = len(segments)
+        checks = [
+            (index, segment, "*" in segment)
+            for index, segment in enumerate(segments)
+            if segment != "*"
+        ]
+        match_glob = ChannelManager._match_segment_glob
+
+        def matcher(channel: str) -> bool:
+            parts = channel.split(":")
+            if trailing:
+                if len(parts) <= size:
+                    return False
+            elif len(parts) != size:
+                return False
+            for index, segment, is_glob in checks:
+                if is_glob:
+                    if not match_glob(segment, parts[index]):
+                        return False
+                elif parts[index] != segment:
+                    return False
+            return True
+
+        return matcher
 
     @staticmethod
     def extract_session_id(channel: str) -> Optional[str]:
@@ -84,11 +265,10 @@ class ChannelManager:
             Session ID or None if not found
         """
         try:
-            components = ChannelManager.parse_channel(channel)
-            session_id = components.get("session_id")
-            return session_id if session_id != "*" else None
-        except ValueError:
+            session_id = ChannelManager._split_channel(channel)[2]
+        except InvalidChannelFormat:
             return None
+        return session_id if session_id != "*" else None
 
     @staticmethod
     def create_response_channel(request_channel: str) -> str:
@@ -99,14 +279,12 @@ class ChannelManager:
 
         Returns:
             Corresponding response channel name
+
+        Raises:
+            InvalidChannelFormat: If channel format is invalid
         """
-        components = ChannelManager.parse_channel(request_channel)
-        components["direction"] = "response"
-        return ChannelManager.create_channel(
-            components["message_class"],
-            components["direction"],
-            components["session_id"],
-        )
+        message_class, _, session_id = ChannelManager._split_channel(request_channel)
+        return ":".join((message_class, "response", session_id))
 
     @staticmethod
     def create_broadcast_pattern(message_class: str) -> str:
@@ -143,18 +321,32 @@ class ChannelManager:
             True if channel name is valid
         """
         try:
-            ChannelManager.parse_channel(channel)
+            ChannelManager._split_channel(channel)
             return True
-        except ValueError:
+        except InvalidChannelFormat:
             return False
 
 
 class ChannelRouter:
-    """Advanced routing logic for channel-based messaging."""
+    """Advanced routing logic for channel-based messaging.
+
+    Routes are indexed by shape so lookups avoid scanning every rule:
+    literal patterns are found by dictionary lookup, patterns with a
+    literal message class are bucketed by that class, and patterns
+    wildcarding the message class are prefiltered with a single combined
+    regex before being matched individually. Each route remembers when it
+    was first added, so matches from different buckets are merged back
+    into registration order.
+    """
 
     def __init__(self) -> None:
         """Initialize the channel router."""
-        self._routes: Dict[str, List[str]] = {}
+        self._routes: Dict[str, Route] = {}
+        self._exact: Dict[str, Route] = {}
+        self._by_class: Dict[str, List[Route]] = {}
+        self._wildcard: List[Route] = []
+        self._wildcard_patterns: List[str] = []
+        self._wildcard_regex: Optional["re.Pattern[str]"] = None
 
     def add_route(self, source_pattern: str, target_patterns: List[str]) -> None:
         """Add a routing rule.
@@ -164,8 +356,24 @@ class ChannelRouter:
             target_patterns: List of target channel patterns
         """
         if source_pattern not in self._routes:
-            self._routes[source_pattern] = []
-        self._routes[source_pattern].extend(target_patterns)
+            route: Route = (
+                len(self._routes),
+                ChannelManager.compile_pattern(source_pattern),
+                [],
+            )
+            self._routes[source_pattern] = route
+
+            message_class, separator, _ = source_pattern.partition(":")
+            if "*" not in source_pattern:
+                self._exact[source_pattern] = route
+            elif separator and "*" not in message_class:
+                self._by_class.setdefault(sys.intern(message_class), []).append(route)
+            else:
+                self._wildcard.append(route)
+                self._wildcard_patterns.append(source_pattern)
+                self._wildcard_regex = None
+
+        self._routes[source_pattern][2].extend(target_patterns)
 
     def get_routes(self, channel: str) -> List[str]:
         """Get all target patterns for a channel.
@@ -174,14 +382,49 @@ class ChannelRouter:
             channel: Channel to route from
 
         Returns:
-            List of target patterns
+            List of target patterns, deduplicated, in the order their routes
+            were first added
         """
-        targets = []
-        for pattern, target_patterns in self._routes.items():
-            if ChannelManager.match_pattern(channel, pattern):
-                targets.extend(target_patterns)
-        return list(set(targets))
+        matched: List[Route] = []
+
+        exact = self._exact.get(channel)
+        if exact is not None:
+            matched.append(exact)
+
+        for route in self._by_class.get(channel.partition(":")[0], ()):
+            if route[1](channel):
+                matched.append(route)
+
+        if self._wildcard:
+            if self._wildcard_regex is None:
+                self._wildcard_regex = re.compile(
+                    "|".join(
+                        f"({ChannelManager._translate_pattern(pattern)})"
+                        for pattern in self._wildcard_patterns
+                    )
+                )
+            match = self._wildcard_regex.fullmatch(channel)
+            if match is not None and match.lastindex is not None:
+                # Alternatives are tried in order, so the reported group is
+                # the first matching route; only later routes need checking.
+                first = match.lastindex - 1
+                matched.append(self._wildcard[first])
+                for route in self._wildcard[first + 1 :]:
+                    if route[1](channel):
+                        matched.append(route)
+
+        # Each bucket is already in registration order; merge across buckets
+        matched.sort(key=_route_order)
+        targets: Dict[str, None] = {}
+        for _, _, target_patterns in matched:
+            targets.update(dict.fromkeys(target_patterns))
+        return list(targets)
 
     def clear_routes(self) -> None:
         """Clear all routing rules."""
         self._routes.clear()
+        self._exact.clear()
+        self._by_class.clear()
+        self._wildcard.clear()
+        self._wildcard_patterns.clear()
+        self._wildcard_regex = None
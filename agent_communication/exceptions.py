@@ -2,6 +2,23 @@
 
 from typing import List, Optional
 
+# Message templates, formatted with % when an exception is raised
+_INVALID_CHANNEL_TEMPLATE = (
+    "Channel '%s' has invalid format. Expected: '%s', got: '%s'"
+)
+_NOT_REGISTERED_TEMPLATE = "Message class '%s' not found in registry."
+_AVAILABLE_CLASSES_TEMPLATE = " Available classes: %s."
+_NOT_REGISTERED_HINT = (
+    " Did you forget to register an agent that handles this message type?"
+)
+_VALIDATION_TEMPLATE = "Failed to deserialize %s: %s."
+_PAYLOAD_PREVIEW_TEMPLATE = " Payload was: %s..."
+_INVALID_AGENT_TEMPLATE = "Agent %s missing '%s' attribute. %s"
+_NO_AGENT_TEMPLATE = (
+    "No agent registered to handle %s. "
+    "Register an agent with this message type in its 'messages' list."
+)
+
 
 class AgentCommunicationError(Exception):
     """Base exception for all agent communication errors."""
@@ -9,35 +26,44 @@ class AgentCommunicationError(Exception):
     pass
 
 
-class InvalidChannelFormat(AgentCommunicationError):
-    """Raised when a channel name has an invalid format."""
+class InvalidChannelFormat(AgentCommunicationError, ValueError):
+    """Raised when a channel name has an invalid format.
+
+    Also a ValueError, which is what channel parsing historically raised.
+    The message is only formatted when the exception is rendered, so
+    callers that catch and discard it pay nothing for it.
+    """
 
     def __init__(
         self, channel: str, expected_format: str = "MessageClass:direction:session_id"
     ):
         self.channel = channel
         self.expected_format = expected_format
-        super().__init__(
-            f"Channel '{channel}' has invalid format. "
-            f"Expected: '{expected_format}', got: '{channel}'"
+        super().__init__(channel, expected_format)
+
+    def __str__(self) -> str:
+        return _INVALID_CHANNEL_TEMPLATE % (
+            self.channel,
+            self.expected_format,
+            self.channel,
         )
 
 
-class MessageClassNotRegistered(AgentCommunicationError):
-    """Raised when trying to deserialize a message class that isn't registered."""
+class MessageClassNotRegistered(AgentCommunicationError, ValueError):
+    """Raised when trying to deserialize a message class that isn't registered.
+
+    Also a ValueError, which is what message deserialization historically raised.
+    """
 
     def __init__(self, class_name: str, available_classes: Optional[List[str]] = None):
         self.class_name = class_name
         self.available_classes = available_classes or []
 
-        message = f"Message class '{class_name}' not found in registry."
+        message = _NOT_REGISTERED_TEMPLATE % class_name
         if self.available_classes:
-            message += f" Available classes: {', '.join(self.available_classes)}."
-        message += (
-            " Did you forget to register an agent that handles this message type?"
-        )
+            message += _AVAILABLE_CLASSES_TEMPLATE % ", ".join(self.available_classes)
 
-        super().__init__(message)
+        super().__init__(message + _NOT_REGISTERED_HINT)
 
 
 class MessageValidationError(AgentCommunicationError):
@@ -53,9 +79,9 @@ class MessageValidationError(AgentCommunicationError):
         self.validation_error = validation_error
         self.payload_preview = payload_preview
 
-        message = f"Failed to deserialize {class_name}: {validation_error}."
+        message = _VALIDATION_TEMPLATE % (class_name, validation_error)
         if payload_preview:
-            message += f" Payload was: {payload_preview}..."
+            message += _PAYLOAD_PREVIEW_TEMPLATE % payload_preview
 
         super().__init__(message)
 
@@ -69,8 +95,7 @@ class InvalidAgentError(AgentCommunicationError):
         self.suggestion = suggestion
 
         super().__init__(
-            f"Agent {agent_class} missing '{missing_attribute}' attribute. "
-            f"{suggestion}"
+            _INVALID_AGENT_TEMPLATE % (agent_class, missing_attribute, suggestion)
         )
 
 
@@ -79,7 +104,4 @@ class NoAgentFoundError(AgentCommunicationError):
 
     def __init__(self, message_type: str):
         self.message_type = message_type
-        super().__init__(
-            f"No agent registered to handle {message_type}. "
-            f"Register an agent with this message type in its 'messages' list."
-        )
+        super().__init__(_NO_AGENT_TEMPLATE % message_type)
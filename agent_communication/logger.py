@@ -1,10 +1,91 @@
 """JSON Lines logging configuration for the agent communication package."""
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime, timezone
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import IO, Dict, Any, Iterator, List, Optional, TextIO, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Standard LogRecord attributes that are not copied into the JSON output,
+# taken from a blank record so attributes added by newer Pythons (e.g.
+# taskName) are covered. message and asctime are set on the record by other
+# formatters when several handlers share it.
+_LOG_SKIP_FIELDS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a single compact JSON line.
+
+    Uses orjson when it is installed and falls back to the standard library
+    for values orjson rejects (e.g. non-string keys, very large integers).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                log_entry,
+                default=str,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(log_entry, default=str, separators=(",", ":"))
+
+
+def iter_log_records(
+    stream: Union[IO[str], IO[bytes]],
+) -> Iterator[Dict[str, Any]]:
+    """Read log entries back from JSON Lines output, one line at a time.
+
+    Uses orjson when it is installed. Text and binary streams both work;
+    blank lines are skipped.
+
+    Args:
+        stream: Open file or stream of JSON Lines log output
+
+    Yields:
+        One dict per log line
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    for line in stream:
+        if line.strip():
+            yield loads(line)
+
+
+# (whole second, formatted date and time) of the last timestamp formatted.
+# Swapped as one tuple so concurrent handler threads never see a torn pair.
+_last_second: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format an epoch timestamp as ISO 8601 UTC with a Z suffix.
+
+    Records logged within the same second reuse the date and time part.
+    """
+    global _last_second
+    second = int(created)
+    usec = int((created - second) * 1_000_000)
+
+    cached_second, prefix = _last_second
+    if cached_second != second:
+        tm = time.gmtime(second)
+        prefix = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        )
+        _last_second = (second, prefix)
+    return f"{prefix}.{usec:06d}Z"
 
 
 class JSONLineFormatter(logging.Formatter):
@@ -21,50 +102,162 @@ class JSONLineFormatter(logging.Formatter):
         """
         # Create base log entry with required fields
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "message": record.getMessage(),
-            "file": os.path.basename(record.pathname),
+            # Set by LogRecord from os.path.basename(pathname) at creation
+            "file": record.filename,
             "line": record.lineno,
         }
 
-        # Add any extra fields from the record
-        # Skip internal logging fields
-        skip_fields = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "msecs",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "processName",
-            "process",
-            "threadName",
-            "thread",
-            "getMessage",
-            "relativeCreated",
-            "taskName",
-        }
+        # Add any extra fields from the record, skipping internal logging fields.
+        # The set difference runs in C and lets records without extras skip
+        # the per-attribute loop entirely.
+        extra_keys = record.__dict__.keys() - _LOG_SKIP_FIELDS
+        if extra_keys:
+            for key, value in record.__dict__.items():
+                if key in extra_keys and not key.startswith("_"):
+                    log_entry[key] = value
+
+        return _dumps(log_entry)
+
+
+# Log lines buffered per handler before writing; 0 writes each line at once
+_LOG_BUFFER_SIZE = int(os.environ.get("LOG_BUFFER_SIZE", "0"))
+
+# Seconds after which buffered lines are written when the next record arrives
+_LOG_BUFFER_INTERVAL = 0.05
+
+
+class BufferedStreamHandler(logging.StreamHandler[TextIO]):
+    """Stream handler that writes several log lines per write call.
+
+    Lines are buffered and written together when the buffer is full, when a
+    WARNING or higher is logged, when the next record arrives after the
+    flush interval, and when logging shuts down.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        stream: Optional[TextIO] = None,
+        flush_interval: float = _LOG_BUFFER_INTERVAL,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            capacity: Number of lines to buffer before writing
+            stream: Stream to write to. Defaults to sys.stderr.
+            flush_interval: Seconds after which a new record writes the buffer
+        """
+        super().__init__(stream)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a formatted record, writing the buffer when due.
+
+        Args:
+            record: The LogRecord to emit
+        """
+        try:
+            self._lines.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if (
+            len(self._lines) >= self.capacity
+            or record.levelno >= logging.WARNING
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines in one call and flush the stream."""
+        self.acquire()
+        try:
+            if self._lines:
+                lines = "".join(self._lines)
+                self._lines.clear()
+                self.stream.write(lines)
+            super().flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+
+# Set to hand records to a background thread that formats and writes them
+_LOG_QUEUE = os.environ.get("LOG_QUEUE", "") not in ("", "0")
+
+_queue_lock = threading.Lock()
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
-        for key, value in record.__dict__.items():
-            if key not in skip_fields and not key.startswith("_"):
-                log_entry[key] = value
 
-        return json.dumps(log_entry, default=str)
+def _make_stream_handler() -> logging.Handler:
+    """Build the handler that writes JSON lines to stderr."""
+    handler: logging.Handler = (
+        BufferedStreamHandler(_LOG_BUFFER_SIZE)
+        if _LOG_BUFFER_SIZE > 0
+        else logging.StreamHandler()
+    )
+    handler.setFormatter(JSONLineFormatter())
+    return handler
+
+
+class _MessageOnlyFormatter(logging.Formatter):
+    """Merges a record's arguments without appending tracebacks.
+
+    Keeps queued records' messages the same as those JSONLineFormatter
+    writes directly.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record's message with its arguments merged in."""
+        return record.getMessage()
+
+
+def _shared_queue_handler() -> logging.handlers.QueueHandler:
+    """Get the queue handler all loggers share, starting its listener once.
+
+    Returns:
+        Handler that enqueues records for the listener thread
+    """
+    global _queue_handler, _queue_listener
+    with _queue_lock:
+        if _queue_handler is None:
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, _make_stream_handler()
+            )
+            _queue_listener.start()
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+            _queue_handler.setFormatter(_MessageOnlyFormatter())
+        return _queue_handler
+
+
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Write out queued records and stop the listener thread, if running."""
+    global _queue_handler, _queue_listener
+    with _queue_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+        _queue_handler = None
+        _queue_listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger configured with JSON Lines formatting.
 
+    Set the ``LOG_BUFFER_SIZE`` environment variable to a number of lines to
+    have new loggers buffer their output (see BufferedStreamHandler). Set
+    ``LOG_QUEUE=1`` to have new loggers only enqueue records, leaving
+    formatting and writing to a background thread.
+
     Args:
         name: The name for the logger (typically the agent or module name)
 
@@ -78,9 +271,9 @@ def get_logger(name: str) -> logging.Logger:
         logger.setLevel(logging.INFO)
 
         # Create handler with JSON formatter
-        handler = logging.StreamHandler()
-        handler.setFormatter(JSONLineFormatter())
-        logger.addHandler(handler)
+        logger.addHandler(
+            _shared_queue_handler() if _LOG_QUEUE else _make_stream_handler()
+        )
 
         # Prevent propagation to avoid duplicate logs
         logger.propagate = False
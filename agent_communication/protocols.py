@@ -1,5 +1,7 @@
 """Protocol definitions for flexible agent and message implementations."""
 
+import json
+import sys
 from typing import (
     Protocol,
     runtime_checkable,
@@ -7,10 +9,20 @@ from typing import (
     Type,
     Dict,
     Callable,
+    ClassVar,
+    FrozenSet,
     Optional,
     Any,
+    Tuple,
 )
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ORJSON = False
+
 
 @runtime_checkable
 class MessageProtocol(Protocol):
@@ -157,6 +169,31 @@ class RouterProtocol(Protocol):
         ...
 
 
+_message_protocol_cache: Dict[type, bool] = {}
+
+
+def is_message(obj: object) -> bool:
+    """Check whether an object conforms to MessageProtocol.
+
+    ``isinstance`` against a runtime-checkable protocol inspects every
+    protocol member on each call. Conformance is effectively decided by the
+    class, so the result is cached per concrete type; members added to a
+    class or its instances after its first check are not seen.
+
+    Args:
+        obj: Object to check
+
+    Returns:
+        True if the object implements MessageProtocol
+    """
+    obj_type = type(obj)
+    result = _message_protocol_cache.get(obj_type)
+    if result is None:
+        result = isinstance(obj, MessageProtocol)
+        _message_protocol_cache[obj_type] = result
+    return result
+
+
 class MessageMixin:
     """Mixin class that provides message functionality.
 
@@ -164,16 +201,100 @@ class MessageMixin:
     without requiring direct inheritance from BaseMessage.
     """
 
+    __slots__ = ()
+
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
-        """Default channel pattern implementation."""
+        """Default channel pattern implementation.
+
+        The pattern function is built once per class and cached on it.
+        """
+        cached: Optional[Callable[[str, str], str]] = cls.__dict__.get(
+            "_cached_channel_pattern_func"
+        )
+        if cached is not None:
+            return cached
+
+        # Interned so channel prefixes share one string object per class
+        name = sys.intern(cls.__name__)
 
         def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
+            return f"{name}:{direction}:{session_id}"
 
+        setattr(cls, "_cached_channel_pattern_func", pattern_func)
         return pattern_func
 
 
+class FastMessage(MessageMixin):
+    """Lightweight message base class without Pydantic validation.
+
+    Intended for high-throughput publishers where model validation is not
+    needed. Subclasses declare their fields in ``__slots__`` and are
+    constructed with keyword arguments; every declared field is required.
+
+    Example:
+        class TelemetryMessage(FastMessage):
+            __slots__ = ("sensor", "value")
+
+        message = TelemetryMessage(sensor="cpu", value=0.5)
+    """
+
+    __slots__ = ()
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the slot fields declared across the class hierarchy."""
+        super().__init_subclass__(**kwargs)
+        fields: List[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if not name.startswith("_") and name not in fields:
+                    fields.append(name)
+        cls._fields = tuple(fields)
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the message from keyword arguments.
+
+        Raises:
+            TypeError: If a field is missing or an unknown field is given
+        """
+        for name in self._fields:
+            try:
+                setattr(self, name, kwargs.pop(name))
+            except KeyError:
+                raise TypeError(
+                    f"{self.__class__.__name__} missing required field '{name}'"
+                ) from None
+        if kwargs:
+            raise TypeError(
+                f"{self.__class__.__name__} got unexpected fields: "
+                f"{', '.join(kwargs)}"
+            )
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Dump the message to a dictionary."""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def model_dump_json(self) -> str:
+        """Dump the message to a JSON string."""
+        if _HAS_ORJSON:
+            return orjson.dumps(self.model_dump()).decode()
+        return json.dumps(self.model_dump(), separators=(",", ":"))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastMessage) or type(other) is not type(self):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+
 class AgentMixin:
     """Mixin class that provides agent functionality.
 
@@ -184,10 +305,28 @@ class AgentMixin:
     messages: List[Type[MessageProtocol]] = []
     sending_messages: List[Type[MessageProtocol]] = []
 
+    _messages_set: FrozenSet[Type[MessageProtocol]] = frozenset()
+    _sending_messages_set: FrozenSet[Type[MessageProtocol]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the message type lookup sets for each agent subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.refresh_message_sets()
+
+    @classmethod
+    def refresh_message_sets(cls) -> None:
+        """Rebuild the message type lookup sets after changing the lists.
+
+        The lists are read from the class; lists assigned on an instance are
+        never picked up.
+        """
+        cls._messages_set = frozenset(cls.messages)
+        cls._sending_messages_set = frozenset(cls.sending_messages)
+
     def validate_incoming_message(self, message: MessageProtocol) -> bool:
         """Validate that this agent can handle the given message type."""
-        return type(message) in self.messages
+        return type(message) in self._messages_set
 
     def validate_outgoing_message(self, message: MessageProtocol) -> bool:
         """Validate that this agent is allowed to send the given message type."""
-        return type(message) in self.sending_messages
+        return type(message) in self._sending_messages_set
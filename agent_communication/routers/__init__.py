@@ -1,7 +1,28 @@
-"""Message routers for agent communication."""
+"""Message routers for agent communication.
+
+Backend routers are imported lazily so that using one backend does not
+import the client library of the other.
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from .base import AbstractRouter
-from .redis_router import RedisRouter
-from .rabbitmq_router import RabbitMQRouter
+
+if TYPE_CHECKING:
+    from .redis_router import RedisRouter
+    from .rabbitmq_router import RabbitMQRouter
 
 __all__ = ["AbstractRouter", "RedisRouter", "RabbitMQRouter"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve backend routers on first access."""
+    if name == "RedisRouter":
+        from .redis_router import RedisRouter
+
+        return RedisRouter
+    if name == "RabbitMQRouter":
+        from .rabbitmq_router import RabbitMQRouter
+
+        return RabbitMQRouter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
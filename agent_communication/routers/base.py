@@ -1,10 +1,397 @@
 """Abstract base class for message routers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Set, Optional, Type, List
+from collections import OrderedDict, deque
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Set,
+    Optional,
+    Type,
+    List,
+    Tuple,
+    cast,
+)
 import asyncio
-from agent_communication.base import BaseMessage, BaseAgent
+import json
+import re
+import sys
+from agent_communication.base import _MESSAGE_REGISTRY, BaseMessage, BaseAgent
+from agent_communication.channels import ChannelKey
+from agent_communication.exceptions import MessageClassNotRegistered
 from agent_communication.logger import get_logger
+from agent_communication.utils import parse_channel
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ORJSON = False
+
+# Shared decoder instance for the message wire format
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=None)
+def _type_prefix(message_type: str) -> bytes:
+    """Build the start of a serialized message up to its first field.
+
+    Args:
+        message_type: Message class name
+
+    Returns:
+        ``{"__type__":"<name>",`` as bytes
+    """
+    return b'{"__type__":' + json.dumps(message_type).encode("utf-8") + b","
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON message payload.
+
+    Falls back to the standard library for input orjson rejects, such as the
+    ``NaN`` literals the standard encoder writes for non-finite floats.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return _JSON_DECODER.decode(data.decode("utf-8"))
+
+
+# Number of distinct channels remembered by the per-channel caches
+_RESOLUTION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_RESOLUTION_CACHE_SIZE)
+def _cached_pattern_func(message_class: type) -> Callable[[str, str], str]:
+    """Get a message class's channel pattern function once.
+
+    Pattern functions depend only on their class and arguments, so the
+    first one returned serves every later channel of that class.
+
+    Args:
+        message_class: Message class
+
+    Returns:
+        The class's pattern function
+    """
+    pattern_func: Callable[[str, str], str]
+    pattern_func = message_class.get_channel_pattern()  # type: ignore[attr-defined]
+    return pattern_func
+
+
+@lru_cache(maxsize=_RESOLUTION_CACHE_SIZE)
+def _cached_channel_prefix(message_class: type, direction: str) -> str:
+    """Build the channel prefix of an opted-in message class once.
+
+    Keyed by class and direction only, so the cache stays small however
+    many sessions there are.
+
+    Args:
+        message_class: Message class that sets ``channel_prefix``
+        direction: Channel direction
+
+    Returns:
+        Channel name up to and including the colon before the session id
+    """
+    return sys.intern(
+        f"{message_class.channel_prefix}{direction}:"  # type: ignore[attr-defined]
+    )
+
+
+@lru_cache(maxsize=_RESOLUTION_CACHE_SIZE)
+def _cached_channel_context(channel: str) -> Dict[str, str]:
+    """Parse a channel once; callers must copy the returned dict.
+
+    The message class and direction take few distinct values across many
+    channels, so they are interned and shared between cached contexts.
+    Session ids are left alone since they are effectively unbounded.
+
+    Args:
+        channel: Channel name
+
+    Returns:
+        Shared context dictionary for the channel
+    """
+    context = parse_channel(channel)
+    context["message_class"] = sys.intern(context["message_class"])
+    context["direction"] = sys.intern(context["direction"])
+    return context
+
+
+class _SubTrie:
+    """Trie over channel segments for wildcard subscription lookup.
+
+    Each edge is either a literal segment or the single-segment wildcard
+    ``*``. Nodes that terminate a subscription pattern store that pattern.
+    """
+
+    __slots__ = ("children", "wildcard_child", "pattern")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: Dict[str, "_SubTrie"] = {}
+        self.wildcard_child: Optional["_SubTrie"] = None
+        self.pattern: Optional[str] = None
+
+    def insert(self, segments: List[str], pattern: str) -> None:
+        """Add a pattern under the given segment path.
+
+        Args:
+            segments: Pattern split on ':'
+            pattern: Pattern to store at the terminal node
+        """
+        node = self
+        for segment in segments:
+            if segment == "*":
+                if node.wildcard_child is None:
+                    node.wildcard_child = _SubTrie()
+                node = node.wildcard_child
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _SubTrie()
+                node = child
+        node.pattern = pattern
+
+    def copy_path(self, segments: List[str]) -> "_SubTrie":
+        """Copy the nodes along a segment path, sharing everything else.
+
+        The copy can then be changed along that path with ``insert`` or
+        ``remove`` without affecting this trie, at a cost proportional to
+        the path rather than the whole trie.
+
+        Args:
+            segments: Pattern split on ':'
+
+        Returns:
+            New root node
+        """
+        root = copy = self._copy_node()
+        node = self
+        for segment in segments:
+            child = node.wildcard_child if segment == "*" else node.children.get(segment)
+            if child is None:
+                break
+            child_copy = child._copy_node()
+            if segment == "*":
+                copy.wildcard_child = child_copy
+            else:
+                copy.children[segment] = child_copy
+            node, copy = child, child_copy
+        return root
+
+    def _copy_node(self) -> "_SubTrie":
+        """Shallow-copy this node with its own children dict."""
+        node = _SubTrie()
+        node.children = dict(self.children)
+        node.wildcard_child = self.wildcard_child
+        node.pattern = self.pattern
+        return node
+
+    def remove(self, segments: List[str]) -> None:
+        """Remove the pattern at a segment path and prune empty nodes.
+
+        Args:
+            segments: Pattern split on ':'
+        """
+        path: List[Tuple["_SubTrie", str]] = []
+        node: Optional[_SubTrie] = self
+        for segment in segments:
+            if node is None:
+                return
+            path.append((node, segment))
+            node = node.wildcard_child if segment == "*" else node.children.get(segment)
+        if node is None:
+            return
+        node.pattern = None
+
+        for parent, segment in reversed(path):
+            if node.pattern is not None or node.children or node.wildcard_child:
+                break
+            if segment == "*":
+                parent.wildcard_child = None
+            else:
+                del parent.children[segment]
+            node = parent
+
+    def match(self, segments: List[str]) -> List[str]:
+        """Find the stored patterns matching a channel.
+
+        Args:
+            segments: Channel split on ':'
+
+        Returns:
+            Matching patterns
+        """
+        nodes = [self]
+        for segment in segments:
+            next_nodes = []
+            for node in nodes:
+                child = node.children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                if node.wildcard_child is not None:
+                    next_nodes.append(node.wildcard_child)
+            if not next_nodes:
+                return []
+            nodes = next_nodes
+        return [node.pattern for node in nodes if node.pattern is not None]
+
+
+@dataclass(frozen=True)
+class _SubState:
+    """Immutable snapshot of the subscription index.
+
+    Writers build a new snapshot after every change and swap it in with a
+    single attribute assignment, so the delivery path reads one consistent
+    view without taking the router lock.
+
+    Attributes:
+        subscriptions: Pattern to subscribed agents
+        trie: Segment trie holding the trie-compatible wildcard patterns
+        regex_patterns: Remaining wildcard patterns with their compiled regex
+        combined_regex: Alternation of ``regex_patterns`` used as a prefilter
+        message_classes: Message class name to class, for deserialization
+        resolved: LRU cache of channel to subscribed agents. It belongs to
+            this snapshot, so publishing a new snapshot invalidates it.
+        resolved_by_pattern: LRU cache of (channel, pattern) to the agents
+            that receive the channel through that pattern
+    """
+
+    subscriptions: Mapping[str, FrozenSet[BaseAgent]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    trie: _SubTrie = field(default_factory=_SubTrie)
+    regex_patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...] = ()
+    combined_regex: Optional["re.Pattern[str]"] = None
+    message_classes: Mapping[str, Type[BaseMessage]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    resolved: "OrderedDict[str, Tuple[BaseAgent, ...]]" = field(
+        default_factory=OrderedDict, compare=False
+    )
+    resolved_by_pattern: "OrderedDict[Tuple[str, str], Tuple[BaseAgent, ...]]" = field(
+        default_factory=OrderedDict, compare=False
+    )
+
+    def agents_for(self, channel: str) -> Tuple[BaseAgent, ...]:
+        """Resolve the agents subscribed to a channel, using the LRU cache.
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            Subscribed agents, each listed once
+        """
+        resolved = self.resolved
+        agents = resolved.get(channel)
+        if agents is not None:
+            resolved.move_to_end(channel)
+            return agents
+
+        subscriptions = self.subscriptions
+        patterns = self.matching_patterns(channel)
+        if len(patterns) == 1:
+            # The common case: reuse the pattern's frozenset, no union needed
+            agents = tuple(subscriptions[patterns[0]])
+        else:
+            agents = tuple(
+                frozenset().union(*(subscriptions[pattern] for pattern in patterns))
+            )
+
+        resolved[channel] = agents
+        if len(resolved) > _RESOLUTION_CACHE_SIZE:
+            resolved.popitem(last=False)
+        return agents
+
+    def agents_for_pattern(self, channel: str, pattern: str) -> Tuple[BaseAgent, ...]:
+        """Resolve the agents that receive a channel via one subscription.
+
+        For backends that deliver a copy of a message per matching
+        subscription. An agent subscribed to several matching patterns is
+        assigned to the lexically smallest of them, so across all copies it
+        receives the message exactly once.
+
+        Args:
+            channel: Channel name
+            pattern: Subscription pattern the backend matched
+
+        Returns:
+            Agents to deliver this copy to; empty if every agent subscribed
+            to the pattern receives the message through another one
+        """
+        key = (channel, pattern)
+        resolved = self.resolved_by_pattern
+        agents = resolved.get(key)
+        if agents is not None:
+            resolved.move_to_end(key)
+            return agents
+
+        subscriptions = self.subscriptions
+        patterns = self.matching_patterns(channel)
+        if pattern not in patterns:
+            agents = ()
+        else:
+            earlier = [other for other in patterns if other < pattern]
+            if earlier:
+                claimed = frozenset().union(
+                    *(subscriptions[other] for other in earlier)
+                )
+                agents = tuple(
+                    agent for agent in subscriptions[pattern] if agent not in claimed
+                )
+            else:
+                agents = tuple(subscriptions[pattern])
+
+        resolved[key] = agents
+        if len(resolved) > _RESOLUTION_CACHE_SIZE:
+            resolved.popitem(last=False)
+        return agents
+
+    def matching_patterns(self, channel: str) -> List[str]:
+        """Find every subscribed pattern that matches a channel.
+
+        Literal patterns are found with a dictionary lookup and segment-aligned
+        wildcard patterns with a trie walk. Remaining wildcard patterns are
+        checked with one combined regex first; the group it reports is the
+        first matching pattern, so only later patterns need individual checks.
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            Matching subscription patterns
+        """
+        matches = [channel] if channel in self.subscriptions else []
+        # The trie only holds three-segment patterns, so stop splitting once
+        # a fourth segment shows the channel cannot match any of them
+        segments = channel.split(":", 3)
+        if len(segments) == 3:
+            matches.extend(self.trie.match(segments))
+
+        if self.combined_regex is not None:
+            match = self.combined_regex.fullmatch(channel)
+            if match is not None and match.lastindex is not None:
+                first = match.lastindex - 1
+                for index, (pattern, regex) in enumerate(self.regex_patterns):
+                    if index == first or (
+                        index > first and regex.fullmatch(channel) is not None
+                    ):
+                        matches.append(pattern)
+        return matches
 
 
 class AbstractRouter(ABC):
@@ -15,13 +402,49 @@ class AbstractRouter(ABC):
     (Redis, RabbitMQ, etc.) for message transport.
     """
 
-    def __init__(self) -> None:
-        """Initialize the router."""
+    def __init__(
+        self,
+        max_concurrent_deliveries: Optional[int] = None,
+        fire_and_forget: bool = False,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            max_concurrent_deliveries: Maximum number of agent handlers running
+                at once across all deliveries. None means unbounded.
+            fire_and_forget: If True, ``deliver_message`` schedules agent
+                handlers and returns without waiting for them, so the backend
+                can move on to the next message.
+        """
         self.logger = get_logger(self.__class__.__name__)
         self._subscriptions: Dict[str, Set[BaseAgent]] = {}
         self._agent_subscriptions: Dict[BaseAgent, Set[str]] = {}
         self._running = False
         self._lock = asyncio.Lock()
+        self._pending_publishes: Deque[Tuple[str, bytes]] = deque()
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        self._pattern_regex: Dict[str, "re.Pattern[str]"] = {}
+        self._state = _SubState()
+        self._message_class_index: Dict[str, Type[BaseMessage]] = {}
+        self._message_class_refs: Dict[str, int] = {}
+        # Whether the index changed since the last published snapshot
+        self._message_classes_changed = False
+        # (channel, data, patterns seen, snapshot) of the message whose
+        # per-pattern copies are being delivered
+        self._pattern_copies: Optional[
+            Tuple[str, bytes, Set[str], _SubState]
+        ] = None
+        # Last handle_message called per subscribed agent, and whether it is
+        # a coroutine function. Checked against the agent's current handler
+        # on every delivery, so instance overrides are picked up.
+        self._agent_handlers: Dict[BaseAgent, Tuple[Callable[..., Any], bool]] = {}
+        self._delivery_limit: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(max_concurrent_deliveries)
+            if max_concurrent_deliveries
+            else nullcontext()
+        )
+        self._fire_and_forget = fire_and_forget
+        self._delivery_tasks: Set[asyncio.Task[None]] = set()
 
     @abstractmethod
     async def connect(self) -> None:
@@ -61,6 +484,44 @@ class AbstractRouter(ABC):
         """
         pass
 
+    async def _publish_many_raw(self, messages: List[Tuple[str, bytes]]) -> None:
+        """Publish a batch of raw messages.
+
+        The default implementation publishes one message at a time. Backends
+        that can pipeline writes should override this.
+
+        Args:
+            messages: (channel, data) pairs to publish, in order
+        """
+        for channel, data in messages:
+            await self._publish_raw(channel, data)
+
+    async def _subscribe_many_raw(self, patterns: List[str]) -> None:
+        """Subscribe to several channel patterns in the backend.
+
+        The default implementation subscribes one pattern at a time. Backends
+        that can subscribe to many patterns in one round trip should
+        override this.
+
+        Args:
+            patterns: Channel patterns to subscribe to
+        """
+        for pattern in patterns:
+            await self._subscribe_raw(pattern)
+
+    async def _unsubscribe_many_raw(self, patterns: List[str]) -> None:
+        """Unsubscribe from several channel patterns in the backend.
+
+        The default implementation unsubscribes one pattern at a time.
+        Backends that can unsubscribe from many patterns in one round trip
+        should override this.
+
+        Args:
+            patterns: Channel patterns to unsubscribe from
+        """
+        for pattern in patterns:
+            await self._unsubscribe_raw(pattern)
+
     async def subscribe(self, agent: BaseAgent, pattern: str) -> None:
         """Subscribe an agent to a channel pattern.
 
@@ -70,19 +531,219 @@ class AbstractRouter(ABC):
         """
         async with self._lock:
             if pattern not in self._subscriptions:
-                self._subscriptions[pattern] = set()
                 await self._subscribe_raw(pattern)
 
-            self._subscriptions[pattern].add(agent)
-
-            if agent not in self._agent_subscriptions:
-                self._agent_subscriptions[agent] = set()
-            self._agent_subscriptions[agent].add(pattern)
+            self._add_subscription(agent, pattern)
+            self._publish_state((pattern,))
 
             self.logger.info(
                 f"Agent {agent.__class__.__name__} subscribed to {pattern}"
             )
 
+    def _add_subscription(self, agent: BaseAgent, pattern: str) -> None:
+        """Record that an agent is subscribed to a pattern.
+
+        Call ``_publish_state`` afterwards to make the change visible to
+        message delivery.
+
+        Args:
+            agent: Subscribed agent
+            pattern: Channel pattern the agent is subscribed to
+        """
+        agents = self._subscriptions.get(pattern)
+        if agents is None:
+            agents = self._subscriptions[pattern] = set()
+            if "*" in pattern and self._trie_segments(pattern) is None:
+                self._pattern_regex[pattern] = self._compile_pattern(pattern)
+        agents.add(agent)
+
+        agent_patterns = self._agent_subscriptions.get(agent)
+        if agent_patterns is None:
+            agent_patterns = self._agent_subscriptions[agent] = set()
+            handler = agent.handle_message
+            self._agent_handlers[agent] = (
+                handler,
+                asyncio.iscoroutinefunction(handler),
+            )
+            self._index_message_classes(agent)
+        agent_patterns.add(pattern)
+
+    def _index_message_classes(self, agent: BaseAgent) -> None:
+        """Register an agent's message classes for deserialization.
+
+        Args:
+            agent: Newly subscribed agent
+        """
+        for message_class in agent.messages:
+            name = message_class.__name__
+            refs = self._message_class_refs.get(name, 0)
+            if refs == 0:
+                self._message_class_index[name] = message_class
+                self._message_classes_changed = True
+            self._message_class_refs[name] = refs + 1
+
+    def _unindex_message_classes(self, agent: BaseAgent) -> None:
+        """Release an agent's message classes once it has no subscriptions.
+
+        Args:
+            agent: Agent that is no longer subscribed to anything
+        """
+        for message_class in agent.messages:
+            name = message_class.__name__
+            refs = self._message_class_refs.get(name, 0) - 1
+            if refs > 0:
+                self._message_class_refs[name] = refs
+            else:
+                self._message_class_refs.pop(name, None)
+                self._message_class_index.pop(name, None)
+                self._message_classes_changed = True
+
+    def _remove_pattern(self, pattern: str) -> None:
+        """Forget a pattern that no longer has any subscribed agents.
+
+        Args:
+            pattern: Channel pattern to remove
+        """
+        del self._subscriptions[pattern]
+        self._pattern_regex.pop(pattern, None)
+
+    def _clear_subscriptions(self) -> None:
+        """Forget all subscriptions and their compiled patterns."""
+        self._subscriptions.clear()
+        self._agent_subscriptions.clear()
+        self._agent_handlers.clear()
+        self._pattern_regex.clear()
+        self._message_class_index.clear()
+        self._message_class_refs.clear()
+        self._message_classes_changed = False
+        self._pattern_copies = None
+        self._state = _SubState()
+
+    def _publish_state(self, changed: Optional[Iterable[str]] = None) -> None:
+        """Swap in a new subscription snapshot reflecting the current index.
+
+        With ``changed``, only the entries for those patterns are rebuilt
+        and the rest of the previous snapshot is reused, so one subscribe
+        or unsubscribe stays cheap however many patterns exist. Without it
+        the snapshot is rebuilt from scratch, which batch operations do once
+        per batch. Snapshots are never mutated once published.
+
+        Args:
+            changed: Patterns whose subscribers changed since the last
+                snapshot, or None to rebuild everything
+        """
+        old = self._state
+        message_classes = (
+            MappingProxyType(dict(self._message_class_index))
+            if changed is None or self._message_classes_changed
+            else old.message_classes
+        )
+        self._message_classes_changed = False
+
+        if changed is None:
+            subscriptions = {
+                pattern: frozenset(agents)
+                for pattern, agents in self._subscriptions.items()
+            }
+            if old.subscriptions.keys() == subscriptions.keys():
+                trie = old.trie
+                regex_patterns = old.regex_patterns
+                combined_regex = old.combined_regex
+            else:
+                trie = _SubTrie()
+                for pattern in self._subscriptions:
+                    if "*" in pattern and pattern not in self._pattern_regex:
+                        trie.insert(pattern.split(":"), pattern)
+                regex_patterns, combined_regex = self._build_regex_patterns()
+        else:
+            subscriptions = dict(old.subscriptions)
+            trie = old.trie
+            regex_changed = False
+            for pattern in changed:
+                agents = self._subscriptions.get(pattern)
+                was_subscribed = pattern in subscriptions
+                if agents is not None:
+                    subscriptions[pattern] = frozenset(agents)
+                else:
+                    subscriptions.pop(pattern, None)
+                if (agents is not None) == was_subscribed or "*" not in pattern:
+                    continue
+                # The pattern was added or removed; update its matcher
+                segments = self._trie_segments(pattern)
+                if segments is None:
+                    regex_changed = True
+                    continue
+                trie = trie.copy_path(segments)
+                if agents is not None:
+                    trie.insert(segments, pattern)
+                else:
+                    trie.remove(segments)
+            if regex_changed:
+                regex_patterns, combined_regex = self._build_regex_patterns()
+            else:
+                regex_patterns = old.regex_patterns
+                combined_regex = old.combined_regex
+
+        self._state = _SubState(
+            subscriptions=MappingProxyType(subscriptions),
+            trie=trie,
+            regex_patterns=regex_patterns,
+            combined_regex=combined_regex,
+            message_classes=message_classes,
+        )
+
+    def _build_regex_patterns(
+        self,
+    ) -> Tuple[Tuple[Tuple[str, "re.Pattern[str]"], ...], Optional["re.Pattern[str]"]]:
+        """Collect the regex-matched patterns and their combined prefilter.
+
+        Returns:
+            (pattern, compiled regex) pairs, and their alternation or None
+            when there are none
+        """
+        regex_patterns = tuple(self._pattern_regex.items())
+        combined_regex = (
+            re.compile("|".join(f"({regex.pattern})" for _, regex in regex_patterns))
+            if regex_patterns
+            else None
+        )
+        return regex_patterns, combined_regex
+
+    @staticmethod
+    def _trie_segments(pattern: str) -> Optional[List[str]]:
+        """Split a pattern for the segment trie, if it can be stored there.
+
+        Patterns of exactly three segments, each either literal or ``*``,
+        behave the same under segment matching as under the ``*`` matches
+        anything rule, because delivered channels always have three
+        segments. Other wildcard patterns are matched by regex.
+
+        Args:
+            pattern: Subscription pattern
+
+        Returns:
+            The pattern's segments, or None if it needs regex matching
+        """
+        segments = pattern.split(":")
+        if len(segments) != 3:
+            return None
+        for segment in segments:
+            if "*" in segment and segment != "*":
+                return None
+        return segments
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+        """Compile a subscription pattern; * matches any run of characters.
+
+        Args:
+            pattern: Subscription pattern
+
+        Returns:
+            Compiled regex for full-string matching
+        """
+        return re.compile(".*".join(re.escape(piece) for piece in pattern.split("*")))
+
     async def unsubscribe(
         self, agent: BaseAgent, pattern: Optional[str] = None
     ) -> None:
@@ -98,27 +759,53 @@ class AbstractRouter(ABC):
             else:
                 patterns = list(self._agent_subscriptions.get(agent, []))
 
+            emptied = []
             for pat in patterns:
                 if pat in self._subscriptions and agent in self._subscriptions[pat]:
                     self._subscriptions[pat].remove(agent)
 
                     if not self._subscriptions[pat]:
-                        del self._subscriptions[pat]
-                        await self._unsubscribe_raw(pat)
+                        self._remove_pattern(pat)
+                        emptied.append(pat)
 
                 if agent in self._agent_subscriptions:
                     self._agent_subscriptions[agent].discard(pat)
 
+            if len(emptied) == 1:
+                await self._unsubscribe_raw(emptied[0])
+            elif emptied:
+                await self._unsubscribe_many_raw(emptied)
+
             if (
                 agent in self._agent_subscriptions
                 and not self._agent_subscriptions[agent]
             ):
                 del self._agent_subscriptions[agent]
+                self._agent_handlers.pop(agent, None)
+                self._unindex_message_classes(agent)
+
+            self._publish_state(patterns)
 
             self.logger.info(
                 f"Agent {agent.__class__.__name__} unsubscribed from {pattern or 'all patterns'}"
             )
 
+    async def reset_subscriptions(self) -> None:
+        """Unsubscribe every agent from every pattern without disconnecting.
+
+        Lets a long-lived router be reused by unrelated sets of agents.
+        """
+        async with self._lock:
+            patterns = list(self._subscriptions)
+            self._clear_subscriptions()
+
+            if len(patterns) == 1:
+                await self._unsubscribe_raw(patterns[0])
+            elif patterns:
+                await self._unsubscribe_many_raw(patterns)
+
+        self.logger.info(f"Reset {len(patterns)} subscription patterns")
+
     async def publish(self, message: BaseMessage, channel: str) -> None:
         """Publish a message to a specific channel.
 
@@ -129,10 +816,99 @@ class AbstractRouter(ABC):
         data = self._serialize_message(message)
         await self._publish_raw(channel, data)
 
-        self.logger.debug(f"Published {message.__class__.__name__} to {channel}")
+        self.logger.debug("Published %s to %s", message.__class__.__name__, channel)
+
+    async def publish_many(self, messages: Iterable[Tuple[BaseMessage, str]]) -> None:
+        """Publish several messages in one backend batch.
+
+        Args:
+            messages: (message, channel) pairs to publish, in order
+        """
+        batch = [
+            (channel, self._serialize_message(message)) for message, channel in messages
+        ]
+        if batch:
+            await self._publish_many_raw(batch)
+
+            self.logger.debug("Published batch of %d messages", len(batch))
+
+    def serialize(self, message: BaseMessage) -> bytes:
+        """Serialize a message to the router's wire format.
+
+        The result can be published any number of times with publish_raw or
+        publish_raw_many without serializing the message again.
+
+        Args:
+            message: Message to serialize
+
+        Returns:
+            Serialized message data
+        """
+        return self._serialize_message(message)
+
+    async def publish_raw(self, channel: str, data: bytes) -> None:
+        """Publish already-serialized message data to a channel.
+
+        Args:
+            channel: Channel name to publish to
+            data: Message data as returned by serialize()
+        """
+        await self._publish_raw(channel, data)
+
+    async def publish_raw_many(self, messages: Iterable[Tuple[str, bytes]]) -> None:
+        """Publish already-serialized message data in one backend batch.
+
+        Args:
+            messages: (channel, data) pairs to publish, in order, with data as
+                returned by serialize()
+        """
+        batch = list(messages)
+        if batch:
+            await self._publish_many_raw(batch)
+
+    def publish_nowait(self, message: BaseMessage, channel: str) -> None:
+        """Queue a message for publishing without waiting for the backend.
+
+        Messages queued within the same event loop iteration are written
+        together by a single background flush. Use ``flush()`` to wait until
+        everything queued so far has been sent.
+
+        Args:
+            message: Message to publish
+            channel: Channel name to publish to
+        """
+        self._pending_publishes.append((channel, self._serialize_message(message)))
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_pending()
+            )
+
+    async def _flush_pending(self) -> None:
+        """Drain queued publishes in batches until the queue is empty."""
+        try:
+            while self._pending_publishes:
+                batch = list(self._pending_publishes)
+                self._pending_publishes.clear()
+                try:
+                    await self._publish_many_raw(batch)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error publishing batch of {len(batch)} messages: {e}"
+                    )
+        finally:
+            self._flush_task = None
+
+    async def flush(self) -> None:
+        """Wait until all messages queued with publish_nowait have been sent."""
+        while self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
 
     async def broadcast(
-        self, message: BaseMessage, direction: str, session_id: str
+        self,
+        message: BaseMessage,
+        direction: str,
+        session_id: str,
+        channel_key: Optional[ChannelKey] = None,
     ) -> None:
         """Broadcast a message using its channel pattern.
 
@@ -140,12 +916,83 @@ class AbstractRouter(ABC):
             message: Message to broadcast
             direction: Direction for the channel pattern (e.g., 'request', 'response')
             session_id: Session ID for the channel pattern
+            channel_key: Optional pre-split (message_class, direction, session_id)
+                components. When given, the channel is joined from it directly
+                instead of calling the message's pattern function.
         """
-        pattern_func = message.get_channel_pattern()
-        channel = pattern_func(direction, session_id)
+        channel = self.broadcast_channel(message, direction, session_id, channel_key)
         await self.publish(message, channel)
 
-    async def deliver_message(self, channel: str, data: bytes) -> None:
+    @staticmethod
+    def broadcast_channel(
+        message: BaseMessage,
+        direction: str,
+        session_id: str,
+        channel_key: Optional[ChannelKey] = None,
+    ) -> str:
+        """Resolve the channel a broadcast should be published to.
+
+        Args:
+            message: Message being broadcast
+            direction: Direction for the channel pattern
+            session_id: Session ID for the channel pattern
+            channel_key: Optional pre-split channel components
+
+        Returns:
+            Channel name
+        """
+        if channel_key is not None:
+            return ":".join(channel_key)
+        return AbstractRouter.make_channel(type(message), direction, session_id)
+
+    @staticmethod
+    def make_channel(
+        message_class: Type[BaseMessage], direction: str, session_id: str
+    ) -> str:
+        """Build a channel name from a message class's channel pattern.
+
+        The class's pattern function is fetched once and reused. Classes
+        that set ``channel_prefix`` skip it: their prefix is built once per
+        direction and the session id appended.
+
+        Args:
+            message_class: Message class the channel is for
+            direction: Direction for the channel pattern
+            session_id: Session ID for the channel pattern
+
+        Returns:
+            Channel name
+        """
+        if getattr(message_class, "channel_prefix", None) is not None:
+            return _cached_channel_prefix(message_class, direction) + session_id
+        return _cached_pattern_func(message_class)(direction, session_id)
+
+    @staticmethod
+    def make_channels(
+        message_class: Type[BaseMessage], direction: str, session_ids: Iterable[str]
+    ) -> List[str]:
+        """Build the channel names for one message class across many sessions.
+
+        For fanning a message out with ``publish_many``. Each channel is
+        built as ``make_channel`` would build it.
+
+        Args:
+            message_class: Message class the channels are for
+            direction: Direction for the channel pattern
+            session_ids: Session IDs to build channels for
+
+        Returns:
+            Channel names, in session ID order
+        """
+        make_channel = AbstractRouter.make_channel
+        return [
+            make_channel(message_class, direction, session_id)
+            for session_id in session_ids
+        ]
+
+    async def deliver_message(
+        self, channel: str, data: bytes, pattern: Optional[str] = None
+    ) -> None:
         """Deliver a message to subscribed agents.
 
         Called by concrete implementations when messages are received.
@@ -153,23 +1000,81 @@ class AbstractRouter(ABC):
         Args:
             channel: Channel the message was received on
             data: Serialized message data
+            pattern: Subscription pattern the backend matched, for backends
+                that deliver one copy per matching subscription. Each agent
+                then gets the message from exactly one of the copies. If
+                None, the message goes to every matching agent.
         """
-        message = self._deserialize_message(data)
+        # One snapshot for the whole delivery; concurrent (un)subscribes
+        # publish a new one instead of mutating this.
+        state = self._state
+        if pattern is None:
+            agents = state.agents_for(channel)
+        else:
+            state = self._copy_state(channel, data, pattern, state)
+            agents = state.agents_for_pattern(channel, pattern)
+        if not agents:
+            return
+
+        message = self._deserialize_message(data, state)
         context = self._parse_channel_context(channel)
 
-        agents_to_notify: Set[BaseAgent] = set()
-
-        for pattern, agents in self._subscriptions.items():
-            if self._matches_pattern(channel, pattern):
-                agents_to_notify.update(agents)
+        targets = [
+            agent for agent in agents if agent.validate_incoming_message(message)
+        ]
+
+        if self._fire_and_forget:
+            loop = asyncio.get_running_loop()
+            for agent in targets:
+                task = loop.create_task(self._deliver_to_agent(agent, message, context))
+                # Keep a reference until done so the task is not collected
+                self._delivery_tasks.add(task)
+                task.add_done_callback(self._delivery_tasks.discard)
+        elif len(targets) == 1:
+            await self._deliver_to_agent(targets[0], message, context)
+        elif targets:
+            async with asyncio.TaskGroup() as group:
+                for agent in targets:
+                    group.create_task(self._deliver_to_agent(agent, message, context))
+
+    def _copy_state(
+        self, channel: str, data: bytes, pattern: str, state: _SubState
+    ) -> _SubState:
+        """Pick the snapshot to resolve one per-pattern copy of a message.
+
+        Backends send the copies of one message back to back. They are all
+        resolved against the snapshot taken for the first copy, so an agent
+        unsubscribing from one of its matching patterns between copies is
+        not handed the message again through another. A copy repeating a
+        pattern already seen, or one that snapshot does not know, starts a
+        new message.
 
-        tasks = []
-        for agent in agents_to_notify:
-            if agent.validate_incoming_message(message):
-                tasks.append(self._deliver_to_agent(agent, message, context))
+        Args:
+            channel: Channel the copy was received on
+            data: Serialized message data
+            pattern: Subscription pattern the copy was sent for
+            state: Current snapshot
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            Snapshot to resolve the copy against
+        """
+        copies = self._pattern_copies
+        if (
+            copies is not None
+            and copies[0] == channel
+            and pattern not in copies[2]
+            and pattern in copies[3].subscriptions
+            and copies[1] == data
+        ):
+            copies[2].add(pattern)
+            return copies[3]
+        self._pattern_copies = (channel, data, {pattern}, state)
+        return state
+
+    async def _wait_for_deliveries(self) -> None:
+        """Wait for handlers scheduled in fire-and-forget mode to finish."""
+        while self._delivery_tasks:
+            await asyncio.gather(*self._delivery_tasks, return_exceptions=True)
 
     async def _deliver_to_agent(
         self, agent: BaseAgent, message: BaseMessage, context: Dict[str, str]
@@ -181,14 +1086,29 @@ class AbstractRouter(ABC):
             message: Message to deliver
             context: Message context
         """
+        handler = agent.handle_message
+        cached = self._agent_handlers.get(agent)
+        if cached is not None and cached[0] == handler:
+            is_async = cached[1]
+        else:
+            # Replaced since it was cached, or unsubscribed mid-delivery
+            is_async = asyncio.iscoroutinefunction(handler)
+            if agent in self._agent_subscriptions:
+                self._agent_handlers[agent] = (handler, is_async)
+
         try:
-            if asyncio.iscoroutinefunction(agent.handle_message):
-                await agent.handle_message(message, context)
-            else:
-                agent.handle_message(message, context)
+            async with self._delivery_limit:
+                if is_async:
+                    # handle_message is declared sync on BaseAgent; async agents
+                    # override it with a coroutine function.
+                    await cast(Awaitable[None], handler(message, context))
+                else:
+                    handler(message, context)
 
             self.logger.debug(
-                f"Delivered {message.__class__.__name__} to {agent.__class__.__name__}"
+                "Delivered %s to %s",
+                message.__class__.__name__,
+                agent.__class__.__name__,
             )
         except Exception as e:
             self.logger.error(
@@ -204,57 +1124,60 @@ class AbstractRouter(ABC):
         Returns:
             Serialized message data
         """
-        import json
-
-        data = message.model_dump()
-        data["__type__"] = message.__class__.__name__
-        return json.dumps(data).encode("utf-8")
-
-    def _deserialize_message(self, data: bytes) -> BaseMessage:
+        # Splice the type tag into the model's own JSON instead of building
+        # an intermediate dict
+        body = message.model_dump_json().encode("utf-8")
+        prefix = _type_prefix(message.__class__.__name__)
+        if body == b"{}":
+            return prefix[:-1] + b"}"
+        return prefix + body[1:]
+
+    def _deserialize_message(
+        self, data: bytes, state: Optional[_SubState] = None
+    ) -> BaseMessage:
         """Deserialize message data.
 
         Args:
             data: Serialized message data
+            state: Subscription snapshot to resolve the message class from.
+                Defaults to the current one.
 
         Returns:
             Deserialized message
         """
-        import json
-
-        message_dict = json.loads(data)
+        message_dict = _loads(data)
 
         message_type = message_dict.get("__type__")
         if not message_type:
             raise ValueError("Message data missing __type__ field")
 
-        # Get all message types from subscribed agents
-        message_classes = {}
-        for agents in self._subscriptions.values():
-            for agent in agents:
-                for msg_class in agent.messages:
-                    message_classes[msg_class.__name__] = msg_class
+        if state is None:
+            state = self._state
+        message_class = state.message_classes.get(message_type)
+        if message_class is None:
+            message_class = self._find_message_class(message_type)
 
-        # Try to find the message class
-        if message_type in message_classes:
-            del message_dict["__type__"]
-            return message_classes[message_type](**message_dict)
+        del message_dict["__type__"]
+        return message_class(**message_dict)
 
-        # Fallback to checking BaseMessage subclasses
-        from agent_communication.base import BaseMessage
+    @staticmethod
+    def _find_message_class(message_type: str) -> Type[BaseMessage]:
+        """Find a BaseMessage subclass by name in the message registry.
 
-        def get_all_subclasses(cls: Type[BaseMessage]) -> List[Type[BaseMessage]]:
-            all_subclasses: List[Type[BaseMessage]] = []
-            for subclass in cls.__subclasses__():
-                all_subclasses.append(subclass)
-                all_subclasses.extend(get_all_subclasses(subclass))
-            return all_subclasses
+        Args:
+            message_type: Class name to look for
 
-        for subclass in get_all_subclasses(BaseMessage):  # type: ignore[type-abstract]
-            if subclass.__name__ == message_type:
-                del message_dict["__type__"]
-                return subclass(**message_dict)
+        Returns:
+            The message class
+
+        Raises:
+            MessageClassNotRegistered: If no subclass has that name
+        """
 
-        raise ValueError(f"Unknown message type: {message_type}")
+        message_class = _MESSAGE_REGISTRY.get(message_type)
+        if message_class is None:
+            raise MessageClassNotRegistered(message_type, sorted(_MESSAGE_REGISTRY))
+        return message_class
 
     def _parse_channel_context(self, channel: str) -> Dict[str, str]:
         """Parse channel name into context dictionary.
@@ -263,11 +1186,10 @@ class AbstractRouter(ABC):
             channel: Channel name
 
         Returns:
-            Context dictionary with channel components
+            Context dictionary with channel components. Each call returns a
+            new dict, so handlers may modify it.
         """
-        from agent_communication.utils import parse_channel
-
-        return parse_channel(channel)
+        return _cached_channel_context(channel).copy()
 
     def _matches_pattern(self, channel: str, pattern: str) -> bool:
         """Check if a channel matches a subscription pattern.
@@ -282,11 +1204,10 @@ class AbstractRouter(ABC):
         if "*" not in pattern:
             return channel == pattern
 
-        import re
-
-        regex_pattern = pattern.replace("*", ".*")
-        regex_pattern = f"^{regex_pattern}$"
-        return bool(re.match(regex_pattern, channel))
+        regex = self._pattern_regex.get(pattern)
+        if regex is None:
+            regex = self._compile_pattern(pattern)
+        return regex.fullmatch(channel) is not None
 
     async def start(self) -> None:
         """Start the router and connect to backend."""
@@ -300,10 +1221,17 @@ class AbstractRouter(ABC):
         if self._running:
             self._running = False
 
+            # Send anything still queued by publish_nowait
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error(f"Error flushing pending publishes: {e}")
+
+            await self._wait_for_deliveries()
+
             # Clear subscriptions
             async with self._lock:
-                self._subscriptions.clear()
-                self._agent_subscriptions.clear()
+                self._clear_subscriptions()
 
             # Disconnect from backend
             try:
@@ -319,7 +1247,38 @@ class AbstractRouter(ABC):
         Args:
             agent: Agent to auto-subscribe
         """
-        for message_class in agent.messages:
-            pattern_func = message_class.get_channel_pattern()
-            pattern = pattern_func("*", "*")
-            await self.subscribe(agent, pattern)
+        await self.auto_subscribe_agents([agent])
+
+    async def auto_subscribe_agents(self, agents: Iterable[BaseAgent]) -> None:
+        """Automatically subscribe several agents in one batch.
+
+        Patterns are collected across all agents first so that every new
+        backend subscription is made in a single ``_subscribe_many_raw`` call.
+
+        Args:
+            agents: Agents to auto-subscribe
+        """
+        agent_patterns = [(agent, agent.subscription_patterns()) for agent in agents]
+
+        async with self._lock:
+            new_patterns = list(
+                dict.fromkeys(
+                    pattern
+                    for _, patterns in agent_patterns
+                    for pattern in patterns
+                    if pattern not in self._subscriptions
+                )
+            )
+            if new_patterns:
+                await self._subscribe_many_raw(new_patterns)
+
+            for agent, patterns in agent_patterns:
+                for pattern in patterns:
+                    self._add_subscription(agent, pattern)
+            self._publish_state()
+
+            for agent, patterns in agent_patterns:
+                self.logger.info(
+                    f"Agent {agent.__class__.__name__} subscribed to "
+                    f"{', '.join(patterns)}"
+                )
@@ -1,7 +1,13 @@
 """RabbitMQ-based message router implementation."""
 
 import asyncio
-from typing import Optional, Dict, Any
+import os
+import socket
+import sys
+import uuid
+from functools import lru_cache
+from collections import deque
+from typing import Deque, Optional, Dict, Any, Iterable, List, Set, Tuple
 import aio_pika
 from aio_pika.abc import (
     AbstractRobustConnection,
@@ -10,8 +16,84 @@ from aio_pika.abc import (
     AbstractQueue,
     AbstractIncomingMessage,
 )
+from agent_communication.base import _MESSAGE_REGISTRY, BaseMessage
 from agent_communication.routers.base import AbstractRouter
 
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ZSTD = False
+
+# zstd level used for message bodies; favours speed over ratio
+_ZSTD_LEVEL = 3
+
+# Connections opened for routers created with share_connection=True, keyed
+# by event loop, URL and connection arguments. Each is opened once and kept
+# open across router start/stop cycles until close_shared_connections().
+_SHARED_CONNECTIONS: Dict[
+    Tuple[asyncio.AbstractEventLoop, str, str], "asyncio.Task[AbstractRobustConnection]"
+] = {}
+
+# Default queue names consumed by a router in this process. A router picks
+# the first free one, so concurrent routers never share a default queue.
+_CLAIMED_QUEUES: Set[str] = set()
+
+
+# Number of distinct channels whose routing keys are remembered
+_ROUTING_KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_ROUTING_KEY_CACHE_SIZE)
+def _to_routing_key(channel: str) -> str:
+    """Convert a channel name to its routing key once."""
+    return channel.replace(":", ".")
+
+
+@lru_cache(maxsize=_ROUTING_KEY_CACHE_SIZE)
+def _to_channel(routing_key: str) -> str:
+    """Convert a routing key back to its channel name once.
+
+    The result is interned, so the per-channel caches downstream in
+    delivery hash and compare one shared string per channel.
+    """
+    return sys.intern(routing_key.replace(".", ":"))
+
+
+def _is_persistent(message_class: type) -> bool:
+    """Check whether the broker should write a message class to disk.
+
+    Messages are persisted only when their class sets ``durable = True``,
+    which works for any message implementation, registered or not.
+
+    Args:
+        message_class: Class of the message being published
+
+    Returns:
+        True for durable message classes
+    """
+    return bool(getattr(message_class, "durable", False))
+
+
+def _delivery_mode(channel: str) -> aio_pika.DeliveryMode:
+    """Guess the AMQP delivery mode for a channel from its message class.
+
+    Only for raw publishes, which carry no message class: this assumes the
+    channel starts with the name of a registered BaseMessage subclass and
+    falls back to NOT_PERSISTENT otherwise.
+
+    Args:
+        channel: Channel being published to
+
+    Returns:
+        PERSISTENT for durable message classes, NOT_PERSISTENT otherwise
+    """
+    message_class = _MESSAGE_REGISTRY.get(channel.partition(":")[0])
+    if message_class is not None and message_class.durable:
+        return aio_pika.DeliveryMode.PERSISTENT
+    return aio_pika.DeliveryMode.NOT_PERSISTENT
+
 
 class RabbitMQRouter(AbstractRouter):
     """RabbitMQ AMQP-based message router.
@@ -19,6 +101,12 @@ class RabbitMQRouter(AbstractRouter):
     Uses RabbitMQ topic exchanges for flexible message routing with
     pattern matching. Provides durable queues and message acknowledgments
     for reliable message delivery.
+
+    Each router consumes from a single durable queue. Every subscribed
+    pattern is added to it as a binding, so the broker delivers a message
+    once per router however many patterns match, and the router fans it
+    out to agents in-process. The queue outlives a disconnect, so messages
+    published meanwhile are delivered once a router consumes it again.
     """
 
     def __init__(
@@ -30,6 +118,16 @@ class RabbitMQRouter(AbstractRouter):
         vhost: str = "/",
         exchange_name: str = "agent_communication",
         url: Optional[str] = None,
+        *,
+        max_concurrent_deliveries: Optional[int] = None,
+        fire_and_forget: bool = False,
+        prefetch_count: int = 256,
+        queue_name: Optional[str] = None,
+        exclusive_queue: bool = False,
+        compress_threshold: Optional[int] = None,
+        ack_batch_size: int = 1,
+        ack_batch_timeout: float = 0.05,
+        share_connection: bool = False,
         **amqp_kwargs: Any,
     ) -> None:
         """Initialize RabbitMQ router.
@@ -42,9 +140,40 @@ class RabbitMQRouter(AbstractRouter):
             vhost: RabbitMQ virtual host
             exchange_name: Name of the topic exchange to use
             url: AMQP URL (overrides host/port/username/password/vhost)
+            max_concurrent_deliveries: Maximum number of agent handlers running
+                at once. None means unbounded.
+            fire_and_forget: Acknowledge messages without waiting for agent
+                handlers to finish
+            prefetch_count: Maximum number of unacknowledged messages the
+                broker sends to this router at once
+            queue_name: Name of the durable queue this router consumes from.
+                Routers given the same name compete for its messages. Defaults
+                to a name unique to the exchange, host and process; routers
+                consuming at the same time in one process each get their own,
+                and a router started after another disconnected reuses its
+                queue and the messages waiting in it.
+            exclusive_queue: Consume from an exclusive, auto-deleted queue
+                with a random name instead. Nothing is kept for the router
+                while it is disconnected, and no queue is left behind if the
+                process dies. Cannot be combined with queue_name.
+            compress_threshold: Compress message bodies larger than this many
+                bytes with zstd. None disables compression. Requires the
+                zstandard package; consumers decompress automatically.
+            ack_batch_size: Acknowledge processed messages with one
+                ``multiple`` ack per this many messages instead of one ack
+                each. 1 (the default) acks every message individually.
+            ack_batch_timeout: Seconds a partial ack batch may wait before it
+                is sent anyway. Only used when ack_batch_size is above 1.
+            share_connection: Multiplex this router's channel over one AMQP
+                connection shared with other routers for the same URL, instead
+                of opening its own. The connection stays open when the router
+                stops; close it with close_shared_connections().
             **amqp_kwargs: Additional AMQP connection arguments
         """
-        super().__init__()
+        super().__init__(
+            max_concurrent_deliveries=max_concurrent_deliveries,
+            fire_and_forget=fire_and_forget,
+        )
 
         if url:
             self._amqp_url = url
@@ -53,26 +182,59 @@ class RabbitMQRouter(AbstractRouter):
 
         self._exchange_name = exchange_name
         self._amqp_kwargs = amqp_kwargs
+        self._share_connection = share_connection
+        self._prefetch_count = prefetch_count
         self._connection: Optional[AbstractRobustConnection] = None
         self._channel: Optional[AbstractChannel] = None
         self._exchange: Optional[AbstractExchange] = None
+        if queue_name is not None and exclusive_queue:
+            raise ValueError("queue_name cannot be combined with exclusive_queue")
+        self._exclusive_queue = exclusive_queue
+        if exclusive_queue:
+            queue_name = f"agent_communication.{exchange_name}.{uuid.uuid4().hex}"
+        # None until the router first consumes and claims a default name
+        self._queue_name = queue_name
+        self._claimed_queue: Optional[str] = None
+
+        if compress_threshold is not None and not _HAS_ZSTD:
+            raise ImportError("compress_threshold requires the zstandard package")
+        self._compress_threshold = compress_threshold
+        self._compressor: Any = None
+        self._decompressor: Any = None
+        self._queue: Optional[AbstractQueue] = None
+        # Persistence of each publish_nowait message, parallel to the
+        # pending publishes queue
+        self._pending_persistent: Deque[bool] = deque()
+        self._consumer_tag: Optional[str] = None
+        # Bound patterns; all of them share self._queue
         self._queues: Dict[str, AbstractQueue] = {}
-        self._consumers: Dict[str, Any] = {}
 
-        # Track delivered messages to avoid duplicates from multiple bindings
-        self._delivered_messages: Dict[tuple[str, bytes], float] = {}
-        self._cleanup_task: Optional[asyncio.Task[None]] = None
+        # Batched acknowledgements. Deliveries settle out of order, so only
+        # the contiguous run of settled delivery tags is ever acked, through
+        # the newest successful message in it. Tags restart on each channel.
+        self._ack_batch_size = ack_batch_size
+        self._ack_batch_timeout = ack_batch_timeout
+        self._ack_channel: Any = None
+        self._ack_next_tag = 1
+        self._ack_settled: Dict[int, Optional[AbstractIncomingMessage]] = {}
+        self._ack_last: Optional[AbstractIncomingMessage] = None
+        self._ack_pending = 0
+        self._ack_timer: Optional[asyncio.TimerHandle] = None
+        self._ack_flush_task: Optional["asyncio.Task[None]"] = None
 
     async def connect(self) -> None:
         """Connect to RabbitMQ server."""
         try:
-            self._connection = await aio_pika.connect_robust(
-                self._amqp_url, **self._amqp_kwargs
-            )
+            if self._share_connection:
+                self._connection = await self._shared_connection()
+            else:
+                self._connection = await aio_pika.connect_robust(
+                    self._amqp_url, **self._amqp_kwargs
+                )
 
             self._channel = await self._connection.channel()
 
-            await self._channel.set_qos(prefetch_count=10)
+            await self._channel.set_qos(prefetch_count=self._prefetch_count)
 
             self._exchange = await self._channel.declare_exchange(
                 self._exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
@@ -84,55 +246,167 @@ class RabbitMQRouter(AbstractRouter):
             self.logger.error(f"Failed to connect to RabbitMQ: {e}")
             raise
 
+    async def _shared_connection(self) -> AbstractRobustConnection:
+        """Get the shared connection for this router's URL, opening it once.
+
+        Returns:
+            Open robust connection
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            loop,
+            self._amqp_url,
+            repr(sorted(self._amqp_kwargs.items())),
+        )
+        task = _SHARED_CONNECTIONS.get(key)
+        if task is None or (
+            task.done()
+            and (task.cancelled() or task.exception() or task.result().is_closed)
+        ):
+            # Routers starting together wait on the same connect
+            task = loop.create_task(
+                aio_pika.connect_robust(self._amqp_url, **self._amqp_kwargs)
+            )
+            _SHARED_CONNECTIONS[key] = task
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if _SHARED_CONNECTIONS.get(key) is task:
+                del _SHARED_CONNECTIONS[key]
+            raise
+
+    @classmethod
+    async def close_shared_connections(cls) -> None:
+        """Close the shared connections opened on the running event loop."""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in _SHARED_CONNECTIONS if key[0] is loop]:
+            task = _SHARED_CONNECTIONS.pop(key)
+            try:
+                connection = await task
+            except Exception:
+                continue
+            if not connection.is_closed:
+                await connection.close()
+
     async def disconnect(self) -> None:
         """Disconnect from RabbitMQ server without deleting queues.
 
-        This preserves queues and messages for reconnection.
-        Use stop() to fully clean up including queue deletion.
+        This preserves queues and messages for reconnection, except with
+        ``exclusive_queue``, whose queue the broker removes with the
+        connection. Use stop() to fully clean up including queue deletion.
         """
         try:
-            # Cancel consumers but don't delete queues
-            for pattern, consumer_tag in list(self._consumers.items()):
+            await self._flush_acks()
+
+            # Cancel the consumer but don't delete the queue
+            if self._queue is not None and self._consumer_tag is not None:
                 try:
-                    if pattern in self._queues:
-                        await self._queues[pattern].cancel(consumer_tag)
+                    await self._queue.cancel(self._consumer_tag)
                 except Exception as e:
-                    self.logger.debug(f"Error canceling consumer for {pattern}: {e}")
+                    self.logger.debug("Error canceling consumer: %s", e)
 
             # Close the channel
             if self._channel and not self._channel.is_closed:
                 try:
                     await self._channel.close()
                 except Exception as e:
-                    self.logger.debug(f"Error closing channel: {e}")
-
-            # Close the connection
-            if self._connection and not self._connection.is_closed:
+                    self.logger.debug("Error closing channel: %s", e)
+
+            # Close the connection, unless other routers share it
+            if (
+                self._connection
+                and not self._share_connection
+                and not self._connection.is_closed
+            ):
                 try:
                     await self._connection.close()
-                    # Give connection time to close gracefully
-                    await asyncio.sleep(0.1)
                 except Exception as e:
-                    self.logger.debug(f"Error closing connection: {e}")
+                    self.logger.debug("Error closing connection: %s", e)
 
             # Clear references but keep queue info for reconnection
             self._channel = None
             self._connection = None
             self._exchange = None
+            self._queue = None
+            self._consumer_tag = None
             self._queues.clear()
-            self._consumers.clear()
 
             self.logger.info("Disconnected from RabbitMQ (queues preserved)")
 
         except Exception as e:
             self.logger.error(f"Error disconnecting from RabbitMQ: {e}")
+        finally:
+            # The default queue name is free for the next router to claim
+            if self._claimed_queue is not None:
+                _CLAIMED_QUEUES.discard(self._claimed_queue)
+                self._claimed_queue = None
 
-    async def _publish_raw(self, channel: str, data: bytes) -> None:
+    async def publish(self, message: BaseMessage, channel: str) -> None:
+        """Publish a message, persisted if its class is durable.
+
+        Args:
+            message: Message to publish
+            channel: Channel name to publish to
+        """
+        data = self._serialize_message(message)
+        await self._publish_raw(channel, data, _is_persistent(type(message)))
+
+        self.logger.debug("Published %s to %s", message.__class__.__name__, channel)
+
+    async def publish_many(self, messages: Iterable[Tuple[BaseMessage, str]]) -> None:
+        """Publish several messages in one batch, each persisted if durable.
+
+        Args:
+            messages: (message, channel) pairs to publish, in order
+        """
+        batch: List[Tuple[str, bytes]] = []
+        persistent: List[bool] = []
+        for message, channel in messages:
+            batch.append((channel, self._serialize_message(message)))
+            persistent.append(_is_persistent(type(message)))
+        if batch:
+            await self._publish_many_raw(batch, persistent)
+
+            self.logger.debug("Published batch of %d messages", len(batch))
+
+    def publish_nowait(self, message: BaseMessage, channel: str) -> None:
+        """Queue a message for publishing, persisted if its class is durable.
+
+        Args:
+            message: Message to publish
+            channel: Channel name to publish to
+        """
+        self._pending_persistent.append(_is_persistent(type(message)))
+        super().publish_nowait(message, channel)
+
+    async def _flush_pending(self) -> None:
+        """Drain queued publishes in batches, keeping each one's persistence."""
+        try:
+            while self._pending_publishes:
+                batch = list(self._pending_publishes)
+                persistent = list(self._pending_persistent)
+                self._pending_publishes.clear()
+                self._pending_persistent.clear()
+                try:
+                    await self._publish_many_raw(batch, persistent)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error publishing batch of {len(batch)} messages: {e}"
+                    )
+        finally:
+            self._flush_task = None
+
+    async def _publish_raw(
+        self, channel: str, data: bytes, persistent: Optional[bool] = None
+    ) -> None:
         """Publish raw message data to a RabbitMQ routing key.
 
         Args:
             channel: Routing key to publish to
             data: Serialized message data
+            persistent: Whether the broker should write the message to disk.
+                None guesses it from the channel (see _delivery_mode).
         """
         if not self._exchange:
             raise RuntimeError("Router not connected")
@@ -140,22 +414,161 @@ class RabbitMQRouter(AbstractRouter):
         try:
             routing_key = self._channel_to_routing_key(channel)
 
-            message = aio_pika.Message(
-                body=data,
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                content_type="application/json",
-            )
+            message = self._build_message(channel, data, persistent)
 
             await self._exchange.publish(message, routing_key=routing_key)
 
             self.logger.debug(
-                f"Published message to RabbitMQ routing key: {routing_key}"
+                "Published message to RabbitMQ routing key: %s", routing_key
             )
 
         except Exception as e:
             self.logger.error(f"Error publishing to RabbitMQ: {e}")
             raise
 
+    def _build_message(
+        self, channel: str, data: bytes, persistent: Optional[bool] = None
+    ) -> aio_pika.Message:
+        """Wrap a serialized body in an AMQP message.
+
+        Args:
+            channel: Channel the message is published to
+            data: Serialized message data
+            persistent: Whether the broker should write the message to disk.
+                None guesses it from the channel (see _delivery_mode).
+
+        Returns:
+            AMQP message, zstd-compressed if the body exceeds the threshold
+        """
+        if persistent is None:
+            delivery_mode = _delivery_mode(channel)
+        elif persistent:
+            delivery_mode = aio_pika.DeliveryMode.PERSISTENT
+        else:
+            delivery_mode = aio_pika.DeliveryMode.NOT_PERSISTENT
+
+        content_encoding = None
+        threshold = self._compress_threshold
+        if threshold is not None and len(data) > threshold:
+            if self._compressor is None:
+                self._compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+            data = self._compressor.compress(data)
+            content_encoding = "zstd"
+
+        return aio_pika.Message(
+            body=data,
+            delivery_mode=delivery_mode,
+            content_type="application/json",
+            content_encoding=content_encoding,
+        )
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Decompress a zstd-encoded message body.
+
+        Args:
+            data: Compressed body
+
+        Returns:
+            Original serialized message data
+
+        Raises:
+            RuntimeError: If the zstandard package is not installed
+        """
+        if not _HAS_ZSTD:
+            raise RuntimeError(
+                "Received a zstd-compressed message but zstandard is not installed"
+            )
+        if self._decompressor is None:
+            self._decompressor = zstandard.ZstdDecompressor()
+        body: bytes = self._decompressor.decompress(data)
+        return body
+
+    async def _publish_many_raw(
+        self,
+        messages: List[Tuple[str, bytes]],
+        persistent: Optional[List[bool]] = None,
+    ) -> None:
+        """Publish a batch of messages, waiting for broker confirms once.
+
+        All publishes are written to the channel before any confirm is
+        awaited, so the batch costs roughly one round trip instead of one
+        per message.
+
+        Args:
+            messages: (channel, data) pairs to publish, in order
+            persistent: Per-message persistence, parallel to messages. None
+                guesses each one from its channel (see _delivery_mode).
+        """
+        if not self._exchange:
+            raise RuntimeError("Router not connected")
+
+        exchange = self._exchange
+        routing_key = self._channel_to_routing_key
+        flags: Iterable[Optional[bool]] = (
+            persistent if persistent is not None else [None] * len(messages)
+        )
+        try:
+            await asyncio.gather(
+                *(
+                    exchange.publish(
+                        self._build_message(channel, data, flag),
+                        routing_key=routing_key(channel),
+                    )
+                    for (channel, data), flag in zip(messages, flags)
+                )
+            )
+
+            self.logger.debug("Published %d messages to RabbitMQ", len(messages))
+
+        except Exception as e:
+            self.logger.error(f"Error publishing batch to RabbitMQ: {e}")
+            raise
+
+    async def _ensure_queue(self) -> AbstractQueue:
+        """Declare this router's queue and start consuming from it, once.
+
+        Returns:
+            The router's queue
+        """
+        if self._queue is None:
+            if not self._channel:
+                raise RuntimeError("Router not connected")
+
+            if self._exclusive_queue:
+                queue = await self._channel.declare_queue(
+                    self._queue_name, exclusive=True, auto_delete=True
+                )
+            else:
+                # Durable and not auto-delete so queued messages survive a
+                # reconnect
+                queue = await self._channel.declare_queue(
+                    self._queue_name or self._claim_default_queue(),
+                    durable=True,
+                    auto_delete=False,
+                )
+            self._consumer_tag = await queue.consume(
+                self._message_callback, no_ack=False
+            )
+            self._queue = queue
+        return self._queue
+
+    def _claim_default_queue(self) -> str:
+        """Claim the first default queue name no live router here consumes.
+
+        Returns:
+            Queue name, released again on disconnect
+        """
+        host = socket.gethostname()
+        base = f"agent_communication.{self._exchange_name}.{host}.{os.getpid()}"
+        name = base
+        slot = 0
+        while name in _CLAIMED_QUEUES:
+            slot += 1
+            name = f"{base}.{slot}"
+        _CLAIMED_QUEUES.add(name)
+        self._claimed_queue = name
+        return name
+
     async def _subscribe_raw(self, pattern: str) -> None:
         """Subscribe to a channel pattern in RabbitMQ.
 
@@ -169,17 +582,7 @@ class RabbitMQRouter(AbstractRouter):
             return
 
         try:
-            # Use a deterministic queue name based on the pattern
-            # This allows reconnection to the same queue for persistence
-            import hashlib
-
-            pattern_hash = hashlib.md5(pattern.encode()).hexdigest()[:8]
-            queue_name = f"agent_communication.{pattern.replace(':', '.').replace('*', 'star')}.{pattern_hash}"
-
-            # All queues are durable but not auto-delete for persistence
-            queue = await self._channel.declare_queue(
-                queue_name, durable=True, auto_delete=False
-            )
+            queue = await self._ensure_queue()
 
             routing_pattern = self._channel_to_routing_key(pattern)
             routing_pattern = routing_pattern.replace("*", "#")
@@ -188,76 +591,167 @@ class RabbitMQRouter(AbstractRouter):
 
             self._queues[pattern] = queue
 
-            consumer = await queue.consume(self._message_callback, no_ack=False)
-            self._consumers[pattern] = consumer
-
-            self.logger.debug(f"Subscribed to RabbitMQ pattern: {routing_pattern}")
+            self.logger.debug("Subscribed to RabbitMQ pattern: %s", routing_pattern)
 
         except Exception as e:
             self.logger.error(f"Error subscribing to RabbitMQ: {e}")
             raise
 
+    async def _subscribe_many_raw(self, patterns: List[str]) -> None:
+        """Bind several channel patterns to the router's queue concurrently.
+
+        Args:
+            patterns: Channel patterns to subscribe to
+        """
+        if not self._channel or not self._exchange:
+            raise RuntimeError("Router not connected")
+
+        await self._ensure_queue()
+        await asyncio.gather(*(self._subscribe_raw(pattern) for pattern in patterns))
+
     async def _unsubscribe_raw(self, pattern: str) -> None:
         """Unsubscribe from a channel pattern in RabbitMQ.
 
         Args:
             pattern: Channel pattern to unsubscribe from
         """
-        if pattern not in self._queues:
+        queue = self._queues.pop(pattern, None)
+        if queue is None or not self._exchange:
             return
 
         try:
-            if pattern in self._consumers:
-                await self._queues[pattern].cancel(self._consumers[pattern])
-                del self._consumers[pattern]
+            routing_pattern = self._channel_to_routing_key(pattern)
+            routing_pattern = routing_pattern.replace("*", "#")
 
-            if pattern in self._queues:
-                await self._queues[pattern].delete(if_unused=True, if_empty=True)
-                del self._queues[pattern]
+            await queue.unbind(self._exchange, routing_key=routing_pattern)
 
-            self.logger.debug(f"Unsubscribed from RabbitMQ pattern: {pattern}")
+            self.logger.debug("Unsubscribed from RabbitMQ pattern: %s", pattern)
 
         except Exception as e:
             self.logger.error(f"Error unsubscribing from RabbitMQ: {e}")
 
+    async def _unsubscribe_many_raw(self, patterns: List[str]) -> None:
+        """Unbind several channel patterns from the router's queue concurrently.
+
+        Args:
+            patterns: Channel patterns to unsubscribe from
+        """
+        await asyncio.gather(*(self._unsubscribe_raw(pattern) for pattern in patterns))
+
     async def _message_callback(self, message: AbstractIncomingMessage) -> None:
         """Handle incoming messages from RabbitMQ.
 
         Args:
             message: Incoming AMQP message
         """
+        if self._ack_batch_size > 1:
+            await self._batched_message_callback(message)
+            return
+
         try:
             async with message.process():
-                routing_key = message.routing_key or ""
-                channel = self._routing_key_to_channel(routing_key)
-                data = message.body
-
-                # Check for duplicate messages from multiple bindings
-                message_key = (channel, data)
-                current_time = asyncio.get_event_loop().time()
-
-                # Clean up old entries (older than 5 seconds)
-                self._delivered_messages = {
-                    k: v
-                    for k, v in self._delivered_messages.items()
-                    if current_time - v < 5.0
-                }
-
-                if message_key in self._delivered_messages:
-                    self.logger.debug(
-                        f"Skipping duplicate message on channel {channel}"
-                    )
-                    return
+                await self._handle_delivery(message)
 
-                self._delivered_messages[message_key] = current_time
-
-                self.logger.debug(f"Received message from RabbitMQ: {channel}")
+        except Exception as e:
+            self.logger.error(f"Error processing RabbitMQ message: {e}")
+            await message.nack(requeue=True)
 
-                await self.deliver_message(channel, data)
+    async def _batched_message_callback(
+        self, message: AbstractIncomingMessage
+    ) -> None:
+        """Handle an incoming message, deferring its ack to a batch.
 
+        Args:
+            message: Incoming AMQP message
+        """
+        try:
+            await self._handle_delivery(message)
         except Exception as e:
             self.logger.error(f"Error processing RabbitMQ message: {e}")
+            # Send the acks that precede it before requeueing this one
+            await self._flush_acks()
             await message.nack(requeue=True)
+            await self._settle(message, None)
+            return
+
+        await self._settle(message, message)
+
+    async def _handle_delivery(self, message: AbstractIncomingMessage) -> None:
+        """Decode an AMQP message and deliver it to subscribed agents.
+
+        Args:
+            message: Incoming AMQP message
+        """
+        routing_key = message.routing_key or ""
+        channel = self._routing_key_to_channel(routing_key)
+
+        self.logger.debug("Received message from RabbitMQ: %s", channel)
+
+        data = message.body
+        if message.content_encoding == "zstd":
+            data = self._decompress(data)
+
+        await self.deliver_message(channel, data)
+
+    async def _settle(
+        self,
+        message: AbstractIncomingMessage,
+        ackable: Optional[AbstractIncomingMessage],
+    ) -> None:
+        """Record a finished delivery and ack the batch once it is full.
+
+        Args:
+            message: Message whose processing finished
+            ackable: The message if it should be acked, None if it was
+                already nacked
+        """
+        if message.channel is not self._ack_channel:
+            # New or reopened channel: the broker requeued everything
+            # unacked on the old one and delivery tags restart from 1
+            self._ack_channel = message.channel
+            self._ack_next_tag = 1
+            self._ack_settled.clear()
+            self._ack_last = None
+            self._ack_pending = 0
+
+        self._ack_settled[message.delivery_tag or 0] = ackable
+        while self._ack_next_tag in self._ack_settled:
+            settled = self._ack_settled.pop(self._ack_next_tag)
+            self._ack_next_tag += 1
+            if settled is not None:
+                self._ack_last = settled
+                self._ack_pending += 1
+
+        if self._ack_pending >= self._ack_batch_size:
+            await self._flush_acks()
+        elif self._ack_pending and self._ack_timer is None:
+            self._ack_timer = asyncio.get_running_loop().call_later(
+                self._ack_batch_timeout, self._start_ack_flush
+            )
+
+    def _start_ack_flush(self) -> None:
+        """Send a partial ack batch whose timeout expired."""
+        self._ack_timer = None
+        self._ack_flush_task = asyncio.get_running_loop().create_task(
+            self._flush_acks()
+        )
+
+    async def _flush_acks(self) -> None:
+        """Ack every settled message up to the newest successful one."""
+        if self._ack_timer is not None:
+            self._ack_timer.cancel()
+            self._ack_timer = None
+
+        last = self._ack_last
+        if last is None:
+            return
+        self._ack_last = None
+        self._ack_pending = 0
+
+        try:
+            await last.ack(multiple=True)
+        except Exception as e:
+            self.logger.error(f"Error acknowledging RabbitMQ messages: {e}")
 
     def _channel_to_routing_key(self, channel: str) -> str:
         """Convert channel name to RabbitMQ routing key.
@@ -268,7 +762,7 @@ class RabbitMQRouter(AbstractRouter):
         Returns:
             RabbitMQ routing key
         """
-        return channel.replace(":", ".")
+        return _to_routing_key(channel)
 
     def _routing_key_to_channel(self, routing_key: str) -> str:
         """Convert RabbitMQ routing key to channel name.
@@ -279,24 +773,38 @@ class RabbitMQRouter(AbstractRouter):
         Returns:
             Channel name
         """
-        return routing_key.replace(".", ":")
+        return _to_channel(routing_key)
 
     async def stop(self) -> None:
         """Stop the router and fully clean up including queue deletion."""
         if self._running:
             self._running = False
 
-            # Delete all queues before disconnecting
-            for pattern in list(self._queues.keys()):
+            # Send anything still queued by publish_nowait
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error(f"Error flushing pending publishes: {e}")
+
+            await self._wait_for_deliveries()
+            await self._flush_acks()
+
+            # Delete the queue before disconnecting. Its bindings go with it;
+            # a queue still holding messages is kept.
+            if self._queue is not None:
                 try:
-                    await self._unsubscribe_raw(pattern)
+                    if self._consumer_tag is not None:
+                        await self._queue.cancel(self._consumer_tag)
+                        self._consumer_tag = None
+                    await self._queue.delete(if_unused=True, if_empty=True)
                 except Exception as e:
-                    self.logger.debug(f"Error unsubscribing {pattern}: {e}")
+                    self.logger.debug("Error deleting queue: %s", e)
+                self._queue = None
+                self._queues.clear()
 
             # Clear subscriptions
             async with self._lock:
-                self._subscriptions.clear()
-                self._agent_subscriptions.clear()
+                self._clear_subscriptions()
 
             # Disconnect from backend
             try:
@@ -321,10 +829,13 @@ class RabbitMQRouter(AbstractRouter):
             return False
 
     async def purge_queue(self, pattern: str) -> int:
-        """Purge all messages from a queue.
+        """Purge all messages from the router's queue.
+
+        The queue is shared by every subscribed pattern, so this drops
+        waiting messages for all of them.
 
         Args:
-            pattern: Pattern identifying the queue
+            pattern: A pattern this router is subscribed to
 
         Returns:
             Number of messages purged
@@ -1,11 +1,66 @@
 """Redis-based message router implementation."""
 
 import asyncio
-from typing import Optional, Dict, Any
+import logging
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Optional, Any, Dict, List, Tuple
+import redis as sync_redis
 import redis.asyncio as redis
 from redis.asyncio.client import PubSub
+from redis.client import PubSub as SyncPubSub
 from agent_communication.routers.base import AbstractRouter
 
+# Characters that make a subscription a Redis glob pattern (PSUBSCRIBE)
+_WILD = re.compile(r"[*?\[]")
+
+# Pubsub message types confirming a channel or pattern subscription
+_SUBSCRIBE_ACKS = frozenset({"subscribe", "psubscribe"})
+
+# Bounds for the delay between attempts to re-read after a connection error
+_RECONNECT_MIN_DELAY = 0.1
+_RECONNECT_MAX_DELAY = 5.0
+
+# Number of distinct channel and pattern names kept decoded or encoded
+_NAME_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _decode_name(raw: bytes) -> str:
+    """Decode a channel or pattern name once and intern it.
+
+    Repeat messages on a channel reuse the same str, whose hash is already
+    computed for the router's per-channel caches.
+
+    Args:
+        raw: Name as received from Redis
+
+    Returns:
+        Decoded, interned name
+    """
+    return sys.intern(raw.decode("utf-8"))
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _encode_name(name: str) -> bytes:
+    """Encode a channel name once for publishing.
+
+    redis-py sends bytes arguments as-is instead of encoding them per call.
+
+    Args:
+        name: Channel name
+
+    Returns:
+        UTF-8 encoded name
+    """
+    return name.encode("utf-8")
+
+
+# How long the listener thread blocks on a read before checking for shutdown
+_THREAD_READ_TIMEOUT = 1.0
+
 
 class RedisRouter(AbstractRouter):
     """Redis Pub/Sub based message router.
@@ -21,6 +76,11 @@ class RedisRouter(AbstractRouter):
         db: int = 0,
         password: Optional[str] = None,
         url: Optional[str] = None,
+        *,
+        max_concurrent_deliveries: Optional[int] = None,
+        fire_and_forget: bool = False,
+        threaded_listener: bool = False,
+        max_publish_connections: Optional[int] = None,
         **redis_kwargs: Any,
     ) -> None:
         """Initialize Redis router.
@@ -31,9 +91,22 @@ class RedisRouter(AbstractRouter):
             db: Redis database number
             password: Redis password (if required)
             url: Redis URL (overrides host/port/db/password)
+            max_concurrent_deliveries: Maximum number of agent handlers running
+                at once. None means unbounded.
+            fire_and_forget: Return to the listener without waiting for agent
+                handlers to finish
+            threaded_listener: Read and parse pubsub traffic on a dedicated
+                thread with a synchronous client, handing each message back
+                to the event loop for delivery
+            max_publish_connections: Size of the connection pool used for
+                publishing. Publishes wait for a free connection once it is
+                exhausted. None means unbounded.
             **redis_kwargs: Additional Redis client arguments
         """
-        super().__init__()
+        super().__init__(
+            max_concurrent_deliveries=max_concurrent_deliveries,
+            fire_and_forget=fire_and_forget,
+        )
 
         if url:
             self._redis_url = url
@@ -43,23 +116,65 @@ class RedisRouter(AbstractRouter):
                 self._redis_url = f"redis://:{password}@{host}:{port}/{db}"
 
         self._redis_kwargs = redis_kwargs
+        self._max_publish_connections = max_publish_connections
+        # Publishes and pubsub use separate clients so a subscribed
+        # connection never competes with the publish pool
         self._redis: Optional[redis.Redis[bytes]] = None
+        self._publish_pool: Optional[redis.ConnectionPool] = None
+        self._sub_redis: Optional[redis.Redis] = None
         self._pubsub: Optional[PubSub] = None
         self._listener_task: Optional[asyncio.Task[None]] = None
-        self._subscribed_patterns: set[str] = set()
+        # Subscribed pattern -> whether it was PSUBSCRIBEd, so unsubscribing
+        # always uses the matching command
+        self._subscribed_patterns: Dict[str, bool] = {}
+        # Set once the pubsub connection exists, i.e. after the first
+        # subscribe; the listener blocks on it before reading
+        self._has_subscriptions = asyncio.Event()
+        # Subscriptions sent but not yet confirmed by Redis; the event is set
+        # whenever none are outstanding
+        self._pending_subscribe_acks = 0
+        self._subscriptions_acked = asyncio.Event()
+        self._subscriptions_acked.set()
+
+        self._threaded_listener = threaded_listener
+        self._sync_redis: Optional[sync_redis.Redis] = None
+        self._sync_pubsub: Optional[SyncPubSub] = None
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stop_listener = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def connect(self) -> None:
         """Connect to Redis server."""
         try:
-            self._redis = await redis.from_url(
-                self._redis_url, decode_responses=False, **self._redis_kwargs
-            )
+            if self._max_publish_connections is None:
+                self._publish_pool = redis.ConnectionPool.from_url(
+                    self._redis_url, decode_responses=False, **self._redis_kwargs
+                )
+            else:
+                self._publish_pool = redis.BlockingConnectionPool.from_url(
+                    self._redis_url,
+                    decode_responses=False,
+                    max_connections=self._max_publish_connections,
+                    **self._redis_kwargs,
+                )
+            self._redis = redis.Redis(connection_pool=self._publish_pool)
 
             await self._redis.ping()
 
-            self._pubsub = self._redis.pubsub()
-
-            self._listener_task = asyncio.create_task(self._message_listener())
+            if self._threaded_listener:
+                self._start_listener_thread()
+            else:
+                # A one-connection pool: the pubsub connection is its only user
+                self._sub_redis = redis.Redis(
+                    connection_pool=redis.ConnectionPool.from_url(
+                        self._redis_url,
+                        decode_responses=False,
+                        max_connections=1,
+                        **self._redis_kwargs,
+                    )
+                )
+                self._pubsub = self._sub_redis.pubsub()
+                self._listener_task = asyncio.create_task(self._message_listener())
 
             self.logger.info(f"Connected to Redis at {self._redis_url}")
 
@@ -78,6 +193,9 @@ class RedisRouter(AbstractRouter):
                 except (asyncio.CancelledError, asyncio.TimeoutError):
                     pass
 
+            if self._listener_thread:
+                await self._stop_listener_thread()
+
             # Unsubscribe and close pubsub
             if self._pubsub:
                 try:
@@ -86,20 +204,33 @@ class RedisRouter(AbstractRouter):
                 except Exception as e:
                     self.logger.debug(f"Error closing pubsub: {e}")
 
+            if self._sub_redis:
+                try:
+                    await self._sub_redis.connection_pool.disconnect()
+                except Exception as e:
+                    self.logger.debug(f"Error closing Redis connection: {e}")
+
             # Close Redis connection
             if self._redis:
                 try:
                     await self._redis.aclose()  # type: ignore[attr-defined]  # Use aclose() instead of close()
-                    # Wait for connection pool to close
-                    await asyncio.sleep(0.1)
+                    # The pool was passed in, so aclose() leaves it open
+                    if self._publish_pool:
+                        await self._publish_pool.disconnect()
                 except Exception as e:
                     self.logger.debug(f"Error closing Redis connection: {e}")
 
             # Clear all references
             self._redis = None
+            self._publish_pool = None
+            self._sub_redis = None
             self._pubsub = None
             self._listener_task = None
+            self._loop = None
             self._subscribed_patterns.clear()
+            self._has_subscriptions.clear()
+            self._pending_subscribe_acks = 0
+            self._subscriptions_acked.set()
 
             self.logger.info("Disconnected from Redis")
 
@@ -117,157 +248,405 @@ class RedisRouter(AbstractRouter):
             raise RuntimeError("Router not connected")
 
         try:
-            await self._redis.publish(channel, data)
+            await self._redis.publish(_encode_name(channel), data)
             self.logger.debug(f"Published message to Redis channel: {channel}")
         except Exception as e:
             self.logger.error(f"Error publishing to Redis: {e}")
             raise
 
+    async def _publish_many_raw(self, messages: List[Tuple[str, bytes]]) -> None:
+        """Publish a batch of messages in one pipelined round trip.
+
+        Args:
+            messages: (channel, data) pairs to publish, in order
+        """
+        if not self._redis:
+            raise RuntimeError("Router not connected")
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for channel, data in messages:
+                    pipe.publish(_encode_name(channel), data)
+                await pipe.execute()
+            self.logger.debug("Published %d messages to Redis", len(messages))
+        except Exception as e:
+            self.logger.error(f"Error publishing batch to Redis: {e}")
+            raise
+
+    def _check_connected(self) -> None:
+        """Raise unless a pubsub connection is available.
+
+        Raises:
+            RuntimeError: If the router is not connected
+        """
+        if not self._pubsub and not self._sync_pubsub:
+            raise RuntimeError("Router not connected")
+
+    async def _pubsub_command(self, command: str, *patterns: str) -> None:
+        """Run a (un)subscribe command on whichever pubsub client is in use.
+
+        The synchronous client used by the listener thread is driven from a
+        worker thread so a reconnect never blocks the event loop.
+
+        Args:
+            command: PubSub method name, e.g. ``psubscribe``
+            *patterns: Channels or patterns to pass to the command
+        """
+        if self._sync_pubsub:
+            await asyncio.to_thread(getattr(self._sync_pubsub, command), *patterns)
+        else:
+            await getattr(self._pubsub, command)(*patterns)
+
     async def _subscribe_raw(self, pattern: str) -> None:
         """Subscribe to a channel pattern in Redis.
 
         Args:
             pattern: Channel pattern to subscribe to (may include wildcards)
         """
-        if not self._pubsub:
-            raise RuntimeError("Router not connected")
+        self._check_connected()
 
         if pattern in self._subscribed_patterns:
             return
 
+        self._expect_subscribe_acks(1)
         try:
-            if "*" in pattern or "?" in pattern or "[" in pattern:
-                await self._pubsub.psubscribe(pattern)
+            is_glob = _WILD.search(pattern) is not None
+            if is_glob:
+                await self._pubsub_command("psubscribe", pattern)
                 self.logger.debug(f"Pattern subscribed to Redis: {pattern}")
             else:
-                await self._pubsub.subscribe(pattern)
+                await self._pubsub_command("subscribe", pattern)
                 self.logger.debug(f"Subscribed to Redis channel: {pattern}")
 
-            self._subscribed_patterns.add(pattern)
+            self._subscribed_patterns[pattern] = is_glob
+            self._has_subscriptions.set()
+
+        except Exception as e:
+            self._expect_subscribe_acks(-1)
+            self.logger.error(f"Error subscribing to Redis: {e}")
+            raise
+
+    async def _subscribe_many_raw(self, patterns: List[str]) -> None:
+        """Subscribe to several channel patterns in one round trip per kind.
+
+        Args:
+            patterns: Channel patterns to subscribe to (may include wildcards)
+        """
+        self._check_connected()
+
+        new_patterns = [p for p in patterns if p not in self._subscribed_patterns]
+        if not new_patterns:
+            return
+
+        kinds = {pattern: _WILD.search(pattern) is not None for pattern in new_patterns}
+        wildcard = [pattern for pattern, is_glob in kinds.items() if is_glob]
+        literal = [pattern for pattern, is_glob in kinds.items() if not is_glob]
+
+        self._expect_subscribe_acks(len(new_patterns))
+        try:
+            if wildcard:
+                await self._pubsub_command("psubscribe", *wildcard)
+                self.logger.debug(f"Pattern subscribed to Redis: {wildcard}")
+            if literal:
+                await self._pubsub_command("subscribe", *literal)
+                self.logger.debug(f"Subscribed to Redis channels: {literal}")
 
-            # Give the subscription time to register
-            await asyncio.sleep(0.01)
+            self._subscribed_patterns.update(kinds)
+            self._has_subscriptions.set()
 
         except Exception as e:
+            self._expect_subscribe_acks(-len(new_patterns))
             self.logger.error(f"Error subscribing to Redis: {e}")
             raise
 
+    def _expect_subscribe_acks(self, count: int) -> None:
+        """Adjust the number of subscription confirmations still expected.
+
+        Args:
+            count: Confirmations to add; negative to withdraw ones that will
+                not arrive
+        """
+        self._pending_subscribe_acks = max(self._pending_subscribe_acks + count, 0)
+        if self._pending_subscribe_acks:
+            self._subscriptions_acked.clear()
+        else:
+            self._subscriptions_acked.set()
+
+    def _ack_subscription(self) -> None:
+        """Record one subscription confirmation read by the listener."""
+        self._expect_subscribe_acks(-1)
+
+    async def flush_subscriptions(self, timeout: float = 1.0) -> None:
+        """Wait until Redis has confirmed every subscription sent so far.
+
+        Messages published after this returns reach the new subscriptions.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Raises:
+            asyncio.TimeoutError: If confirmations are still outstanding
+        """
+        await asyncio.wait_for(self._subscriptions_acked.wait(), timeout)
+
     async def _unsubscribe_raw(self, pattern: str) -> None:
         """Unsubscribe from a channel pattern in Redis.
 
         Args:
             pattern: Channel pattern to unsubscribe from
         """
-        if not self._pubsub:
-            raise RuntimeError("Router not connected")
+        self._check_connected()
 
-        if pattern not in self._subscribed_patterns:
+        # Forgotten up front: the router has already dropped the pattern, so
+        # a failed unsubscribe must not stop a later subscribe from re-sending
+        is_glob = self._subscribed_patterns.pop(pattern, None)
+        if is_glob is None:
             return
 
         try:
-            if "*" in pattern or "?" in pattern or "[" in pattern:
-                await self._pubsub.punsubscribe(pattern)
+            if is_glob:
+                await self._pubsub_command("punsubscribe", pattern)
                 self.logger.debug(f"Pattern unsubscribed from Redis: {pattern}")
             else:
-                await self._pubsub.unsubscribe(pattern)
+                await self._pubsub_command("unsubscribe", pattern)
                 self.logger.debug(f"Unsubscribed from Redis channel: {pattern}")
 
-            self._subscribed_patterns.discard(pattern)
+        except Exception as e:
+            self.logger.error(f"Error unsubscribing from Redis: {e}")
+            raise
+
+    async def _unsubscribe_many_raw(self, patterns: List[str]) -> None:
+        """Unsubscribe from several channel patterns in one round trip per kind.
+
+        Args:
+            patterns: Channel patterns to unsubscribe from
+        """
+        self._check_connected()
+
+        wildcard: List[str] = []
+        literal: List[str] = []
+        for pattern in patterns:
+            is_glob = self._subscribed_patterns.pop(pattern, None)
+            if is_glob is None:
+                continue
+            (wildcard if is_glob else literal).append(pattern)
+
+        try:
+            if wildcard:
+                await self._pubsub_command("punsubscribe", *wildcard)
+                self.logger.debug(f"Pattern unsubscribed from Redis: {wildcard}")
+            if literal:
+                await self._pubsub_command("unsubscribe", *literal)
+                self.logger.debug(f"Unsubscribed from Redis channels: {literal}")
 
         except Exception as e:
             self.logger.error(f"Error unsubscribing from Redis: {e}")
             raise
 
     async def _message_listener(self) -> None:
-        """Listen for messages from Redis Pub/Sub."""
+        """Listen for messages from Redis Pub/Sub.
+
+        Reads block on the socket until a message arrives; there is no
+        polling interval. Connection errors are retried with exponential
+        backoff, and redis-py resubscribes when it reconnects.
+        """
         if not self._pubsub:
             return
 
-        # Track delivered messages to avoid duplicates from multiple pattern matches
-        delivered_messages: Dict[tuple[str, bytes], float] = {}
+        retry_delay = _RECONNECT_MIN_DELAY
 
         try:
             self.logger.debug("Starting message listener loop")
+            # The pubsub connection is only created by the first subscribe
+            await self._has_subscriptions.wait()
             while True:
                 try:
-                    # Use get_message with timeout instead of async for
+                    # timeout=None blocks until a message arrives (the stubs
+                    # only allow float)
                     message = await self._pubsub.get_message(
-                        ignore_subscribe_messages=True, timeout=0.01
+                        timeout=None,  # type: ignore[arg-type]
                     )
+                    retry_delay = _RECONNECT_MIN_DELAY
 
                     if message is None:
-                        # No message available, continue
-                        await asyncio.sleep(0.01)
-                        # Clean up old delivered messages (older than 5 seconds)
-                        current_time = asyncio.get_event_loop().time()
-                        delivered_messages = {
-                            k: v
-                            for k, v in delivered_messages.items()
-                            if current_time - v < 5.0
-                        }
+                        continue
+                    if message["type"] in _SUBSCRIBE_ACKS:
+                        self._ack_subscription()
                         continue
 
-                    self.logger.info(f"Raw Redis message: {message}")
-
-                    if message["type"] in ("message", "pmessage"):
-                        # For pmessage, 'channel' is the actual channel and 'pattern' is the subscription pattern
-                        if message["type"] == "pmessage":
-                            channel = message[
-                                "channel"
-                            ]  # Actual channel like "SampleMessage:request:session123"
-                            pattern = message.get("pattern")
-                        else:
-                            channel = message["channel"]  # Direct subscription channel
-                            pattern = None
-
-                        if isinstance(channel, bytes):
-                            channel = channel.decode("utf-8")
-
-                        data = message["data"]
-                        if isinstance(data, str):
-                            data = data.encode("utf-8")
-                        elif isinstance(data, bytes):
-                            pass  # Already bytes
-                        else:
-                            self.logger.warning(
-                                f"Skipping non-data message: {type(data)}"
-                            )
-                            continue  # Skip non-data messages
-
-                        # Check if we've already delivered this message
-                        message_key = (channel, data)
-                        current_time = asyncio.get_event_loop().time()
-
-                        if message_key in delivered_messages:
-                            self.logger.debug(
-                                f"Skipping duplicate message on channel {channel} from pattern {pattern}"
-                            )
-                            continue
-
-                        delivered_messages[message_key] = current_time
-
-                        self.logger.info(
-                            f"Received message from Redis channel: {channel}, data length: {len(data)}"
-                        )
+                    decoded = self._decode_message(message)
+                    if decoded is None:
+                        continue
 
-                        try:
-                            await self.deliver_message(channel, data)
-                        except Exception as e:
-                            self.logger.error(
-                                f"Error delivering message: {e}", exc_info=True
-                            )
+                    try:
+                        await self.deliver_message(*decoded)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error delivering message: {e}", exc_info=True
+                        )
 
                 except asyncio.CancelledError:
                     raise
+                except (redis.ConnectionError, redis.TimeoutError) as e:
+                    self.logger.warning(
+                        "Redis pubsub connection error, retrying in %.1fs: %s",
+                        retry_delay,
+                        e,
+                    )
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, _RECONNECT_MAX_DELAY)
                 except Exception as e:
                     self.logger.debug(f"Error getting message: {e}")
-                    await asyncio.sleep(0.01)
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, _RECONNECT_MAX_DELAY)
 
         except asyncio.CancelledError:
             self.logger.debug("Message listener cancelled")
         except Exception as e:
             self.logger.error(f"Error in message listener: {e}", exc_info=True)
 
+    def _decode_message(
+        self, message: Dict[str, Any]
+    ) -> Optional[Tuple[str, bytes, str]]:
+        """Extract delivery arguments from a raw pubsub message.
+
+        Args:
+            message: Message dict returned by ``PubSub.get_message``
+
+        Returns:
+            (channel, data, pattern) for ``deliver_message``, or None if the
+            message carries no payload to deliver
+        """
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            self.logger.debug(
+                "Raw Redis message type=%s channel=%s",
+                message["type"],
+                message.get("channel"),
+            )
+
+        if message["type"] not in ("message", "pmessage"):
+            return None
+
+        # Every connection is opened with decode_responses=False, so names
+        # and payloads always arrive as bytes.
+        # For pmessage, 'channel' is the actual channel and 'pattern' is the subscription pattern
+        channel = _decode_name(message["channel"])
+
+        # Redis sends one copy per matching subscription;
+        # a direct subscription's pattern is the channel
+        if message["type"] == "pmessage":
+            pattern = _decode_name(message["pattern"])
+        else:
+            pattern = channel
+
+        data: bytes = message["data"]
+
+        if log_debug:
+            self.logger.debug(
+                "Received message from Redis channel: %s, data length: %d",
+                channel,
+                len(data),
+            )
+        return channel, data, pattern
+
+    def _start_listener_thread(self) -> None:
+        """Open the synchronous pubsub client and start the listener thread."""
+        self._loop = asyncio.get_running_loop()
+        self._sync_redis = sync_redis.Redis.from_url(
+            self._redis_url, decode_responses=False, **self._redis_kwargs
+        )
+        # redis-py leaves the sync Redis.pubsub() unannotated
+        self._sync_pubsub = self._sync_redis.pubsub()  # type: ignore[no-untyped-call]
+        self._stop_listener.clear()
+        self._listener_thread = threading.Thread(
+            target=self._thread_listener,
+            name=f"{self.__class__.__name__}-listener",
+            daemon=True,
+        )
+        self._listener_thread.start()
+
+    async def _stop_listener_thread(self) -> None:
+        """Stop the listener thread and close the synchronous pubsub client."""
+        self._stop_listener.set()
+
+        # Closing the pubsub connection unblocks a read in progress
+        if self._sync_pubsub:
+            try:
+                await asyncio.to_thread(self._sync_pubsub.close)
+            except Exception as e:
+                self.logger.debug(f"Error closing pubsub: {e}")
+
+        if self._listener_thread:
+            # Joined off the loop: the thread may be waiting on a delivery
+            await asyncio.to_thread(
+                self._listener_thread.join, _THREAD_READ_TIMEOUT * 2
+            )
+
+        if self._sync_redis:
+            try:
+                await asyncio.to_thread(self._sync_redis.close)
+            except Exception as e:
+                self.logger.debug(f"Error closing Redis connection: {e}")
+
+        self._sync_redis = None
+        self._sync_pubsub = None
+        self._listener_thread = None
+
+    def _thread_listener(self) -> None:
+        """Read pubsub messages on the listener thread.
+
+        Reading and protocol parsing happen on this thread with a blocking
+        socket; each message is handed to the event loop for delivery, and
+        the thread waits for it so delivery order and backpressure match the
+        asyncio listener.
+        """
+        pubsub = self._sync_pubsub
+        loop = self._loop
+        if pubsub is None or loop is None:
+            return
+
+        retry_delay = _RECONNECT_MIN_DELAY
+
+        self.logger.debug("Starting message listener thread")
+        while not self._stop_listener.is_set():
+            try:
+                message = pubsub.get_message(timeout=_THREAD_READ_TIMEOUT)
+                retry_delay = _RECONNECT_MIN_DELAY
+            except Exception as e:
+                if self._stop_listener.is_set():
+                    break
+                if isinstance(e, (redis.ConnectionError, redis.TimeoutError)):
+                    self.logger.warning(
+                        "Redis pubsub connection error, retrying in %.1fs: %s",
+                        retry_delay,
+                        e,
+                    )
+                else:
+                    self.logger.debug(f"Error getting message: {e}")
+                self._stop_listener.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, _RECONNECT_MAX_DELAY)
+                continue
+
+            if message is None:
+                continue
+            if message["type"] in _SUBSCRIBE_ACKS:
+                loop.call_soon_threadsafe(self._ack_subscription)
+                continue
+
+            decoded = self._decode_message(message)
+            if decoded is None:
+                continue
+
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.deliver_message(*decoded), loop
+                ).result()
+            except Exception as e:
+                self.logger.error(f"Error delivering message: {e}", exc_info=True)
+
+        self.logger.debug("Message listener thread stopped")
+
     async def health_check(self) -> bool:
         """Check if Redis connection is healthy.
 
@@ -15,8 +15,10 @@ class PaymentRequestMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
+        prefix = f"{cls.__name__}:"
+
         def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
+            return f"{prefix}{direction}:{session_id}"
 
         return pattern_func
 
@@ -30,8 +32,10 @@ class PaymentResponseMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
+        prefix = f"{cls.__name__}:"
+
         def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
+            return f"{prefix}{direction}:{session_id}"
 
         return pattern_func
 
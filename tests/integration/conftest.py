@@ -1,25 +1,55 @@
 """Pytest configuration for integration tests."""
 
 import asyncio
-import time
+import os
+import sys
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Any
 import redis.asyncio as redis
+from redis.utils import HIREDIS_AVAILABLE
 import aio_pika
+from aio_pika.abc import AbstractConnection
 from testcontainers.redis import RedisContainer
 from testcontainers.rabbitmq import RabbitMqContainer
 
+try:
+    import uvloop
+
+    _HAS_UVLOOP = sys.platform != "win32"
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_UVLOOP = False
+
+# Readiness polling for freshly started containers: exponential backoff
+# between attempts, starting small since Redis is usually up within a second
+_READY_MAX_RETRIES = 30
+_READY_MIN_DELAY = 0.05
+_READY_MAX_DELAY = 2.0
+
 
 @pytest.fixture(scope="session")
-def event_loop_policy() -> asyncio.DefaultEventLoopPolicy:
-    """Set the event loop policy for the test session."""
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Set the event loop policy for the test session.
+
+    Uses uvloop when it is installed, unless NO_UVLOOP is set in the
+    environment (handy when debugging against the stock asyncio loop).
+    """
+    if _HAS_UVLOOP and not os.environ.get("NO_UVLOOP"):
+        return uvloop.EventLoopPolicy()
     return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest_asyncio.fixture(scope="session")
 async def redis_container() -> AsyncGenerator[RedisContainer, None]:
-    """Start a Redis container for testing with health checks."""
+    """Start a Redis container for testing with health checks.
+
+    The hiredis C parser is required: redis-py falls back to a pure-Python
+    RESP parser without it, which would make the pubsub tests measure
+    parsing overhead rather than routing.
+    """
+    if not HIREDIS_AVAILABLE:
+        pytest.fail("hiredis is not installed; install redis[hiredis]")
+
     print("\n🚀 Starting Redis container...")
 
     with RedisContainer("redis:7-alpine") as container:
@@ -28,8 +58,8 @@ async def redis_container() -> AsyncGenerator[RedisContainer, None]:
         url = f"redis://{host}:{port}/0"
 
         # Wait for Redis to be ready
-        max_retries = 30
-        for i in range(max_retries):
+        delay = _READY_MIN_DELAY
+        for i in range(_READY_MAX_RETRIES):
             try:
                 # Test connection
                 client = await redis.from_url(url)
@@ -38,10 +68,11 @@ async def redis_container() -> AsyncGenerator[RedisContainer, None]:
                 print(f"✅ Redis container ready at {host}:{port}")
                 break
             except Exception as e:
-                if i == max_retries - 1:
+                if i == _READY_MAX_RETRIES - 1:
                     print(f"❌ Redis container failed to start: {e}")
                     raise
-                time.sleep(1)
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.5, _READY_MAX_DELAY)
 
         yield container
 
@@ -59,29 +90,39 @@ async def rabbitmq_container() -> AsyncGenerator[RabbitMqContainer, None]:
         url = f"amqp://{username}:{password}@{host}:{port}/"
 
         # Wait for RabbitMQ to be ready
-        max_retries = 30
-        for i in range(max_retries):
+        delay = _READY_MIN_DELAY
+        for i in range(_READY_MAX_RETRIES):
             try:
                 # Test connection
-                connection = await aio_pika.connect_robust(url)
+                connection = await aio_pika.connect(url)
                 await connection.close()
                 print(f"✅ RabbitMQ container ready at {host}:{port}")
                 break
             except Exception as e:
-                if i == max_retries - 1:
+                if i == _READY_MAX_RETRIES - 1:
                     print(f"❌ RabbitMQ container failed to start: {e}")
                     raise
-                time.sleep(1)
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.5, _READY_MAX_DELAY)
 
         yield container
 
 
-@pytest_asyncio.fixture
+def _redis_container_url(container: RedisContainer) -> str:
+    """Build the connection URL for a running Redis container."""
+    host = container.get_container_host_ip()
+    port = container.get_exposed_port(6379)
+    return f"redis://{host}:{port}/0"
+
+
+@pytest_asyncio.fixture(scope="session")
 async def redis_url(redis_container: RedisContainer) -> str:
-    """Get the Redis connection URL with validation."""
-    host = redis_container.get_container_host_ip()
-    port = redis_container.get_exposed_port(6379)
-    url = f"redis://{host}:{port}/0"
+    """Get the Redis connection URL with validation.
+
+    Session-scoped: a function-scoped async fixture would pull tests marked
+    with a wider asyncio scope back onto a per-test event loop.
+    """
+    url = _redis_container_url(redis_container)
 
     # Validate connection before returning
     try:
@@ -94,9 +135,56 @@ async def redis_url(redis_container: RedisContainer) -> str:
         raise  # Never reached, but satisfies mypy
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
+async def redis_pool(
+    redis_container: RedisContainer,
+) -> AsyncGenerator[redis.ConnectionPool, None]:
+    """Connection pool shared by the session, decoding replies to str.
+
+    Tests using it must run on the session event loop, since pooled
+    connections are bound to the loop that opened them.
+    """
+    pool = redis.ConnectionPool.from_url(
+        _redis_container_url(redis_container),
+        max_connections=20,
+        decode_responses=True,
+    )
+    yield pool
+    await pool.disconnect()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def redis_bytes_pool(
+    redis_container: RedisContainer,
+) -> AsyncGenerator[redis.ConnectionPool, None]:
+    """Connection pool shared by the session, returning raw bytes for pubsub."""
+    pool = redis.ConnectionPool.from_url(
+        _redis_container_url(redis_container),
+        max_connections=20,
+        decode_responses=False,
+    )
+    yield pool
+    await pool.disconnect()
+
+
+@pytest.fixture
+def redis_client(redis_pool: redis.ConnectionPool) -> "redis.Redis[Any]":
+    """Client on the shared str-decoding pool."""
+    return redis.Redis(connection_pool=redis_pool)
+
+
+@pytest.fixture
+def redis_bytes_client(redis_bytes_pool: redis.ConnectionPool) -> "redis.Redis[Any]":
+    """Client on the shared bytes pool."""
+    return redis.Redis(connection_pool=redis_bytes_pool)
+
+
+@pytest_asyncio.fixture(scope="session")
 async def rabbitmq_url(rabbitmq_container: RabbitMqContainer) -> str:
-    """Get the RabbitMQ connection URL with validation."""
+    """Get the RabbitMQ connection URL with validation.
+
+    Session-scoped for the same reason as redis_url.
+    """
     host = rabbitmq_container.get_container_host_ip()
     port = rabbitmq_container.get_exposed_port(5672)
     username = (
@@ -113,7 +201,7 @@ async def rabbitmq_url(rabbitmq_container: RabbitMqContainer) -> str:
 
     # Validate connection before returning
     try:
-        connection = await aio_pika.connect_robust(url)
+        connection = await aio_pika.connect(url)
         await connection.close()
         return url
     except Exception as e:
@@ -121,27 +209,52 @@ async def rabbitmq_url(rabbitmq_container: RabbitMqContainer) -> str:
         raise  # Never reached, but satisfies mypy
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(scope="session")
+async def rabbitmq_connection(
+    rabbitmq_container: RabbitMqContainer,
+) -> AsyncGenerator[AbstractConnection, None]:
+    """AMQP connection shared by the session; tests open their own channels.
+
+    A plain connection, not a robust one: the tests never outlive the
+    container, so the reconnect machinery would only add background work.
+    The router itself keeps using connect_robust.
+
+    Tests using it must run on the session event loop, like the Redis pools.
+    """
+    host = rabbitmq_container.get_container_host_ip()
+    port = rabbitmq_container.get_exposed_port(5672)
+    username = getattr(rabbitmq_container, "username", "guest")
+    password = getattr(rabbitmq_container, "password", "guest")
+    connection = await aio_pika.connect(
+        f"amqp://{username}:{password}@{host}:{port}/"
+    )
+    yield connection
+    await connection.close()
+
+
+@pytest_asyncio.fixture
 async def cleanup_between_tests() -> AsyncGenerator[None, None]:
-    """Ensure clean state between tests."""
+    """Ensure clean state between tests.
+
+    Opt-in (via ``pytest.mark.usefixtures``) for modules whose tests each
+    get their own event loop. Tests on a shared loop must not use it: as a
+    function-scoped async fixture it would move them onto a per-test loop,
+    and it would cancel the tasks of connections shared across tests.
+    """
     # Run test
     yield
 
-    # Cancel any pending tasks from the test
-    loop = asyncio.get_event_loop()
-    pending = asyncio.all_tasks(loop)
-    current_task = asyncio.current_task(loop)
-
-    # Cancel all tasks except the current cleanup task
-    for task in pending:
-        if task != current_task and not task.done():
-            task.cancel()
-
-    # Wait for cancellations to complete
-    if pending:
-        await asyncio.gather(
-            *[t for t in pending if t != current_task], return_exceptions=True
-        )
+    # Cancel any tasks the test left running
+    current_task = asyncio.current_task()
+    leftover = [
+        task
+        for task in asyncio.all_tasks()
+        if task is not current_task and not task.done()
+    ]
+    for task in leftover:
+        task.cancel()
 
-    # Add small delay between tests to prevent race conditions
-    await asyncio.sleep(0.1)
+    # Wait for cancellations to complete, then let their callbacks run
+    if leftover:
+        await asyncio.gather(*leftover, return_exceptions=True)
+        await asyncio.sleep(0)
@@ -2,47 +2,68 @@
 
 import pytest
 import docker
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Generator
 from docker.errors import DockerException, ImageNotFound
 
 
-def test_docker_daemon_available() -> None:
-    """Verify Docker daemon is running and accessible."""
+@pytest.fixture(scope="module")
+def docker_client() -> Generator[docker.DockerClient, None, None]:
+    """Docker client shared by the setup tests."""
     try:
         client = docker.from_env()
-        ping_result = client.ping()
+    except DockerException as e:
+        pytest.fail(f"Docker is not available: {e}")
+    yield client
+    client.close()
+
+
+def test_docker_daemon_available(docker_client: docker.DockerClient) -> None:
+    """Verify Docker daemon is running and accessible."""
+    try:
+        ping_result = docker_client.ping()
         assert ping_result is True, "Docker daemon not responding"
         print("✓ Docker daemon is running and accessible")
     except DockerException as e:
         pytest.fail(f"Docker is not available: {e}")
 
 
-def test_required_images_available() -> None:
+def test_required_images_available(docker_client: docker.DockerClient) -> None:
     """Verify required container images are available or can be pulled."""
-    client = docker.from_env()
-
     required_images = ["redis:7-alpine", "rabbitmq:3.12-management-alpine"]
 
+    missing = []
     for image_name in required_images:
         try:
             # Check if image exists locally
-            image = client.images.get(image_name)
+            image = docker_client.images.get(image_name)
             print(f"✓ Image {image_name} is available locally (ID: {image.short_id})")
         except ImageNotFound:
-            # Try to pull the image
             print(f"⟳ Image {image_name} not found locally, pulling...")
+            missing.append(image_name)
+
+    if not missing:
+        return
+
+    # Pulls are network bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = {
+            executor.submit(docker_client.images.pull, image_name): image_name
+            for image_name in missing
+        }
+        for future in as_completed(futures):
+            image_name = futures[future]
             try:
-                image = client.images.pull(image_name)
+                future.result()
                 print(f"✓ Successfully pulled {image_name}")
             except Exception as e:
                 pytest.fail(f"Failed to pull image {image_name}: {e}")
 
 
-def test_no_conflicting_containers() -> None:
+def test_no_conflicting_containers(docker_client: docker.DockerClient) -> None:
     """Check for any conflicting containers that might interfere with tests."""
-    client = docker.from_env()
-
     # Look for any existing test containers
-    containers = client.containers.list(all=True)
+    containers = docker_client.containers.list(all=True)
     test_containers = [c for c in containers if "testcontainers" in c.name]
 
     if test_containers:
@@ -81,12 +102,10 @@ def test_port_availability() -> None:
             print(f"✓ Port {port} ({service}) is available")
 
 
-def test_docker_network() -> None:
+def test_docker_network(docker_client: docker.DockerClient) -> None:
     """Verify Docker networking is functional."""
-    client = docker.from_env()
-
     # Check if bridge network exists and is functional
-    networks = client.networks.list()
+    networks = docker_client.networks.list()
     bridge_network = None
 
     for network in networks:
@@ -104,13 +123,11 @@ def test_docker_network() -> None:
     )
 
 
-def test_container_runtime() -> None:
+def test_container_runtime(docker_client: docker.DockerClient) -> None:
     """Test that we can create and destroy a simple container."""
-    client = docker.from_env()
-
     try:
         # Run a simple alpine container
-        container = client.containers.run(
+        container = docker_client.containers.run(
             "alpine:latest",
             "echo 'test'",
             detach=True,
@@ -138,7 +155,7 @@ def test_container_runtime() -> None:
     finally:
         # Ensure cleanup
         try:
-            container = client.containers.get("test_container_runtime_check")
+            container = docker_client.containers.get("test_container_runtime_check")
             container.remove(force=True)
         except Exception:
             pass  # Container already removed or doesn't exist
@@ -3,191 +3,213 @@
 import pytest
 import asyncio
 import redis.asyncio as redis
-from typing import Optional
+from typing import Any
 
+# Clients come from session-wide pools whose connections are bound to the
+# session event loop, so these tests must run on it too
+pytestmark = pytest.mark.asyncio(scope="session")
 
-@pytest.mark.asyncio
-async def test_redis_connection(redis_url: str) -> None:
+# Pubsub flavours: classic PUBLISH fans out to every node, sharded SPUBLISH
+# (Redis 7+) only to the shard owning the channel. Each maps to the type of
+# the messages it delivers.
+_PUBSUB_MODES = {"classic": "message", "sharded": "smessage"}
+
+
+async def _require_mode(client: "redis.Redis[Any]", mode: str) -> None:
+    """Skip the test if the server does not support the pubsub mode."""
+    if mode == "sharded":
+        info = await client.info("server")
+        if int(str(info["redis_version"]).split(".")[0]) < 7:
+            pytest.skip("Sharded pub/sub requires Redis 7+")
+
+
+async def _subscribe(pubsub: redis.client.PubSub, mode: str, channel: str) -> None:
+    """Subscribe with the command matching the pubsub mode.
+
+    The asyncio PubSub has no sharded helpers, so SSUBSCRIBE is sent raw.
+    """
+    if mode == "sharded":
+        await pubsub.execute_command("SSUBSCRIBE", channel)
+    else:
+        await pubsub.subscribe(channel)
+
+
+async def _unsubscribe(pubsub: redis.client.PubSub, mode: str, channel: str) -> None:
+    """Unsubscribe with the command matching the pubsub mode."""
+    if mode == "sharded":
+        await pubsub.execute_command("SUNSUBSCRIBE", channel)
+    else:
+        await pubsub.unsubscribe(channel)
+
+
+async def _publish(
+    client: "redis.Redis[Any]", mode: str, channel: str, data: bytes
+) -> int:
+    """Publish with the command matching the pubsub mode."""
+    if mode == "sharded":
+        return int(await client.spublish(channel, data))
+    return int(await client.publish(channel, data))
+
+
+async def _await_subscribed(pubsub: redis.client.PubSub, count: int = 1) -> None:
+    """Drain subscription confirmations until `count` have arrived.
+
+    Redis confirms a subscription before delivering anything published to
+    it, so messages published afterwards are guaranteed to be received.
+    """
+    confirmed = 0
+    async with asyncio.timeout(2.0):
+        while confirmed < count:
+            message = await pubsub.get_message(timeout=1.0)
+            if message and message["type"] in (
+                "subscribe",
+                "psubscribe",
+                "ssubscribe",
+            ):
+                confirmed += 1
+
+
+async def test_redis_connection(redis_client: "redis.Redis[Any]") -> None:
     """Test that we can connect to Redis container."""
-    print(f"\nTesting Redis connection at: {redis_url}")
+    print("\nTesting Redis connection")
 
-    client: Optional[redis.Redis[str]] = None
     try:
-        client = await redis.from_url(redis_url, decode_responses=True)
-
         # Test ping
-        pong = await client.ping()
+        pong = await redis_client.ping()
         assert pong is True, "Redis ping failed"
         print("✓ Redis connection successful")
 
         # Get Redis info
-        info = await client.info()
+        info = await redis_client.info()
         print(
             f"✓ Redis version: {info.get('server', {}).get('redis_version', 'unknown')}"
         )
 
     except Exception as e:
         pytest.fail(f"Failed to connect to Redis: {e}")
-    finally:
-        if client:
-            await client.aclose()  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
-async def test_redis_basic_operations(redis_url: str) -> None:
+async def test_redis_basic_operations(redis_client: "redis.Redis[Any]") -> None:
     """Test basic Redis operations (set/get/delete)."""
     print("\nTesting Redis basic operations")
 
-    client = await redis.from_url(redis_url, decode_responses=True)
+    # One round trip for the whole sequence; replies come back in order
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.set("test_key", "test_value")
+        pipe.get("test_key")
+        pipe.exists("test_key")
+        pipe.delete("test_key")
+        pipe.get("test_key")
+        result, value, exists, deleted, value_after = await pipe.execute()
 
-    try:
-        # Test SET
-        result = await client.set("test_key", "test_value")
-        assert result is True, "Failed to set key"
-        print("✓ SET operation successful")
-
-        # Test GET
-        value = await client.get("test_key")
-        assert value == "test_value", f"Expected 'test_value', got {value}"
-        print("✓ GET operation successful")
-
-        # Test EXISTS
-        exists = await client.exists("test_key")
-        assert exists == 1, "Key should exist"
-        print("✓ EXISTS operation successful")
-
-        # Test DELETE
-        deleted = await client.delete("test_key")
-        assert deleted == 1, "Failed to delete key"
-        print("✓ DELETE operation successful")
-
-        # Verify deletion
-        value = await client.get("test_key")
-        assert value is None, "Key should be deleted"
-        print("✓ Key successfully deleted")
+    # Test SET
+    assert result is True, "Failed to set key"
+    print("✓ SET operation successful")
 
-    finally:
-        await client.aclose()  # type: ignore[attr-defined]
+    # Test GET
+    assert value == "test_value", f"Expected 'test_value', got {value}"
+    print("✓ GET operation successful")
+
+    # Test EXISTS
+    assert exists == 1, "Key should exist"
+    print("✓ EXISTS operation successful")
+
+    # Test DELETE
+    assert deleted == 1, "Failed to delete key"
+    print("✓ DELETE operation successful")
+
+    # Verify deletion
+    assert value_after is None, "Key should be deleted"
+    print("✓ Key successfully deleted")
 
 
-@pytest.mark.asyncio
-async def test_redis_pubsub_basic(redis_url: str) -> None:
+@pytest.mark.parametrize("mode", list(_PUBSUB_MODES))
+async def test_redis_pubsub_basic(
+    redis_bytes_client: "redis.Redis[Any]", mode: str
+) -> None:
     """Test Redis Pub/Sub functionality."""
-    print("\nTesting Redis Pub/Sub")
+    print(f"\nTesting Redis Pub/Sub ({mode})")
+    await _require_mode(redis_bytes_client, mode)
+    message_type = _PUBSUB_MODES[mode]
 
-    # Create publisher and subscriber clients
-    pub_client = await redis.from_url(redis_url, decode_responses=False)
-    sub_client = await redis.from_url(redis_url, decode_responses=False)
+    # The pubsub holds its own pooled connection; publishes use another
+    pubsub = redis_bytes_client.pubsub()
 
     try:
-        # Create pubsub object
-        pubsub = sub_client.pubsub()
-
         # Subscribe to a channel
-        await pubsub.subscribe("test_channel")
+        await _subscribe(pubsub, mode, "test_channel")
         print("✓ Subscribed to test_channel")
 
-        # Give subscription time to register
-        await asyncio.sleep(0.1)
+        await _await_subscribed(pubsub)
 
         # Publish a message
-        num_subscribers = await pub_client.publish("test_channel", b"hello_world")
+        num_subscribers = await _publish(
+            redis_bytes_client, mode, "test_channel", b"hello_world"
+        )
         print(f"✓ Published message to {num_subscribers} subscriber(s)")
         assert num_subscribers >= 1, "Message should have at least one subscriber"
 
-        # Try to receive the message
-        message_received = False
-
-        async def get_message() -> None:
-            nonlocal message_received
-            async for message in pubsub.listen():
-                print(f"  Received message type: {message['type']}")
-                if message["type"] == "subscribe":
-                    # Skip subscription confirmation
-                    continue
-                elif message["type"] == "message":
-                    assert (
-                        message["data"] == b"hello_world"
-                    ), f"Unexpected message data: {message['data']}"
-                    message_received = True
-                    print(f"✓ Received correct message: {message['data']}")
-                    return
-
-        # Wait for message with timeout
-        try:
-            await asyncio.wait_for(get_message(), timeout=2.0)
-        except asyncio.TimeoutError:
+        # The confirmation is already drained, so the next frame is the
+        # message; a single read replaces a listen() generator
+        message = await pubsub.get_message(timeout=2.0)
+        if message is None:
             pytest.fail(
                 "Timeout waiting for message - Redis Pub/Sub may not be working"
             )
 
-        assert message_received, "Message was not received"
+        assert message["type"] == message_type, f"Unexpected message: {message}"
+        assert (
+            message["data"] == b"hello_world"
+        ), f"Unexpected message data: {message['data']}"
+        print(f"✓ Received correct message: {message['data']}")
 
         # Unsubscribe
-        await pubsub.unsubscribe("test_channel")
+        await _unsubscribe(pubsub, mode, "test_channel")
         print("✓ Unsubscribed from test_channel")
 
     finally:
-        if pubsub:
-            await pubsub.aclose()  # type: ignore[attr-defined]
-        await pub_client.aclose()  # type: ignore[attr-defined]
-        await sub_client.aclose()  # type: ignore[attr-defined]
+        await pubsub.aclose()  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
-async def test_redis_pubsub_patterns(redis_url: str) -> None:
+async def test_redis_pubsub_patterns(redis_bytes_client: "redis.Redis[Any]") -> None:
     """Test Redis pattern subscriptions."""
     print("\nTesting Redis pattern subscriptions")
 
-    pub_client = await redis.from_url(redis_url, decode_responses=False)
-    sub_client = await redis.from_url(redis_url, decode_responses=False)
+    pubsub = redis_bytes_client.pubsub()
 
     try:
-        pubsub = sub_client.pubsub()
-
         # Subscribe to a pattern
         await pubsub.psubscribe("test:*")
         print("✓ Pattern subscribed to test:*")
 
-        await asyncio.sleep(0.1)
+        await _await_subscribed(pubsub)
 
         # Publish to matching channels
-        await pub_client.publish("test:channel1", b"message1")
-        await pub_client.publish("test:channel2", b"message2")
-        await pub_client.publish("other:channel", b"should_not_receive")
+        await redis_bytes_client.publish("test:channel1", b"message1")
+        await redis_bytes_client.publish("test:channel2", b"message2")
+        await redis_bytes_client.publish("other:channel", b"should_not_receive")
 
-        # Collect messages
+        # Collect messages until 2 arrive or the deadline passes
         received_messages = []
 
-        async def collect_messages() -> None:
-            count = 0
-            async for message in pubsub.listen():
-                if message["type"] == "psubscribe":
-                    continue
-                elif message["type"] == "pmessage":
-                    received_messages.append(
-                        {
-                            "channel": message["channel"].decode()
-                            if isinstance(message["channel"], bytes)
-                            else message["channel"],
-                            "data": message["data"],
-                        }
-                    )
-                    count += 1
-                    if count >= 2:  # Expect 2 messages
-                        return
-
-        try:
-            await asyncio.wait_for(collect_messages(), timeout=2.0)
-        except asyncio.TimeoutError:
-            pass  # It's okay if we timeout after receiving some messages
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0
+        while len(received_messages) < 2 and loop.time() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=0.5
+            )
+            if message and message["type"] == "pmessage":
+                received_messages.append(
+                    {"channel": message["channel"], "data": message["data"]}
+                )
 
         # Verify we got the right messages
         assert (
             len(received_messages) == 2
         ), f"Expected 2 messages, got {len(received_messages)}"
 
-        channels = [msg["channel"] for msg in received_messages]
+        # Channels stay bytes while receiving; decode once for the checks
+        channels = [msg["channel"].decode() for msg in received_messages]
         assert "test:channel1" in channels
         assert "test:channel2" in channels
         assert "other:channel" not in channels
@@ -195,34 +217,34 @@ async def test_redis_pubsub_patterns(redis_url: str) -> None:
         print(f"✓ Received {len(received_messages)} messages on pattern subscription")
 
     finally:
-        if pubsub:
-            await pubsub.aclose()  # type: ignore[attr-defined]
-        await pub_client.aclose()  # type: ignore[attr-defined]
-        await sub_client.aclose()  # type: ignore[attr-defined]
+        await pubsub.aclose()  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
-async def test_redis_multiple_subscribers(redis_url: str) -> None:
+@pytest.mark.parametrize("mode", list(_PUBSUB_MODES))
+async def test_redis_multiple_subscribers(
+    redis_bytes_client: "redis.Redis[Any]", mode: str
+) -> None:
     """Test multiple subscribers to the same channel."""
-    print("\nTesting multiple subscribers")
+    print(f"\nTesting multiple subscribers ({mode})")
+    await _require_mode(redis_bytes_client, mode)
+    message_type = _PUBSUB_MODES[mode]
 
-    pub_client = await redis.from_url(redis_url, decode_responses=False)
-    sub_client1 = await redis.from_url(redis_url, decode_responses=False)
-    sub_client2 = await redis.from_url(redis_url, decode_responses=False)
+    # Create two subscribers on the one shared client. Redis counts
+    # subscribers per connection, so each PubSub still checks out its own
+    # pooled connection; the pool keeps them open between tests
+    pubsub1 = redis_bytes_client.pubsub()
+    pubsub2 = redis_bytes_client.pubsub()
 
     try:
-        # Create two subscribers
-        pubsub1 = sub_client1.pubsub()
-        pubsub2 = sub_client2.pubsub()
-
-        await pubsub1.subscribe("shared_channel")
-        await pubsub2.subscribe("shared_channel")
+        await _subscribe(pubsub1, mode, "shared_channel")
+        await _subscribe(pubsub2, mode, "shared_channel")
 
-        await asyncio.sleep(0.1)
+        await _await_subscribed(pubsub1)
+        await _await_subscribed(pubsub2)
 
         # Publish a message
-        num_subscribers = await pub_client.publish(
-            "shared_channel", b"broadcast_message"
+        num_subscribers = await _publish(
+            redis_bytes_client, mode, "shared_channel", b"broadcast_message"
         )
         print(f"✓ Published to {num_subscribers} subscribers")
         assert num_subscribers == 2, f"Expected 2 subscribers, got {num_subscribers}"
@@ -231,15 +253,17 @@ async def test_redis_multiple_subscribers(redis_url: str) -> None:
         messages_received = []
 
         async def receive_from_pubsub(pubsub: redis.client.PubSub, name: str) -> None:
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    messages_received.append(name)
-                    return
+            # Confirmations are already drained, so one read gets the message.
+            # Sharded messages count as subscribe traffic to redis-py, so
+            # filter on the type rather than ignore_subscribe_messages
+            message = await pubsub.get_message(timeout=2.0)
+            if message and message["type"] == message_type:
+                messages_received.append(name)
 
         # Wait for both to receive
         await asyncio.gather(
-            asyncio.wait_for(receive_from_pubsub(pubsub1, "sub1"), timeout=2.0),
-            asyncio.wait_for(receive_from_pubsub(pubsub2, "sub2"), timeout=2.0),
+            receive_from_pubsub(pubsub1, "sub1"),
+            receive_from_pubsub(pubsub2, "sub2"),
         )
 
         assert (
@@ -250,10 +274,5 @@ async def test_redis_multiple_subscribers(redis_url: str) -> None:
         print("✓ Both subscribers received the message")
 
     finally:
-        if pubsub1:
-            await pubsub1.aclose()  # type: ignore[attr-defined]
-        if pubsub2:
-            await pubsub2.aclose()  # type: ignore[attr-defined]
-        await pub_client.aclose()  # type: ignore[attr-defined]
-        await sub_client1.aclose()  # type: ignore[attr-defined]
-        await sub_client2.aclose()  # type: ignore[attr-defined]
+        await pubsub1.aclose()  # type: ignore[attr-defined]
+        await pubsub2.aclose()  # type: ignore[attr-defined]
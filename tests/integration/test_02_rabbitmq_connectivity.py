@@ -4,19 +4,23 @@ import pytest
 import asyncio
 import aio_pika
 from aio_pika import Message, ExchangeType
+from aio_pika.abc import AbstractConnection
 from typing import Dict
 
+# The shared connection is bound to the session event loop, so these tests
+# must run on it too; each test opens its own channel over it
+pytestmark = pytest.mark.asyncio(scope="session")
 
-@pytest.mark.asyncio
-async def test_rabbitmq_connection(rabbitmq_url: str) -> None:
+
+async def test_rabbitmq_connection(
+    rabbitmq_connection: AbstractConnection,
+) -> None:
     """Test that we can connect to RabbitMQ container."""
-    print(f"\nTesting RabbitMQ connection at: {rabbitmq_url}")
+    print("\nTesting RabbitMQ connection")
 
-    connection = None
+    connection = rabbitmq_connection
+    channel = None
     try:
-        # Connect to RabbitMQ
-        connection = await aio_pika.connect_robust(rabbitmq_url)
-        assert connection is not None, "Failed to create connection"
         assert not connection.is_closed, "Connection should be open"
 
         # Create a channel
@@ -28,7 +32,7 @@ async def test_rabbitmq_connection(rabbitmq_url: str) -> None:
 
         # Get some server properties (if available)
         # Note: We use getattr() instead of direct attribute access because:
-        # - AbstractRobustConnection doesn't expose 'connection' in its type definition
+        # - AbstractConnection doesn't expose 'connection' in its type definition
         # - The actual runtime implementation may have this attribute
         # - Using getattr() satisfies both Pylance and mypy without type: ignore comments
         if hasattr(connection, "connection"):
@@ -42,20 +46,19 @@ async def test_rabbitmq_connection(rabbitmq_url: str) -> None:
     except Exception as e:
         pytest.fail(f"Failed to connect to RabbitMQ: {e}")
     finally:
-        if connection and not connection.is_closed:
-            await connection.close()
+        if channel and not channel.is_closed:
+            await channel.close()
 
 
-@pytest.mark.asyncio
-async def test_rabbitmq_basic_queue_operations(rabbitmq_url: str) -> None:
+async def test_rabbitmq_basic_queue_operations(
+    rabbitmq_connection: AbstractConnection,
+) -> None:
     """Test basic RabbitMQ queue operations."""
     print("\nTesting RabbitMQ basic queue operations")
 
-    connection = await aio_pika.connect_robust(rabbitmq_url)
+    channel = await rabbitmq_connection.channel()
 
     try:
-        channel = await connection.channel()
-
         # Declare a queue
         queue = await channel.declare_queue("test_queue", auto_delete=True)
         assert queue is not None, "Failed to declare queue"
@@ -79,31 +82,24 @@ async def test_rabbitmq_basic_queue_operations(rabbitmq_url: str) -> None:
         await incoming_message.ack()
         print(f"✓ Received and acknowledged message: {incoming_message.body.decode()}")
 
-        # Check queue is empty
-        try:
-            empty_check = await queue.get(timeout=0.5)
-            if empty_check:
-                await empty_check.nack()
-                pytest.fail("Queue should be empty")
-        except aio_pika.exceptions.QueueEmpty:
-            print("✓ Queue is empty after consumption")
-        except asyncio.TimeoutError:
-            print("✓ Queue is empty after consumption")
+        # Check queue is empty; fail=False returns None instead of waiting
+        empty_check = await queue.get(no_ack=True, fail=False)
+        assert empty_check is None, "Queue should be empty"
+        print("✓ Queue is empty after consumption")
 
     finally:
-        await connection.close()
+        await channel.close()
 
 
-@pytest.mark.asyncio
-async def test_rabbitmq_exchange_types(rabbitmq_url: str) -> None:
+async def test_rabbitmq_exchange_types(
+    rabbitmq_connection: AbstractConnection,
+) -> None:
     """Test different RabbitMQ exchange types."""
     print("\nTesting RabbitMQ exchange types")
 
-    connection = await aio_pika.connect_robust(rabbitmq_url)
+    channel = await rabbitmq_connection.channel()
 
     try:
-        channel = await connection.channel()
-
         # Test Direct Exchange
         direct_exchange = await channel.declare_exchange(
             "test_direct", ExchangeType.DIRECT, auto_delete=True
@@ -136,19 +132,18 @@ async def test_rabbitmq_exchange_types(rabbitmq_url: str) -> None:
         print("✓ Bound queue to fanout exchange")
 
     finally:
-        await connection.close()
+        await channel.close()
 
 
-@pytest.mark.asyncio
-async def test_rabbitmq_topic_routing(rabbitmq_url: str) -> None:
+async def test_rabbitmq_topic_routing(
+    rabbitmq_connection: AbstractConnection,
+) -> None:
     """Test RabbitMQ topic exchange routing."""
     print("\nTesting RabbitMQ topic routing")
 
-    connection = await aio_pika.connect_robust(rabbitmq_url)
+    channel = await rabbitmq_connection.channel()
 
     try:
-        channel = await connection.channel()
-
         # Create topic exchange
         exchange = await channel.declare_exchange(
             "test_topic_routing", ExchangeType.TOPIC, auto_delete=True
@@ -201,20 +196,19 @@ async def test_rabbitmq_topic_routing(rabbitmq_url: str) -> None:
         print("✓ Queue3 received 1 message matching app.error")
 
     finally:
-        await connection.close()
+        await channel.close()
 
 
-@pytest.mark.asyncio
-async def test_rabbitmq_durable_queue(rabbitmq_url: str) -> None:
+async def test_rabbitmq_durable_queue(
+    rabbitmq_connection: AbstractConnection, rabbitmq_url: str
+) -> None:
     """Test RabbitMQ durable queue functionality."""
     print("\nTesting RabbitMQ durable queues")
 
-    # First connection - create queue and publish
-    connection1 = await aio_pika.connect_robust(rabbitmq_url)
+    # Shared connection - create queue and publish
+    channel1 = await rabbitmq_connection.channel()
 
     try:
-        channel1 = await connection1.channel()
-
         # Declare a durable queue
         queue = await channel1.declare_queue(
             "test_durable_queue", durable=True, auto_delete=False
@@ -231,11 +225,12 @@ async def test_rabbitmq_durable_queue(rabbitmq_url: str) -> None:
         )
         print("✓ Published persistent message")
 
-        # Close first connection
-        await connection1.close()
-        print("✓ Closed first connection")
+        # Close the publishing channel
+        await channel1.close()
+        print("✓ Closed publishing channel")
 
-        # Second connection - verify queue and message persist
+        # Separate connection - verify queue and message persist. This one
+        # stays robust, as durability is about surviving reconnects
         connection2 = await aio_pika.connect_robust(rabbitmq_url)
         channel2 = await connection2.channel()
 
@@ -264,54 +259,69 @@ async def test_rabbitmq_durable_queue(rabbitmq_url: str) -> None:
     except Exception as e:
         # Clean up on failure
         try:
-            cleanup_conn = await aio_pika.connect_robust(rabbitmq_url)
-            cleanup_channel = await cleanup_conn.channel()
+            cleanup_channel = await rabbitmq_connection.channel()
             cleanup_queue = await cleanup_channel.declare_queue(
                 "test_durable_queue", durable=True, auto_delete=False, passive=True
             )
             await cleanup_queue.delete()
-            await cleanup_conn.close()
+            await cleanup_channel.close()
         except Exception:
-            pass  # Queue might not exist or connection might be closed
+            pass  # Queue might not exist or channel might be closed
         raise e
 
 
-@pytest.mark.asyncio
-async def test_rabbitmq_concurrent_consumers(rabbitmq_url: str) -> None:
+async def test_rabbitmq_concurrent_consumers(
+    rabbitmq_connection: AbstractConnection,
+) -> None:
     """Test multiple consumers on the same queue."""
     print("\nTesting multiple consumers")
 
-    connection = await aio_pika.connect_robust(rabbitmq_url)
+    channel = await rabbitmq_connection.channel()
 
     try:
-        channel = await connection.channel()
-
         # Create a queue
         queue = await channel.declare_queue("test_concurrent", auto_delete=True)
 
         # Publish multiple messages
+        # Sent together so the publisher confirms overlap
         num_messages = 10
-        for i in range(num_messages):
-            await channel.default_exchange.publish(
-                Message(body=f"Message {i}".encode()), routing_key="test_concurrent"
+        await asyncio.gather(
+            *(
+                channel.default_exchange.publish(
+                    Message(body=f"Message {i}".encode()),
+                    routing_key="test_concurrent",
+                )
+                for i in range(num_messages)
             )
+        )
         print(f"✓ Published {num_messages} messages")
 
         # Create multiple consumers
         consumed_messages = []
 
+        # Let the broker push up to a full quota to each consumer
+        await channel.set_qos(prefetch_count=4)
+
         async def consume_messages(consumer_id: str, num_to_consume: int) -> None:
-            for _ in range(num_to_consume):
-                msg = await queue.get(timeout=2.0)
-                if msg:
-                    consumed_messages.append((consumer_id, msg.body.decode()))
-                    await msg.ack()
+            # Messages prefetched beyond the quota are requeued for the other
+            # consumers when the iterator closes
+            consumed = 0
+            async with queue.iterator() as messages:
+                async for msg in messages:
+                    async with msg.process():
+                        consumed_messages.append((consumer_id, msg.body.decode()))
+                    consumed += 1
+                    if consumed == num_to_consume:
+                        break
 
         # Run consumers concurrently
-        await asyncio.gather(
-            consume_messages("consumer1", 3),
-            consume_messages("consumer2", 3),
-            consume_messages("consumer3", 4),
+        await asyncio.wait_for(
+            asyncio.gather(
+                consume_messages("consumer1", 3),
+                consume_messages("consumer2", 3),
+                consume_messages("consumer3", 4),
+            ),
+            timeout=5.0,
         )
 
         assert (
@@ -327,4 +337,4 @@ async def test_rabbitmq_concurrent_consumers(rabbitmq_url: str) -> None:
         print(f"✓ Message distribution: {consumer_counts}")
 
     finally:
-        await connection.close()
+        await channel.close()
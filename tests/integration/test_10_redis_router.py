@@ -1,12 +1,28 @@
 """Integration tests for Redis router."""
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Dict, List, Callable, Optional
+from typing import AsyncGenerator, Dict, Generator, List, Callable, Optional
 from agent_communication.base import BaseMessage, BaseAgent
 from agent_communication.routers import RedisRouter
 
 
+def _cached_pattern_func(cls: type) -> Callable[[str, str], str]:
+    """Build the channel pattern function once per class and reuse it."""
+    cached = cls.__dict__.get("_cached_channel_pattern_func")
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
+    name = cls.__name__
+
+    def pattern_func(direction: str, session_id: str) -> str:
+        return f"{name}:{direction}:{session_id}"
+
+    setattr(cls, "_cached_channel_pattern_func", pattern_func)
+    return pattern_func
+
+
 class SampleMessage(BaseMessage):
     """Sample message for router tests."""
 
@@ -14,10 +30,7 @@ class SampleMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
-        def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
-
-        return pattern_func
+        return _cached_pattern_func(cls)
 
 
 class BroadcastMessage(BaseMessage):
@@ -27,15 +40,14 @@ class BroadcastMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
-        def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
-
-        return pattern_func
+        return _cached_pattern_func(cls)
 
 
 class SampleAgent(BaseAgent):
     """Test agent for router tests."""
 
+    __slots__ = ("received_messages", "received_contexts")
+
     messages = [SampleMessage, BroadcastMessage]
     sending_messages = [SampleMessage, BroadcastMessage]
 
@@ -49,9 +61,39 @@ class SampleAgent(BaseAgent):
         self.received_contexts.append(context)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="class")
 class TestRedisRouter:
-    """Test Redis router functionality."""
+    """Test Redis router functionality.
+
+    Tests share one started router and run on the class event loop it is
+    bound to; tests that need their own router configuration build one.
+    """
+
+    @pytest_asyncio.fixture(scope="class")
+    async def router_loop(self) -> asyncio.AbstractEventLoop:
+        """The class event loop, for driving async teardown from sync fixtures."""
+        return asyncio.get_running_loop()
+
+    @pytest_asyncio.fixture(scope="class")
+    async def shared_router(self, redis_url: str) -> AsyncGenerator[RedisRouter, None]:
+        """One router connected for the whole class."""
+        router = RedisRouter(url=redis_url)
+        await router.start()
+        yield router
+        await router.stop()
+
+    @pytest.fixture
+    def router(
+        self, shared_router: RedisRouter, router_loop: asyncio.AbstractEventLoop
+    ) -> Generator[RedisRouter, None, None]:
+        """The shared router, with its subscriptions reset after each test.
+
+        A sync fixture, since an async one would move the test onto a
+        per-test loop; the class loop is idle between tests, so the reset
+        runs on it directly.
+        """
+        yield shared_router
+        router_loop.run_until_complete(shared_router.reset_subscriptions())
 
     async def test_router_connect_disconnect(self, redis_url: str) -> None:
         """Test basic connection and disconnection."""
@@ -64,11 +106,8 @@ class TestRedisRouter:
         await router.stop()
         assert router._running is False
 
-    async def test_subscribe_unsubscribe(self, redis_url: str) -> None:
+    async def test_subscribe_unsubscribe(self, router: RedisRouter) -> None:
         """Test agent subscription and unsubscription."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         agent = SampleAgent(router)
         pattern = "SampleMessage:*:*"
 
@@ -79,22 +118,21 @@ class TestRedisRouter:
         await router.unsubscribe(agent, pattern)
         assert pattern not in router._subscriptions
 
-        await router.stop()
-
-    async def test_publish_and_receive(self, redis_url: str) -> None:
+    async def test_publish_and_receive(self, router: RedisRouter) -> None:
         """Test publishing and receiving messages."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         agent = SampleAgent(router)
         await agent.subscribe("SampleMessage:request:*")
 
-        await asyncio.sleep(0.1)
+        await router.flush_subscriptions()
 
         message = SampleMessage(content="Hello Redis")
         await router.publish(message, "SampleMessage:request:session123")
 
-        await asyncio.sleep(0.2)
+        # Poll for delivery instead of sleeping a fixed interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0
+        while not agent.received_messages and loop.time() < deadline:
+            await asyncio.sleep(0.01)
 
         assert len(agent.received_messages) == 1
         assert isinstance(agent.received_messages[0], SampleMessage)
@@ -102,13 +140,8 @@ class TestRedisRouter:
         assert agent.received_contexts[0]["session_id"] == "session123"
         assert agent.received_contexts[0]["direction"] == "request"
 
-        await router.stop()
-
-    async def test_broadcast_to_multiple_agents(self, redis_url: str) -> None:
+    async def test_broadcast_to_multiple_agents(self, router: RedisRouter) -> None:
         """Test broadcasting to multiple subscribed agents."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         agent1 = SampleAgent(router)
         agent2 = SampleAgent(router)
         agent3 = SampleAgent(router)
@@ -117,7 +150,7 @@ class TestRedisRouter:
         await router.subscribe(agent2, "BroadcastMessage:*:*")
         await router.subscribe(agent3, "BroadcastMessage:response:*")
 
-        await asyncio.sleep(0.1)
+        await router.flush_subscriptions()
 
         message = BroadcastMessage(data="Broadcast data")
         await router.broadcast(message, "response", "broadcast123")
@@ -136,20 +169,15 @@ class TestRedisRouter:
             if isinstance(msg, BroadcastMessage)
         )
 
-        await router.stop()
-
-    async def test_pattern_matching(self, redis_url: str) -> None:
+    async def test_pattern_matching(self, router: RedisRouter) -> None:
         """Test pattern matching for subscriptions."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         specific_agent = SampleAgent(router)
         wildcard_agent = SampleAgent(router)
 
         await router.subscribe(specific_agent, "SampleMessage:request:session456")
         await router.subscribe(wildcard_agent, "SampleMessage:*:*")
 
-        await asyncio.sleep(0.1)
+        await router.flush_subscriptions()
 
         message = SampleMessage(content="Pattern test")
         await router.publish(message, "SampleMessage:request:session456")
@@ -166,13 +194,8 @@ class TestRedisRouter:
         assert len(specific_agent.received_messages) == 1
         assert len(wildcard_agent.received_messages) == 2
 
-        await router.stop()
-
-    async def test_auto_subscribe(self, redis_url: str) -> None:
+    async def test_auto_subscribe(self, router: RedisRouter) -> None:
         """Test automatic subscription based on agent's message types."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         agent = SampleAgent(router)
         await router.auto_subscribe_agent(agent)
 
@@ -181,13 +204,8 @@ class TestRedisRouter:
         assert agent in router._subscriptions["SampleMessage:*:*"]
         assert agent in router._subscriptions["BroadcastMessage:*:*"]
 
-        await router.stop()
-
-    async def test_agent_publish_validation(self, redis_url: str) -> None:
+    async def test_agent_publish_validation(self, router: RedisRouter) -> None:
         """Test that agents can only send allowed message types."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         class RestrictedAgent(BaseAgent):
             messages = [SampleMessage]
             sending_messages = []
@@ -206,24 +224,22 @@ class TestRedisRouter:
         with pytest.raises(ValueError, match="not allowed to send"):
             await agent.publish(message, "SampleMessage:request:test")
 
-        await router.stop()
-
-    async def test_concurrent_messages(self, redis_url: str) -> None:
+    async def test_concurrent_messages(self, router: RedisRouter) -> None:
         """Test handling multiple concurrent messages."""
-        router = RedisRouter(url=redis_url)
-        await router.start()
-
         agent = SampleAgent(router)
         await router.subscribe(agent, "SampleMessage:*:*")
 
-        await asyncio.sleep(0.1)
-
-        tasks = []
-        for i in range(10):
-            message = SampleMessage(content=f"Message {i}")
-            tasks.append(router.publish(message, f"SampleMessage:request:session{i}"))
-
-        await asyncio.gather(*tasks)
+        await router.flush_subscriptions()
+
+        # Serialize up front, then send one pipelined flush for the whole batch
+        payloads = [
+            (
+                f"SampleMessage:request:session{i}",
+                router.serialize(SampleMessage(content=f"Message {i}")),
+            )
+            for i in range(10)
+        ]
+        await router.publish_raw_many(payloads)
         await asyncio.sleep(0.5)
 
         assert len(agent.received_messages) == 10
@@ -236,4 +252,56 @@ class TestRedisRouter:
         expected = {f"Message {i}" for i in range(10)}
         assert contents == expected
 
+    async def test_threaded_listener(self, redis_url: str) -> None:
+        """Test messages read on the listener thread reach agents in order."""
+        router = RedisRouter(url=redis_url, threaded_listener=True)
+        await router.start()
+
+        agent = SampleAgent(router)
+        await router.subscribe(agent, "SampleMessage:*:*")
+
+        await router.flush_subscriptions()
+
+        await router.publish_many(
+            (
+                SampleMessage(content=f"Message {i}"),
+                f"SampleMessage:request:session{i}",
+            )
+            for i in range(5)
+        )
+
+        await asyncio.sleep(0.5)
+
+        assert [
+            msg.content
+            for msg in agent.received_messages
+            if isinstance(msg, SampleMessage)
+        ] == [f"Message {i}" for i in range(5)]
+
+        await router.stop()
+        assert router._listener_thread is None
+
+    async def test_bounded_publish_pool(self, redis_url: str) -> None:
+        """Test concurrent publishes wait for a free pooled connection."""
+        router = RedisRouter(url=redis_url, max_publish_connections=2)
+        await router.start()
+
+        agent = SampleAgent(router)
+        await router.subscribe(agent, "SampleMessage:*:*")
+
+        await router.flush_subscriptions()
+
+        await asyncio.gather(
+            *(
+                router.publish(
+                    SampleMessage(content=f"Message {i}"),
+                    f"SampleMessage:request:session{i}",
+                )
+                for i in range(10)
+            )
+        )
+        await asyncio.sleep(0.5)
+
+        assert len(agent.received_messages) == 10
+
         await router.stop()
@@ -1,12 +1,38 @@
 """Integration tests for RabbitMQ router."""
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Dict, List, Callable, Optional
+import uuid
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Callable,
+    Optional,
+    Type,
+)
 from agent_communication.base import BaseMessage, BaseAgent
 from agent_communication.routers import RabbitMQRouter
 
 
+def _cached_pattern_func(cls: type) -> Callable[[str, str], str]:
+    """Build the channel pattern function once per class and reuse it."""
+    cached = cls.__dict__.get("_cached_channel_pattern_func")
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
+    name = cls.__name__
+
+    def pattern_func(direction: str, session_id: str) -> str:
+        return f"{name}:{direction}:{session_id}"
+
+    setattr(cls, "_cached_channel_pattern_func", pattern_func)
+    return pattern_func
+
+
 class QueueMessage(BaseMessage):
     """Message for RabbitMQ queue tests."""
 
@@ -15,10 +41,7 @@ class QueueMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
-        def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
-
-        return pattern_func
+        return _cached_pattern_func(cls)
 
 
 class TopicMessage(BaseMessage):
@@ -29,15 +52,19 @@ class TopicMessage(BaseMessage):
 
     @classmethod
     def get_channel_pattern(cls) -> Callable[[str, str], str]:
-        def pattern_func(direction: str, session_id: str) -> str:
-            return f"{cls.__name__}:{direction}:{session_id}"
-
-        return pattern_func
+        return _cached_pattern_func(cls)
 
 
 class SampleRabbitAgent(BaseAgent):
     """Test agent for RabbitMQ tests."""
 
+    __slots__ = (
+        "received_messages",
+        "received_contexts",
+        "by_type",
+        "_message_arrived",
+    )
+
     messages = [QueueMessage, TopicMessage]
     sending_messages = [QueueMessage, TopicMessage]
 
@@ -45,57 +72,80 @@ class SampleRabbitAgent(BaseAgent):
         super().__init__(router)
         self.received_messages: List[BaseMessage] = []
         self.received_contexts: List[Dict[str, str]] = []
+        # Received messages bucketed by exact class, filled as they arrive
+        self.by_type: Dict[Type[BaseMessage], List[Any]] = {}
+        self._message_arrived = asyncio.Event()
 
     def handle_message(self, message: BaseMessage, context: Dict[str, str]) -> None:
         self.received_messages.append(message)
         self.received_contexts.append(context)
+        self.by_type.setdefault(type(message), []).append(message)
+        self._message_arrived.set()
 
+    async def wait_for_messages(self, count: int, timeout: float = 5.0) -> None:
+        """Wait until at least count messages arrived or the timeout passes.
 
-@pytest.mark.asyncio
-class TestRabbitMQRouter:
-    """Test RabbitMQ router functionality."""
+        Returns quietly on timeout so the caller's assertions report what
+        actually arrived.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                while len(self.received_messages) < count:
+                    self._message_arrived.clear()
+                    await self._message_arrived.wait()
+        except TimeoutError:
+            pass
 
-    async def test_router_connect_disconnect(self, rabbitmq_url: str) -> None:
-        """Test basic connection and disconnection."""
-        router = RabbitMQRouter(url=rabbitmq_url)
 
+@pytest.mark.asyncio(scope="class")
+class TestRabbitMQRouter:
+    """Test RabbitMQ router functionality.
+
+    Tests share one started router on an exchange unique to the run, and
+    run on the class event loop it is bound to; tests that need their own
+    router configuration build one. ``subscribe`` returns once the broker
+    has confirmed the queue binding, so tests publish straight after it.
+    """
+
+    @pytest_asyncio.fixture(scope="class")
+    async def router_loop(self) -> asyncio.AbstractEventLoop:
+        """The class event loop, for driving async teardown from sync fixtures."""
+        return asyncio.get_running_loop()
+
+    @pytest_asyncio.fixture(scope="class")
+    async def shared_router(
+        self, rabbitmq_url: str
+    ) -> AsyncGenerator[RabbitMQRouter, None]:
+        """One router connected for the whole class."""
+        router = RabbitMQRouter(
+            url=rabbitmq_url, exchange_name=f"test_shared_{uuid.uuid4().hex}"
+        )
         await router.start()
-        assert router._running is True
-        assert await router.health_check() is True
-
+        yield router
         await router.stop()
-        assert router._running is False
-
-    async def test_durable_queue_creation(self, rabbitmq_url: str) -> None:
-        """Test that durable queues are created correctly."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_exchange")
-        await router.start()
-
-        agent = SampleRabbitAgent(router)
-        pattern = "QueueMessage:request:*"
 
-        await router.subscribe(agent, pattern)
-        assert pattern in router._queues
-
-        queue = router._queues[pattern]
-        assert queue is not None
+    @pytest.fixture
+    def router(
+        self, shared_router: RabbitMQRouter, router_loop: asyncio.AbstractEventLoop
+    ) -> Generator[RabbitMQRouter, None, None]:
+        """The shared router, with its subscriptions reset after each test.
 
-        await router.stop()
+        A sync fixture, since an async one would move the test onto a
+        per-test loop; the class loop is idle between tests, so the reset
+        runs on it directly.
+        """
+        yield shared_router
+        router_loop.run_until_complete(shared_router.reset_subscriptions())
 
-    async def test_publish_and_receive(self, rabbitmq_url: str) -> None:
+    async def test_publish_and_receive(self, router: RabbitMQRouter) -> None:
         """Test publishing and receiving messages through RabbitMQ."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_pubsub")
-        await router.start()
-
         agent = SampleRabbitAgent(router)
         await agent.subscribe("QueueMessage:request:*")
 
-        await asyncio.sleep(0.5)
-
         message = QueueMessage(payload="Hello RabbitMQ", priority=1)
         await router.publish(message, "QueueMessage:request:rabbit123")
 
-        await asyncio.sleep(1.0)
+        await agent.wait_for_messages(1)
 
         assert len(agent.received_messages) == 1
         assert isinstance(agent.received_messages[0], QueueMessage)
@@ -103,13 +153,8 @@ class TestRabbitMQRouter:
         assert agent.received_messages[0].priority == 1
         assert agent.received_contexts[0]["session_id"] == "rabbit123"
 
-        await router.stop()
-
-    async def test_topic_exchange_routing(self, rabbitmq_url: str) -> None:
+    async def test_topic_exchange_routing(self, router: RabbitMQRouter) -> None:
         """Test topic exchange pattern matching."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_topic")
-        await router.start()
-
         agent1 = SampleRabbitAgent(router)
         agent2 = SampleRabbitAgent(router)
         agent3 = SampleRabbitAgent(router)
@@ -118,26 +163,22 @@ class TestRabbitMQRouter:
         await router.subscribe(agent2, "TopicMessage:request:*")
         await router.subscribe(agent3, "TopicMessage:response:session999")
 
-        await asyncio.sleep(0.5)
-
         message1 = TopicMessage(topic="orders", content="New order")
         await router.publish(message1, "TopicMessage:request:session777")
 
         message2 = TopicMessage(topic="payments", content="Payment received")
         await router.publish(message2, "TopicMessage:response:session999")
 
-        await asyncio.sleep(1.0)
+        # All three agents share the router's queue, so once the catch-all
+        # agent has both messages every other delivery has been dispatched
+        await agent1.wait_for_messages(2)
 
         assert len(agent1.received_messages) == 2
         assert len(agent2.received_messages) == 1
         assert len(agent3.received_messages) == 1
 
-        assert isinstance(agent2.received_messages[0], TopicMessage)
-        assert agent2.received_messages[0].content == "New order"
-        assert isinstance(agent3.received_messages[0], TopicMessage)
-        assert agent3.received_messages[0].content == "Payment received"
-
-        await router.stop()
+        assert agent2.by_type[TopicMessage][0].content == "New order"
+        assert agent3.by_type[TopicMessage][0].content == "Payment received"
 
     async def test_message_persistence(self, rabbitmq_url: str) -> None:
         """Test that messages are persisted in durable queues."""
@@ -147,23 +188,20 @@ class TestRabbitMQRouter:
         agent1 = SampleRabbitAgent(router1)
         await router1.subscribe(agent1, "QueueMessage:persist:*")
 
-        await asyncio.sleep(0.5)
-
         await router1.disconnect()
 
         router2 = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_persist")
         await router2.start()
 
         message = QueueMessage(payload="Persistent message", priority=5)
+        # Publisher confirms mean the message is queued once publish returns
         await router2.publish(message, "QueueMessage:persist:test123")
 
-        await asyncio.sleep(0.5)
-
         router1 = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_persist")
         await router1.start()
         await router1.subscribe(agent1, "QueueMessage:persist:*")
 
-        await asyncio.sleep(1.0)
+        await agent1.wait_for_messages(1)
 
         assert len(agent1.received_messages) == 1
         assert isinstance(agent1.received_messages[0], QueueMessage)
@@ -172,56 +210,69 @@ class TestRabbitMQRouter:
         await router1.stop()
         await router2.stop()
 
-    async def test_broadcast_fanout(self, rabbitmq_url: str) -> None:
-        """Test broadcasting to multiple agents."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_fanout")
-        await router.start()
+    async def test_routers_on_one_exchange_do_not_compete(
+        self, rabbitmq_url: str
+    ) -> None:
+        """Test routers sharing an exchange each get their own queue."""
+        exchange_name = f"test_two_routers_{uuid.uuid4().hex}"
+        router1 = RabbitMQRouter(url=rabbitmq_url, exchange_name=exchange_name)
+        router2 = RabbitMQRouter(url=rabbitmq_url, exchange_name=exchange_name)
+        await router1.start()
+        await router2.start()
+
+        agent1 = SampleRabbitAgent(router1)
+        agent2 = SampleRabbitAgent(router2)
+        await router1.subscribe(agent1, "QueueMessage:*:*")
+        await router2.subscribe(agent2, "TopicMessage:*:*")
 
+        for i in range(5):
+            await router1.publish(
+                QueueMessage(payload=f"Queued {i}"), f"QueueMessage:test:s{i}"
+            )
+            await router1.publish(
+                TopicMessage(topic="t", content=f"Topic {i}"),
+                f"TopicMessage:test:s{i}",
+            )
+
+        await agent1.wait_for_messages(5)
+        await agent2.wait_for_messages(5)
+
+        assert {msg.payload for msg in agent1.by_type[QueueMessage]} == {
+            f"Queued {i}" for i in range(5)
+        }
+        assert {msg.content for msg in agent2.by_type[TopicMessage]} == {
+            f"Topic {i}" for i in range(5)
+        }
+        assert set(agent1.by_type) == {QueueMessage}
+        assert set(agent2.by_type) == {TopicMessage}
+
+        await router1.stop()
+        await router2.stop()
+
+    async def test_broadcast_fanout(self, router: RabbitMQRouter) -> None:
+        """Test broadcasting to multiple agents."""
         agents = [SampleRabbitAgent(router) for _ in range(3)]
 
         for agent in agents:
             await router.subscribe(agent, "TopicMessage:broadcast:*")
 
-        await asyncio.sleep(0.5)
-
         message = TopicMessage(topic="announcement", content="System update")
         await router.broadcast(message, "broadcast", "all")
 
-        await asyncio.sleep(1.0)
+        for agent in agents:
+            await agent.wait_for_messages(1)
 
         for agent in agents:
             assert len(agent.received_messages) == 1
             assert isinstance(agent.received_messages[0], TopicMessage)
             assert agent.received_messages[0].content == "System update"
 
-        await router.stop()
-
-    async def test_auto_subscribe(self, rabbitmq_url: str) -> None:
-        """Test automatic subscription based on agent's message types."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_auto")
-        await router.start()
-
-        agent = SampleRabbitAgent(router)
-        await router.auto_subscribe_agent(agent)
-
-        assert "QueueMessage:*:*" in router._subscriptions
-        assert "TopicMessage:*:*" in router._subscriptions
-        assert agent in router._subscriptions["QueueMessage:*:*"]
-        assert agent in router._subscriptions["TopicMessage:*:*"]
-
-        await router.stop()
-
-    async def test_queue_purge(self, rabbitmq_url: str) -> None:
+    async def test_queue_purge(self, router: RabbitMQRouter) -> None:
         """Test purging messages from a queue."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_purge")
-        await router.start()
-
         agent = SampleRabbitAgent(router)
         pattern = "QueueMessage:purge:test"
         await router.subscribe(agent, pattern)
 
-        await asyncio.sleep(0.5)
-
         for i in range(5):
             message = QueueMessage(payload=f"Message {i}", priority=i)
             await router.publish(message, "QueueMessage:purge:test")
@@ -234,42 +285,60 @@ class TestRabbitMQRouter:
         await asyncio.sleep(0.5)
         assert len(agent.received_messages) <= 5
 
-        await router.stop()
-
-    async def test_concurrent_processing(self, rabbitmq_url: str) -> None:
-        """Test handling multiple concurrent messages."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_concurrent")
+    @pytest.mark.parametrize("prefetch_count", [10, 100, 1000])
+    async def test_concurrent_processing(
+        self, rabbitmq_url: str, prefetch_count: int
+    ) -> None:
+        """Test a burst larger than the prefetch window is fully delivered."""
+        router = RabbitMQRouter(
+            url=rabbitmq_url,
+            exchange_name="test_concurrent",
+            prefetch_count=prefetch_count,
+        )
         await router.start()
 
         agent = SampleRabbitAgent(router)
         await router.subscribe(agent, "QueueMessage:*:*")
 
-        await asyncio.sleep(0.5)
-
+        num_messages = 50
         tasks = []
-        for i in range(20):
+        for i in range(num_messages):
             message = QueueMessage(payload=f"Concurrent {i}", priority=i % 3)
             tasks.append(router.publish(message, f"QueueMessage:test:session{i}"))
 
         await asyncio.gather(*tasks)
-        await asyncio.sleep(2.0)
+        await agent.wait_for_messages(num_messages)
 
-        assert len(agent.received_messages) == 20
+        assert len(agent.received_messages) == num_messages
 
-        payloads = {
-            msg.payload
-            for msg in agent.received_messages
-            if isinstance(msg, QueueMessage)
-        }
-        expected = {f"Concurrent {i}" for i in range(20)}
+        payloads = {msg.payload for msg in agent.by_type[QueueMessage]}
+        expected = {f"Concurrent {i}" for i in range(num_messages)}
         assert payloads == expected
 
         await router.stop()
 
-    async def test_message_acknowledgment(self, rabbitmq_url: str) -> None:
+    async def test_publish_batch_confirms(self, router: RabbitMQRouter) -> None:
+        """Test a publish_many batch is confirmed as a whole and delivered."""
+        agent = SampleRabbitAgent(router)
+        await router.subscribe(agent, "QueueMessage:*:*")
+
+        # Every publish is written before any confirm is awaited, so the
+        # call returns once the broker has confirmed the whole batch
+        await router.publish_many(
+            (
+                QueueMessage(payload=f"Batched {i}"),
+                f"QueueMessage:test:session{i}",
+            )
+            for i in range(50)
+        )
+        await agent.wait_for_messages(50)
+
+        assert {msg.payload for msg in agent.by_type[QueueMessage]} == {
+            f"Batched {i}" for i in range(50)
+        }
+
+    async def test_message_acknowledgment(self, router: RabbitMQRouter) -> None:
         """Test that messages are properly acknowledged."""
-        router = RabbitMQRouter(url=rabbitmq_url, exchange_name="test_ack")
-        await router.start()
 
         class FailingAgent(BaseAgent):
             messages = [QueueMessage]
@@ -281,24 +350,22 @@ class TestRabbitMQRouter:
                 super().__init__(router)
                 self.fail_count = fail_count
                 self.attempt_count = 0
+                self.attempted = asyncio.Event()
 
             def handle_message(
                 self, message: BaseMessage, context: Dict[str, str]
             ) -> None:
                 self.attempt_count += 1
+                self.attempted.set()
                 if self.attempt_count <= self.fail_count:
                     raise Exception("Simulated failure")
 
         agent = FailingAgent(router, fail_count=0)
         await router.subscribe(agent, "QueueMessage:ack:*")
 
-        await asyncio.sleep(0.5)
-
         message = QueueMessage(payload="Will succeed", priority=1)
         await router.publish(message, "QueueMessage:ack:test")
 
-        await asyncio.sleep(1.0)
+        await asyncio.wait_for(agent.attempted.wait(), 5.0)
 
         assert agent.attempt_count == 1
-
-        await router.stop()
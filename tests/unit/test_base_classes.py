@@ -1,7 +1,7 @@
 """Tests for BaseMessage and BaseAgent contracts."""
 
 import pytest
-from typing import Callable, Dict
+from typing import Any, Callable, Dict, List, Type
 from agent_communication.base import BaseMessage, BaseAgent
 
 
@@ -199,6 +199,187 @@ class TestBaseAgent:
         assert agent.validate_outgoing_message(allowed_msg) is True
         assert agent.validate_outgoing_message(not_allowed_msg) is False
 
+    def test_agent_refresh_message_sets(self) -> None:
+        """Test that runtime changes to message lists apply after a refresh."""
+
+        class LateMessage(BaseMessage):
+            data: str
+
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{cls.__name__}:{direction}:{session_id}"
+
+                return pattern_func
+
+        class TestAgent(BaseAgent):
+            messages: List[Type[BaseMessage]] = []
+            sending_messages: List[Type[BaseMessage]] = []
+
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                pass
+
+        agent = TestAgent()
+        message = LateMessage(data="test")
+        assert agent.validate_incoming_message(message) is False
+
+        assert agent.subscription_patterns() == []
+
+        TestAgent.messages = [*TestAgent.messages, LateMessage]
+        TestAgent.refresh_message_sets()
+
+        assert agent.validate_incoming_message(message) is True
+        assert agent.subscription_patterns() == ["LateMessage:*:*"]
+
+    def test_agent_warns_on_message_list_changes_without_refresh(self) -> None:
+        """Test that changing message lists without a refresh is reported."""
+
+        class LateMessage(BaseMessage):
+            data: str
+
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{cls.__name__}:{direction}:{session_id}"
+
+                return pattern_func
+
+        class TestAgent(BaseAgent):
+            messages: List[Type[BaseMessage]] = []
+            sending_messages: List[Type[BaseMessage]] = []
+
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                pass
+
+        class UnslottedAgent(TestAgent):
+            pass
+
+        message = LateMessage(data="test")
+
+        # Set on an instance
+        agent = UnslottedAgent()
+        agent.messages = [LateMessage]
+        with pytest.warns(RuntimeWarning, match="refresh_message_sets"):
+            assert agent.validate_incoming_message(message) is False
+
+        # Mutated in place on the class
+        agent = TestAgent()
+        TestAgent.sending_messages.append(LateMessage)
+        with pytest.warns(RuntimeWarning, match="refresh_message_sets"):
+            assert agent.validate_outgoing_message(message) is False
+        with pytest.warns(RuntimeWarning, match="refresh_message_sets"):
+            agent.subscription_patterns()
+
+        TestAgent.refresh_message_sets()
+        assert agent.validate_outgoing_message(message) is True
+
+    def test_agent_subclass_overriding_messages_gets_own_patterns(self) -> None:
+        """Test that a subclass overriding messages does not reuse its parent's patterns."""
+
+        def make_message(name: str) -> Type[BaseMessage]:
+            def get_channel_pattern(cls: Type[BaseMessage]) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{cls.__name__}:{direction}:{session_id}"
+
+                return pattern_func
+
+            return type(
+                name,
+                (BaseMessage,),
+                {
+                    "__annotations__": {"data": str},
+                    "get_channel_pattern": classmethod(get_channel_pattern),
+                },
+            )
+
+        ParentMessage = make_message("ParentMessage")
+        ChildMessage = make_message("ChildMessage")
+
+        class ParentAgent(BaseAgent):
+            messages: List[Type[BaseMessage]] = [ParentMessage]
+            sending_messages: List[Type[BaseMessage]] = []
+
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                pass
+
+        class ChildAgent(ParentAgent):
+            messages: List[Type[BaseMessage]] = [ChildMessage]
+
+        assert ParentAgent().subscription_patterns() == ["ParentMessage:*:*"]
+        assert ChildAgent().subscription_patterns() == ["ChildMessage:*:*"]
+        assert ParentAgent().subscription_patterns() == ["ParentMessage:*:*"]
+
+    def test_agent_patterns_built_on_first_use(self) -> None:
+        """Test defining an agent class does not build its channel patterns."""
+        calls: List[str] = []
+
+        class CountedMessage(BaseMessage):
+            data: str
+
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                calls.append(cls.__name__)
+
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{cls.__name__}:{direction}:{session_id}"
+
+                return pattern_func
+
+        class TestAgent(BaseAgent):
+            messages = [CountedMessage]
+            sending_messages: List[Type[BaseMessage]] = []
+
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                pass
+
+        assert calls == []
+
+        agent = TestAgent()
+        assert agent.subscription_patterns() == ["CountedMessage:*:*"]
+        assert agent.subscription_patterns() == ["CountedMessage:*:*"]
+        assert calls == ["CountedMessage"]
+
+    def test_agent_slots(self) -> None:
+        """Test agents declaring __slots__ carry no per-instance __dict__."""
+
+        class SlottedAgent(BaseAgent):
+            __slots__ = ("received",)
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.received: List[BaseMessage] = []
+
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                self.received.append(message)
+
+        class PlainAgent(BaseAgent):
+            def handle_message(
+                self, message: BaseMessage, context: Dict[str, str]
+            ) -> None:
+                pass
+
+        agent = SlottedAgent()
+
+        assert not hasattr(agent, "__dict__")
+        assert agent.received == []
+        assert agent._router is None
+        with pytest.raises(AttributeError):
+            agent.extra = True  # type: ignore[attr-defined]
+
+        plain = PlainAgent()
+        plain.extra = True  # type: ignore[attr-defined]
+        assert plain.extra is True  # type: ignore[attr-defined]
+
     def test_agent_handle_message_receives_context(self) -> None:
         """Test that handle_message receives message and context."""
 
@@ -238,3 +419,99 @@ class TestBaseAgent:
         assert received_context == context
         assert received_message.data == "test_data"  # type: ignore[attr-defined]
         assert received_context["session_id"] == "abc123"
+
+
+class TestMessageMixin:
+    """Test the default channel pattern provided by MessageMixin."""
+
+    def test_channel_pattern_is_cached_per_class(self) -> None:
+        """Test the pattern function is built once and not shared by subclasses."""
+        from agent_communication.protocols import MessageMixin
+
+        class AudioMessage(MessageMixin):
+            pass
+
+        class VideoMessage(AudioMessage):
+            pass
+
+        audio_pattern = AudioMessage.get_channel_pattern()
+
+        assert AudioMessage.get_channel_pattern() is audio_pattern
+        assert audio_pattern("request", "abc") == "AudioMessage:request:abc"
+        assert (
+            VideoMessage.get_channel_pattern()("request", "abc")
+            == "VideoMessage:request:abc"
+        )
+
+
+class TestFastMessage:
+    """Test the slots-based FastMessage base class."""
+
+    def test_fast_message_fields_and_dump(self) -> None:
+        """Test fields are collected from slots across the hierarchy."""
+        import json
+
+        from agent_communication.protocols import FastMessage, MessageProtocol
+
+        class TelemetryMessage(FastMessage):
+            __slots__ = ("sensor", "value")
+
+        class TaggedTelemetryMessage(TelemetryMessage):
+            __slots__ = ("tag",)
+
+        message = TaggedTelemetryMessage(sensor="cpu", value=0.5, tag="host1")
+
+        assert not hasattr(message, "__dict__")
+        assert isinstance(message, MessageProtocol)
+        assert message.model_dump() == {"sensor": "cpu", "value": 0.5, "tag": "host1"}
+        assert json.loads(message.model_dump_json()) == message.model_dump()
+        assert message == TaggedTelemetryMessage(**message.model_dump())
+        assert (
+            message.get_channel_pattern()("request", "abc")
+            == "TaggedTelemetryMessage:request:abc"
+        )
+
+    def test_is_message_checks_protocol_conformance(self) -> None:
+        """Test is_message accepts message implementations only."""
+        from agent_communication.protocols import FastMessage, is_message
+
+        class TelemetryMessage(FastMessage):
+            __slots__ = ("sensor",)
+
+        class PydanticMessage(BaseMessage):
+            data: str
+
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{cls.__name__}:{direction}:{session_id}"
+
+                return pattern_func
+
+        class DumpOnly:
+            """Serializes like a message but has no channel pattern."""
+
+            def model_dump(self) -> Dict[str, Any]:
+                return {}
+
+            def model_dump_json(self) -> str:
+                return "{}"
+
+        assert is_message(TelemetryMessage(sensor="cpu"))
+        assert is_message(PydanticMessage(data="x"))
+        assert not is_message("not a message")
+        assert not is_message(DumpOnly())
+        # Decided once per type; later instances reuse the cached answer
+        assert not is_message(DumpOnly())
+
+    def test_fast_message_rejects_missing_and_unknown_fields(self) -> None:
+        """Test construction validates the set of field names."""
+        from agent_communication.protocols import FastMessage
+
+        class TelemetryMessage(FastMessage):
+            __slots__ = ("sensor", "value")
+
+        with pytest.raises(TypeError, match="value"):
+            TelemetryMessage(sensor="cpu")
+        with pytest.raises(TypeError, match="extra"):
+            TelemetryMessage(sensor="cpu", value=1, extra=True)
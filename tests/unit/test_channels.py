@@ -0,0 +1,193 @@
+import pytest
+
+
+class TestChannelPatternMatching:
+    """Test ChannelManager pattern matching semantics."""
+
+    @pytest.mark.parametrize(
+        "channel,pattern,expected",
+        [
+            ("Audio:request:abc", "Audio:request:abc", True),
+            ("Audio:request:abc", "Audio:*:*", True),
+            ("Audio:request:abc", "*:*:abc", True),
+            ("Audio:request:abc", "Audio:*:xyz", False),
+            ("Audio:request:abc", "Video:*:*", False),
+            ("Audio:request:abc", "Audio:*", False),
+            ("Audio:request:abc", "Audio:**", True),
+            ("Audio:request:abc", "**", True),
+            ("Audio", "Audio:**", False),
+            ("Audio:request:abc", "Aud*:*:*", True),
+            ("Audio:request:abc", "Vid*:*:*", False),
+            ("Audio:request:abc", "*:re*st:*c", True),
+            ("Audio:request:abc", "*:re*q*q:*", False),
+        ],
+    )
+    def test_match_pattern(self, channel: str, pattern: str, expected: bool) -> None:
+        """Test literal, single-segment and multi-segment wildcard matching."""
+        from agent_communication.channels import ChannelManager
+
+        assert ChannelManager.match_pattern(channel, pattern) is expected
+
+    def test_double_wildcard_only_allowed_as_last_segment(self) -> None:
+        """Test that ** in any other position is rejected."""
+        from agent_communication.channels import ChannelManager, ChannelRouter
+
+        with pytest.raises(ValueError, match="last segment"):
+            ChannelManager.match_pattern("Audio:request:abc", "**:abc")
+        with pytest.raises(ValueError, match="last segment"):
+            ChannelManager.compile_pattern("Audio:**:abc")
+        with pytest.raises(ValueError, match="last segment"):
+            ChannelRouter().add_route("Audio:req**", ["Archive:request:*"])
+
+    def test_single_wildcard_does_not_span_segments(self) -> None:
+        """Test that * only ever matches within one segment."""
+        from agent_communication.channels import ChannelManager
+
+        assert not ChannelManager.match_pattern("Audio:request:abc", "*:abc")
+        assert not ChannelManager.match_pattern("Audio:request:abc", "Audio*")
+
+
+class TestChannelRouter:
+    """Test ChannelRouter route lookup."""
+
+    def test_get_routes_collects_targets_from_matching_patterns(self) -> None:
+        """Test that targets from every matching source pattern are merged."""
+        from agent_communication.channels import ChannelRouter
+
+        router = ChannelRouter()
+        router.add_route("Audio:*:*", ["Transcribe:request:*"])
+        router.add_route("Audio:request:abc", ["Archive:request:abc"])
+        router.add_route("Audio:request:abc", ["Transcribe:request:*"])
+        router.add_route("Video:*:*", ["Encode:request:*"])
+
+        assert sorted(router.get_routes("Audio:request:abc")) == [
+            "Archive:request:abc",
+            "Transcribe:request:*",
+        ]
+        assert router.get_routes("Audio:response:xyz") == ["Transcribe:request:*"]
+        assert router.get_routes("Text:request:abc") == []
+
+    def test_get_routes_with_wildcard_message_class(self) -> None:
+        """Test routes whose message class segment is a wildcard."""
+        from agent_communication.channels import ChannelRouter
+
+        router = ChannelRouter()
+        router.add_route("*:request:*", ["Audit:request:*"])
+        router.add_route("*:*:abc", ["Session:request:abc"])
+        router.add_route("**", ["Firehose:request:*"])
+
+        assert sorted(router.get_routes("Audio:request:abc")) == [
+            "Audit:request:*",
+            "Firehose:request:*",
+            "Session:request:abc",
+        ]
+        assert router.get_routes("Audio:response:xyz") == ["Firehose:request:*"]
+
+        router.add_route("*:response:*", ["Audit:response:*"])
+
+        assert sorted(router.get_routes("Audio:response:xyz")) == [
+            "Audit:response:*",
+            "Firehose:request:*",
+        ]
+
+    def test_get_routes_deduplicates_in_route_order(self) -> None:
+        """Test duplicate targets are dropped while keeping first-seen order."""
+        from agent_communication.channels import ChannelRouter
+
+        router = ChannelRouter()
+        router.add_route("Audio:request:abc", ["B:request:*", "A:request:*"])
+        router.add_route("Audio:request:abc", ["B:request:*"])
+        router.add_route("Audio:*:*", ["C:request:*", "A:request:*"])
+
+        assert router.get_routes("Audio:request:abc") == [
+            "B:request:*",
+            "A:request:*",
+            "C:request:*",
+        ]
+
+    def test_get_routes_keeps_registration_order_across_route_kinds(self) -> None:
+        """Test wildcard, class and exact routes come back in the order added."""
+        from agent_communication.channels import ChannelRouter
+
+        router = ChannelRouter()
+        router.add_route("*:*:abc", ["First:request:*"])
+        router.add_route("Audio:request:abc", ["Second:request:*"])
+        router.add_route("Audio:*:*", ["Third:request:*"])
+        router.add_route("*:request:*", ["Fourth:request:*"])
+        router.add_route("Audio:request:*", ["Fifth:request:*"])
+        # Extending an existing route keeps its original position
+        router.add_route("*:*:abc", ["Sixth:request:*"])
+
+        assert router.get_routes("Audio:request:abc") == [
+            "First:request:*",
+            "Sixth:request:*",
+            "Second:request:*",
+            "Third:request:*",
+            "Fourth:request:*",
+            "Fifth:request:*",
+        ]
+
+    def test_clear_routes(self) -> None:
+        """Test that clearing routes removes every rule."""
+        from agent_communication.channels import ChannelRouter
+
+        router = ChannelRouter()
+        router.add_route("*:*:*", ["Audit:request:*"])
+        router.clear_routes()
+
+        assert router.get_routes("Audio:request:abc") == []
+
+
+class TestChannelConstruction:
+    """Test ChannelManager channel name helpers."""
+
+    def test_create_channel(self) -> None:
+        """Test channel names are joined from their components."""
+        from agent_communication.channels import ChannelManager
+
+        assert ChannelManager.create_channel("Audio") == "Audio:request:*"
+        assert (
+            ChannelManager.create_channel("Audio", "response", "abc")
+            == "Audio:response:abc"
+        )
+
+    def test_create_response_channel(self) -> None:
+        """Test a request channel maps onto its response channel."""
+        from agent_communication.channels import ChannelManager
+
+        assert (
+            ChannelManager.create_response_channel("Audio:request:abc")
+            == "Audio:response:abc"
+        )
+        with pytest.raises(ValueError):
+            ChannelManager.create_response_channel("Audio:request")
+
+
+class TestChannelParsing:
+    """Test ChannelManager channel parsing helpers."""
+
+    def test_parse_channel_rejects_wrong_segment_count(self) -> None:
+        """Test parsing rejects channels without exactly three segments."""
+        from agent_communication.channels import ChannelManager
+        from agent_communication.exceptions import InvalidChannelFormat
+
+        with pytest.raises(InvalidChannelFormat):
+            ChannelManager.parse_channel("Audio:request")
+        with pytest.raises(ValueError):
+            ChannelManager.parse_channel("Audio:request:abc:extra")
+
+    def test_extract_session_id(self) -> None:
+        """Test session ids are extracted, ignoring wildcards and bad channels."""
+        from agent_communication.channels import ChannelManager
+
+        assert ChannelManager.extract_session_id("Audio:request:abc") == "abc"
+        assert ChannelManager.extract_session_id("Audio:request:*") is None
+        assert ChannelManager.extract_session_id("Audio") is None
+
+    def test_validate_channel_name(self) -> None:
+        """Test channel name validation."""
+        from agent_communication.channels import ChannelManager
+
+        assert ChannelManager.validate_channel_name("Audio:request:abc")
+        assert not ChannelManager.validate_channel_name("Audio:request")
+        assert not ChannelManager.validate_channel_name("a:b:c:d")
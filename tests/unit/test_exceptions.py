@@ -37,6 +37,16 @@ class TestExceptions:
         assert "Expected: 'Type:SubType:ID'" in str(error)
         assert error.expected_format == "Type:SubType:ID"
 
+    def test_invalid_channel_format_survives_pickling(self) -> None:
+        """Test the lazily formatted message is rebuilt after unpickling."""
+        import pickle
+
+        error = pickle.loads(pickle.dumps(InvalidChannelFormat("a:b", "X:Y:Z")))
+
+        assert error.channel == "a:b"
+        assert error.expected_format == "X:Y:Z"
+        assert "Expected: 'X:Y:Z'" in str(error)
+
     def test_message_class_not_registered_without_suggestions(self) -> None:
         """Test MessageClassNotRegistered without available classes."""
         error = MessageClassNotRegistered("UnknownMessage")
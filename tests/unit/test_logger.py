@@ -5,6 +5,8 @@ import logging
 from datetime import datetime
 from io import StringIO
 
+import pytest
+
 
 class TestJSONLineFormatter:
     """Test the JSON Lines formatter for logging."""
@@ -94,6 +96,37 @@ class TestJSONLineFormatter:
         dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
         assert dt.tzinfo is not None
 
+    def test_timestamp_comes_from_record_creation_time(self) -> None:
+        """Test that the timestamp reflects when the record was created."""
+        from agent_communication.logger import JSONLineFormatter
+
+        formatter = JSONLineFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1724772645.123456
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["timestamp"].startswith("2024-08-27T15:30:45.123")
+        assert parsed["timestamp"].endswith("Z")
+
+    def test_timestamps_within_and_across_seconds(self) -> None:
+        """Test the cached date and time part follows the record's second."""
+        from agent_communication.logger import _format_timestamp
+
+        assert _format_timestamp(1724772645.5) == "2024-08-27T15:30:45.500000Z"
+        assert _format_timestamp(1724772645.25) == "2024-08-27T15:30:45.250000Z"
+        assert _format_timestamp(1724772646.0) == "2024-08-27T15:30:46.000000Z"
+        assert _format_timestamp(1724772645.75) == "2024-08-27T15:30:45.750000Z"
+
     def test_extra_fields_included_in_output(self) -> None:
         """Test that extra fields from LogRecord are included in JSON."""
         from agent_communication.logger import JSONLineFormatter
@@ -122,6 +155,26 @@ class TestJSONLineFormatter:
         assert parsed["message_type"] == "AudioRequestMessage"
         assert parsed["session_id"] == "abc123"
 
+    def test_fields_set_by_other_formatters_are_skipped(self) -> None:
+        """Test attributes another handler's formatter adds are not extras."""
+        from agent_communication.logger import JSONLineFormatter
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Shared record",
+            args=(),
+            exc_info=None,
+        )
+        logging.Formatter("%(asctime)s %(message)s").format(record)
+
+        parsed = json.loads(JSONLineFormatter().format(record))
+
+        assert "asctime" not in parsed
+        assert parsed["message"] == "Shared record"
+
     def test_get_logger_returns_configured_logger(self) -> None:
         """Test that get_logger returns a properly configured logger."""
         from agent_communication.logger import get_logger, JSONLineFormatter
@@ -189,3 +242,99 @@ class TestJSONLineFormatter:
         assert json.loads(lines[0])["level"] == "INFO"
         assert json.loads(lines[1])["level"] == "WARNING"
         assert json.loads(lines[2])["level"] == "ERROR"
+
+
+    def test_log_records_read_back_line_by_line(self) -> None:
+        """Test JSON Lines output reads back from text and binary streams."""
+        from io import BytesIO
+
+        from agent_communication.logger import JSONLineFormatter, iter_log_records
+
+        buffer = StringIO()
+        handler = logging.StreamHandler(buffer)
+        handler.setFormatter(JSONLineFormatter())
+
+        logger = logging.getLogger("test_read_back")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        logger.info("First message", extra={"session_id": "abc"})
+        logger.error("Second message")
+        logger.removeHandler(handler)
+
+        output = buffer.getvalue() + "\n"
+        for stream in (StringIO(output), BytesIO(output.encode())):
+            records = list(iter_log_records(stream))
+
+            assert [record["message"] for record in records] == [
+                "First message",
+                "Second message",
+            ]
+            assert records[0]["session_id"] == "abc"
+            assert records[1]["level"] == "ERROR"
+
+class TestBufferedStreamHandler:
+    """Test batching of log lines into fewer writes."""
+
+    def test_lines_are_written_together(self) -> None:
+        """Test INFO lines wait for a full buffer; warnings write at once."""
+        from agent_communication.logger import BufferedStreamHandler
+
+        buffer = StringIO()
+        handler = BufferedStreamHandler(3, buffer, flush_interval=60.0)
+        logger = logging.getLogger("test_buffered")
+        logger.handlers.clear()
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        logger.info("first")
+        logger.info("second")
+        assert buffer.getvalue() == ""
+
+        logger.info("third")
+        assert buffer.getvalue().splitlines() == ["first", "second", "third"]
+
+        logger.info("fourth")
+        logger.warning("fifth")
+        assert buffer.getvalue().splitlines()[3:] == ["fourth", "fifth"]
+
+        logger.info("sixth")
+        handler.flush()
+        assert buffer.getvalue().splitlines()[-1] == "sixth"
+
+        logger.removeHandler(handler)
+
+
+class TestQueuedLogging:
+    """Test handing records to the background listener thread."""
+
+    def test_records_are_written_by_the_listener(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test queued records keep their extras and arrive once stopped."""
+        from agent_communication import logger as logger_module
+
+        buffer = StringIO()
+
+        def make_stream_handler() -> logging.Handler:
+            handler = logging.StreamHandler(buffer)
+            handler.setFormatter(logger_module.JSONLineFormatter())
+            return handler
+
+        monkeypatch.setattr(logger_module, "_LOG_QUEUE", True)
+        monkeypatch.setattr(logger_module, "_make_stream_handler", make_stream_handler)
+
+        logger = logger_module.get_logger("QueuedAgent")
+        try:
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+            logger.info("Queued %s", "message", extra={"agent_id": "queued_1"})
+            logger_module._stop_queue_listener()
+
+            parsed = json.loads(buffer.getvalue())
+            assert parsed["message"] == "Queued message"
+            assert parsed["agent_id"] == "queued_1"
+        finally:
+            logger.handlers.clear()
@@ -67,6 +67,21 @@ class TestMessageRouting:
         assert "invalid_channel" in str(exc_info.value)
         assert "Expected: 'MessageClass:direction:session_id'" in str(exc_info.value)
 
+    def test_parse_channel_rejects_wrong_segment_count(self) -> None:
+        """Test parsing channel requires exactly three segments."""
+        from agent_communication.utils import parse_channel
+        from agent_communication.exceptions import InvalidChannelFormat
+
+        for channel in ("Audio:request", "Audio:request:abc:extra", "::::"):
+            with pytest.raises(InvalidChannelFormat):
+                parse_channel(channel)
+
+        assert parse_channel("::") == {
+            "message_class": "",
+            "direction": "",
+            "session_id": "",
+        }
+
     def test_multiple_message_types_have_unique_patterns(self) -> None:
         """Test different message types generate unique channel patterns."""
         from agent_communication.base import BaseMessage
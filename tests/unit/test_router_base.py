@@ -0,0 +1,894 @@
+"""Tests for AbstractRouter subscription bookkeeping and delivery."""
+
+import asyncio
+
+import pytest
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import AsyncMock
+
+from agent_communication.base import BaseAgent, BaseMessage
+from agent_communication.exceptions import MessageClassNotRegistered
+from agent_communication.routers.base import AbstractRouter
+
+
+class RecordingRouter(AbstractRouter):
+    """In-process router that records backend calls instead of using a broker."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.published: List[Tuple[str, bytes]] = []
+        self.publish_batches: List[int] = []
+        self.subscribe_calls: List[List[str]] = []
+        self.unsubscribed: List[str] = []
+        self.unsubscribe_calls: List[List[str]] = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def _publish_raw(self, channel: str, data: bytes) -> None:
+        self.published.append((channel, data))
+
+    async def _publish_many_raw(self, messages: List[Tuple[str, bytes]]) -> None:
+        self.publish_batches.append(len(messages))
+        self.published.extend(messages)
+
+    async def _subscribe_raw(self, pattern: str) -> None:
+        self.subscribe_calls.append([pattern])
+
+    async def _subscribe_many_raw(self, patterns: List[str]) -> None:
+        self.subscribe_calls.append(list(patterns))
+
+    async def _unsubscribe_raw(self, pattern: str) -> None:
+        self.unsubscribe_calls.append([pattern])
+        self.unsubscribed.append(pattern)
+
+    async def _unsubscribe_many_raw(self, patterns: List[str]) -> None:
+        self.unsubscribe_calls.append(list(patterns))
+        self.unsubscribed.extend(patterns)
+
+
+class OrderMessage(BaseMessage):
+    order_id: str
+
+    @classmethod
+    def get_channel_pattern(cls) -> Callable[[str, str], str]:
+        def pattern_func(direction: str, session_id: str) -> str:
+            return f"{cls.__name__}:{direction}:{session_id}"
+
+        return pattern_func
+
+
+class InvoiceMessage(BaseMessage):
+    amount: float
+
+    @classmethod
+    def get_channel_pattern(cls) -> Callable[[str, str], str]:
+        def pattern_func(direction: str, session_id: str) -> str:
+            return f"{cls.__name__}:{direction}:{session_id}"
+
+        return pattern_func
+
+
+class OrderAgent(BaseAgent):
+    messages = [OrderMessage]
+    sending_messages = [InvoiceMessage]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.received: List[Tuple[BaseMessage, Dict[str, str]]] = []
+
+    def handle_message(self, message: BaseMessage, context: Dict[str, str]) -> None:
+        self.received.append((message, context))
+
+
+class BillingAgent(BaseAgent):
+    messages = [OrderMessage, InvoiceMessage]
+    sending_messages = []
+
+    def handle_message(self, message: BaseMessage, context: Dict[str, str]) -> None:
+        pass
+
+
+class TestAutoSubscribe:
+    """Test batched auto-subscription of agents."""
+
+    def test_agent_subscription_patterns(self) -> None:
+        """Test agents report one wildcard pattern per message type."""
+        assert BillingAgent().subscription_patterns() == [
+            "OrderMessage:*:*",
+            "InvoiceMessage:*:*",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_auto_subscribe_agents_batches_backend_calls(self) -> None:
+        """Test new patterns across agents are subscribed in one backend call."""
+        router = RecordingRouter()
+        order_agent = OrderAgent()
+        billing_agent = BillingAgent()
+
+        await router.auto_subscribe_agents([order_agent, billing_agent])
+
+        assert router.subscribe_calls == [["OrderMessage:*:*", "InvoiceMessage:*:*"]]
+        assert router._subscriptions["OrderMessage:*:*"] == {
+            order_agent,
+            billing_agent,
+        }
+        assert router._subscriptions["InvoiceMessage:*:*"] == {billing_agent}
+
+        await router.auto_subscribe_agent(OrderAgent())
+
+        assert len(router.subscribe_calls) == 1
+
+
+class TestBroadcast:
+    """Test channel selection when broadcasting."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_uses_message_channel_pattern(self) -> None:
+        """Test broadcast builds the channel from the message pattern."""
+        router = RecordingRouter()
+
+        await router.broadcast(OrderMessage(order_id="1"), "request", "abc")
+
+        assert [channel for channel, _ in router.published] == [
+            "OrderMessage:request:abc"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_with_channel_key(self) -> None:
+        """Test a pre-split channel key is joined instead of re-derived."""
+        router = RecordingRouter()
+        agent = OrderAgent(router=router)
+
+        await agent.broadcast(
+            InvoiceMessage(amount=1.0),
+            channel_key=("InvoiceMessage", "response", "abc"),
+        )
+
+        assert [channel for channel, _ in router.published] == [
+            "InvoiceMessage:response:abc"
+        ]
+
+    def test_make_channel_matches_pattern_function(self) -> None:
+        """Test cached channel prefixes agree with the pattern function."""
+
+        class SessionFirstMessage(BaseMessage):
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"{session_id}:{cls.__name__}:{direction}"
+
+                return pattern_func
+
+        for message_class in (OrderMessage, SessionFirstMessage):
+            pattern_func = message_class.get_channel_pattern()
+            for session_id in ("abc", "", "*"):
+                assert AbstractRouter.make_channel(
+                    message_class, "request", session_id
+                ) == pattern_func("request", session_id)
+            assert AbstractRouter.make_channels(
+                message_class, "response", ["abc", "def"]
+            ) == [pattern_func("response", "abc"), pattern_func("response", "def")]
+
+    def test_make_channel_keeps_session_id_transforms(self) -> None:
+        """Test patterns that change or branch on the session id are honoured."""
+
+        class LowerMessage(BaseMessage):
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"Lower:{direction}:{session_id.lower()}"
+
+                return pattern_func
+
+        class AllSessionsMessage(BaseMessage):
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    if session_id == "*":
+                        session_id = "broadcast"
+                    return f"AllSessions:{direction}:{session_id}"
+
+                return pattern_func
+
+        assert (
+            AbstractRouter.make_channel(LowerMessage, "request", "ABC")
+            == "Lower:request:abc"
+        )
+        assert (
+            AbstractRouter.make_channel(AllSessionsMessage, "response", "*")
+            == "AllSessions:response:broadcast"
+        )
+        assert (
+            AbstractRouter.make_channel(AllSessionsMessage, "response", "abc")
+            == "AllSessions:response:abc"
+        )
+        assert AbstractRouter.make_channels(
+            LowerMessage, "request", ["ABC", "Def"]
+        ) == ["Lower:request:abc", "Lower:request:def"]
+        assert AbstractRouter.make_channels(
+            AllSessionsMessage, "response", ["*", "abc"]
+        ) == ["AllSessions:response:broadcast", "AllSessions:response:abc"]
+
+    def test_make_channel_uses_opted_in_prefix(self) -> None:
+        """Test classes declaring channel_prefix are joined without the pattern."""
+
+        calls: List[str] = []
+
+        class PrefixedMessage(BaseMessage):
+            channel_prefix = "PrefixedMessage:"
+
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                def pattern_func(direction: str, session_id: str) -> str:
+                    calls.append(session_id)
+                    return f"PrefixedMessage:{direction}:{session_id}"
+
+                return pattern_func
+
+        # Checked against the pattern once, when the class is defined
+        checked = len(calls)
+        assert checked > 0
+
+        assert (
+            AbstractRouter.make_channel(PrefixedMessage, "request", "abc")
+            == "PrefixedMessage:request:abc"
+        )
+        assert AbstractRouter.make_channels(PrefixedMessage, "request", ["x"]) == [
+            "PrefixedMessage:request:x"
+        ]
+        assert len(calls) == checked
+
+    def test_make_channel_fetches_pattern_function_once(self) -> None:
+        """Test get_channel_pattern is called once per class, not per channel."""
+        fetches: List[str] = []
+
+        class CountedMessage(BaseMessage):
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                fetches.append(cls.__name__)
+
+                def pattern_func(direction: str, session_id: str) -> str:
+                    return f"Counted:{direction}:{session_id}"
+
+                return pattern_func
+
+        assert AbstractRouter.make_channels(CountedMessage, "request", ["a", "b"]) == [
+            "Counted:request:a",
+            "Counted:request:b",
+        ]
+        assert (
+            AbstractRouter.make_channel(CountedMessage, "response", "c")
+            == "Counted:response:c"
+        )
+        assert fetches == ["CountedMessage"]
+
+    def test_mismatched_channel_prefix_is_rejected(self) -> None:
+        """Test a channel_prefix that disagrees with the pattern fails early."""
+        with pytest.raises(ValueError, match="channel_prefix"):
+
+            class MislabelledMessage(BaseMessage):
+                channel_prefix = "Other:"
+
+                @classmethod
+                def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                    def pattern_func(direction: str, session_id: str) -> str:
+                        return f"Mislabelled:{direction}:{session_id}"
+
+                    return pattern_func
+
+
+class TestBatchedPublishing:
+    """Test publish_nowait batching."""
+
+    @pytest.mark.asyncio
+    async def test_publish_nowait_flushes_in_one_batch(self) -> None:
+        """Test messages queued in one loop iteration are sent together."""
+        router = RecordingRouter()
+
+        for i in range(5):
+            router.publish_nowait(OrderMessage(order_id=str(i)), "OrderMessage:a:b")
+        assert router.published == []
+
+        await router.flush()
+
+        assert router.publish_batches == [5]
+        assert len(router.published) == 5
+
+    @pytest.mark.asyncio
+    async def test_publish_many_sends_one_batch(self) -> None:
+        """Test publish_many hands every message to the backend at once."""
+        router = RecordingRouter()
+
+        await router.publish_many(
+            [
+                (OrderMessage(order_id="1"), "OrderMessage:request:a"),
+                (OrderMessage(order_id="2"), "OrderMessage:request:b"),
+            ]
+        )
+        await router.publish_many([])
+
+        assert router.publish_batches == [2]
+        assert [channel for channel, _ in router.published] == [
+            "OrderMessage:request:a",
+            "OrderMessage:request:b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_raw_reuses_serialized_data(self) -> None:
+        """Test pre-serialized data is published unchanged and still decodes."""
+        router = RecordingRouter()
+        data = router.serialize(OrderMessage(order_id="1"))
+
+        await router.publish_raw("OrderMessage:request:a", data)
+        await router.publish_raw_many(
+            [("OrderMessage:request:b", data), ("OrderMessage:request:c", data)]
+        )
+        await router.publish_raw_many([])
+
+        assert router.publish_batches == [2]
+        assert router.published == [
+            ("OrderMessage:request:a", data),
+            ("OrderMessage:request:b", data),
+            ("OrderMessage:request:c", data),
+        ]
+        assert router._deserialize_message(data) == OrderMessage(order_id="1")
+
+    @pytest.mark.asyncio
+    async def test_batching_agent_queues_publishes(self) -> None:
+        """Test agents created with batch_publishes go through the queue."""
+        router = RecordingRouter()
+        agent = OrderAgent(router=router, batch_publishes=True)
+
+        await agent.publish(InvoiceMessage(amount=1.0), "InvoiceMessage:response:a")
+        await agent.broadcast(InvoiceMessage(amount=2.0), session_id="b")
+        assert router.published == []
+
+        await router.flush()
+
+        assert router.publish_batches == [2]
+        assert [channel for channel, _ in router.published] == [
+            "InvoiceMessage:response:a",
+            "InvoiceMessage:response:b",
+        ]
+
+
+class TestSerialization:
+    """Test the router wire format."""
+
+    def test_serialize_round_trip(self) -> None:
+        """Test messages survive serialization with their type tag."""
+        router = RecordingRouter()
+        router._subscriptions["OrderMessage:*:*"] = {OrderAgent()}
+
+        data = router._serialize_message(OrderMessage(order_id="42"))
+        message = router._deserialize_message(data)
+
+        assert isinstance(message, OrderMessage)
+        assert message.order_id == "42"
+
+    @pytest.mark.asyncio
+    async def test_fast_message_round_trip(self) -> None:
+        """Test non-Pydantic FastMessages travel the same wire format."""
+        from agent_communication.protocols import FastMessage
+
+        class TelemetryMessage(FastMessage):
+            __slots__ = ("sensor", "value")
+
+        class TelemetryAgent(OrderAgent):
+            messages = [TelemetryMessage]  # type: ignore[list-item]
+
+        router = RecordingRouter()
+        agent = TelemetryAgent()
+        await router.auto_subscribe_agent(agent)
+
+        message = TelemetryMessage(sensor="cpu", value=0.5)
+        await router.publish(message, "TelemetryMessage:request:abc")  # type: ignore[arg-type]
+        channel, data = router.published[0]
+        await router.deliver_message(channel, data)
+
+        assert data == b'{"__type__":"TelemetryMessage","sensor":"cpu","value":0.5}'
+        assert [received for received, _ in agent.received] == [message]
+
+    def test_unsubscribed_message_class_resolved_from_registry(self) -> None:
+        """Test classes nobody subscribed to are found by name."""
+        from agent_communication.base import _MESSAGE_REGISTRY
+
+        class RefundMessage(OrderMessage):
+            pass
+
+        router = RecordingRouter()
+
+        assert _MESSAGE_REGISTRY["RefundMessage"] is RefundMessage
+        message = router._deserialize_message(
+            b'{"__type__":"RefundMessage","order_id":"7"}'
+        )
+        assert isinstance(message, RefundMessage)
+        with pytest.raises(ValueError, match="NoSuchMessage") as exc_info:
+            router._deserialize_message(b'{"__type__":"NoSuchMessage"}')
+        assert isinstance(exc_info.value, MessageClassNotRegistered)
+        assert "RefundMessage" in exc_info.value.available_classes
+
+    def test_serialized_message_carries_type_tag(self) -> None:
+        """Test the type tag is spliced into the model's JSON."""
+        import json
+
+        router = RecordingRouter()
+        data = router._serialize_message(OrderMessage(order_id="42"))
+
+        assert json.loads(data) == {"__type__": "OrderMessage", "order_id": "42"}
+        assert data.startswith(b'{"__type__":"OrderMessage",')
+
+        class EmptyMessage(BaseMessage):
+            @classmethod
+            def get_channel_pattern(cls) -> Callable[[str, str], str]:
+                return OrderMessage.get_channel_pattern()
+
+        assert json.loads(router._serialize_message(EmptyMessage())) == {
+            "__type__": "EmptyMessage"
+        }
+
+    def test_decoder_accepts_nan_literals(self) -> None:
+        """Test payloads written by the standard json encoder still decode."""
+        import math
+
+        from agent_communication.routers.base import _loads
+
+        assert math.isnan(_loads(b'{"ratio":NaN}')["ratio"])
+
+    @pytest.mark.asyncio
+    async def test_message_class_index_follows_subscriptions(self) -> None:
+        """Test subscribed agents' message classes are indexed by name."""
+        router = RecordingRouter()
+        agent = BillingAgent()
+
+        await router.subscribe(agent, "OrderMessage:*:*")
+        await router.subscribe(agent, "InvoiceMessage:*:*")
+        assert router._message_class_index == {
+            "OrderMessage": OrderMessage,
+            "InvoiceMessage": InvoiceMessage,
+        }
+
+        await router.unsubscribe(agent, "OrderMessage:*:*")
+        assert "OrderMessage" in router._message_class_index
+
+        await router.unsubscribe(agent)
+        assert router._message_class_index == {}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_all_batches_backend_calls(self) -> None:
+        """Test patterns emptied by one unsubscribe go out in one backend call."""
+        router = RecordingRouter()
+        agent = BillingAgent()
+        other = OrderAgent()
+
+        await router.auto_subscribe_agents([agent, other])
+        await router.subscribe(agent, "OrderMessage:request:*")
+        await router.unsubscribe(agent)
+
+        assert len(router.unsubscribe_calls) == 1
+        assert sorted(router.unsubscribe_calls[0]) == [
+            "InvoiceMessage:*:*",
+            "OrderMessage:request:*",
+        ]
+        assert router._subscriptions == {"OrderMessage:*:*": {other}}
+
+    @pytest.mark.asyncio
+    async def test_reset_subscriptions_keeps_router_usable(self) -> None:
+        """Test a reset drops every pattern in one backend call."""
+        router = RecordingRouter()
+        first = OrderAgent()
+        second = OrderAgent()
+        await router.subscribe(first, "OrderMessage:*:*")
+        await router.subscribe(second, "OrderMessage:request:*")
+
+        await router.reset_subscriptions()
+
+        assert router.unsubscribe_calls == [
+            ["OrderMessage:*:*", "OrderMessage:request:*"]
+        ]
+        assert router._subscriptions == {}
+        assert router._state.agents_for("OrderMessage:request:a") == ()
+
+        await router.subscribe(first, "OrderMessage:*:*")
+        assert router._state.agents_for("OrderMessage:request:a") == (first,)
+
+
+class TestDelivery:
+    """Test matching inbound channels to subscribed agents."""
+
+    @pytest.mark.asyncio
+    async def test_deliver_message_matches_literal_and_wildcard_patterns(
+        self,
+    ) -> None:
+        """Test every agent whose pattern matches receives the message once."""
+        router = RecordingRouter()
+        exact_agent = OrderAgent()
+        class_agent = OrderAgent()
+        session_agent = OrderAgent()
+        other_agent = OrderAgent()
+
+        await router.subscribe(exact_agent, "OrderMessage:request:abc")
+        await router.subscribe(class_agent, "OrderMessage:*")
+        await router.subscribe(class_agent, "Order*:*:*")
+        await router.subscribe(session_agent, "*:abc")
+        await router.subscribe(other_agent, "OrderMessage:*:xyz")
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert len(exact_agent.received) == 1
+        assert len(class_agent.received) == 1
+        assert len(session_agent.received) == 1
+        assert other_agent.received == []
+        assert exact_agent.received[0][1] == {
+            "message_class": "OrderMessage",
+            "direction": "request",
+            "session_id": "abc",
+        }
+
+    @pytest.mark.asyncio
+    async def test_per_subscription_copies_reach_each_agent_once(self) -> None:
+        """Test backends delivering one copy per pattern cause no duplicates."""
+        router = RecordingRouter()
+        both_agent = OrderAgent()
+        wildcard_agent = OrderAgent()
+        exact_agent = OrderAgent()
+
+        await router.subscribe(both_agent, "OrderMessage:*:*")
+        await router.subscribe(both_agent, "OrderMessage:request:abc")
+        await router.subscribe(wildcard_agent, "OrderMessage:*:*")
+        await router.subscribe(exact_agent, "OrderMessage:request:abc")
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        for pattern in ("OrderMessage:request:abc", "OrderMessage:*:*"):
+            await router.deliver_message("OrderMessage:request:abc", data, pattern)
+        await router.deliver_message("OrderMessage:request:abc", data, "Other:*")
+
+        assert len(both_agent.received) == 1
+        assert len(wildcard_agent.received) == 1
+        assert len(exact_agent.received) == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribing_between_copies_causes_no_duplicate(self) -> None:
+        """Test copies of one message resolve against the first copy's snapshot."""
+        router = RecordingRouter()
+        agent = OrderAgent()
+        await router.subscribe(agent, "OrderMessage:*:*")
+        await router.subscribe(agent, "OrderMessage:request:*")
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        channel = "OrderMessage:request:abc"
+        await router.deliver_message(channel, data, "OrderMessage:*:*")
+        await router.unsubscribe(agent, "OrderMessage:*:*")
+        await router.deliver_message(channel, data, "OrderMessage:request:*")
+
+        assert len(agent.received) == 1
+
+        # A repeated pattern is the next message, resolved afresh
+        await router.deliver_message(channel, data, "OrderMessage:request:*")
+
+        assert len(agent.received) == 2
+
+    def test_channel_context_is_a_fresh_dict(self) -> None:
+        """Test cached channel parsing never hands out a shared dict."""
+        router = RecordingRouter()
+
+        context = router._parse_channel_context("OrderMessage:request:abc")
+        context["session_id"] = "changed"
+
+        assert router._parse_channel_context("OrderMessage:request:abc") == {
+            "message_class": "OrderMessage",
+            "direction": "request",
+            "session_id": "abc",
+        }
+
+    def test_channel_context_shares_interned_segments(self) -> None:
+        """Test contexts for different sessions share class and direction."""
+        router = RecordingRouter()
+
+        first = router._parse_channel_context("OrderMessage:request:abc")
+        second = router._parse_channel_context("OrderMessage:request:def")
+
+        assert first["message_class"] is second["message_class"]
+        assert first["direction"] is second["direction"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self) -> None:
+        """Test removed wildcard patterns no longer match."""
+        router = RecordingRouter()
+        agent = OrderAgent()
+
+        await router.subscribe(agent, "OrderMessage:*:*")
+        await router.unsubscribe(agent)
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert agent.received == []
+        assert router.unsubscribed == ["OrderMessage:*:*"]
+
+
+class AsyncOrderAgent(OrderAgent):
+    async def handle_message(  # type: ignore[override]
+        self, message: BaseMessage, context: Dict[str, str]
+    ) -> None:
+        self.received.append((message, context))
+
+
+class TestHandlerDispatch:
+    """Test sync and async handler dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_handler_kind_is_cached_per_agent(self) -> None:
+        """Test coroutine handlers are awaited and the check is cached by agent."""
+        router = RecordingRouter()
+        sync_agent = OrderAgent()
+        async_agent = AsyncOrderAgent()
+
+        await router.subscribe(sync_agent, "OrderMessage:*:*")
+        await router.subscribe(async_agent, "OrderMessage:*:*")
+
+        assert router._agent_handlers[sync_agent][1] is False
+        assert router._agent_handlers[async_agent][1] is True
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert len(sync_agent.received) == 1
+        assert len(async_agent.received) == 1
+
+    @pytest.mark.asyncio
+    async def test_handler_is_bound_once_per_subscribed_agent(self) -> None:
+        """Test the bound handler is kept while the agent has subscriptions."""
+        router = RecordingRouter()
+        agent = OrderAgent()
+
+        await router.subscribe(agent, "OrderMessage:*:*")
+        await router.subscribe(agent, "OrderMessage:request:*")
+        cached = router._agent_handlers[agent]
+
+        assert cached == (agent.handle_message, False)
+
+        await router.unsubscribe(agent, "OrderMessage:*:*")
+        assert router._agent_handlers[agent] is cached
+
+        await router.unsubscribe(agent)
+        assert agent not in router._agent_handlers
+
+    @pytest.mark.asyncio
+    async def test_instance_handler_overrides_are_followed(self) -> None:
+        """Test handlers set on the instance are called with the right kind."""
+        router = RecordingRouter()
+        agent = OrderAgent()
+        data = router._serialize_message(OrderMessage(order_id="1"))
+
+        mock = AsyncMock()
+        agent.handle_message = mock  # type: ignore[method-assign]
+        await router.subscribe(agent, "OrderMessage:*:*")
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        mock.assert_awaited_once()
+
+        # Reassigned after subscribing
+        received: List[BaseMessage] = []
+        agent.handle_message = (  # type: ignore[method-assign]
+            lambda message, context: received.append(message)
+        )
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert len(received) == 1
+        assert mock.await_count == 1
+        assert router._agent_handlers[agent] == (agent.handle_message, False)
+
+
+class SlowOrderAgent(OrderAgent):
+    running = 0
+    max_running = 0
+
+    async def handle_message(  # type: ignore[override]
+        self, message: BaseMessage, context: Dict[str, str]
+    ) -> None:
+        cls = type(self)
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        self.received.append((message, context))
+
+
+class TestDeliveryConcurrency:
+    """Test bounded and fire-and-forget delivery."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_deliveries_bounds_handlers(self) -> None:
+        """Test no more handlers run at once than the configured limit."""
+        router = RecordingRouter(max_concurrent_deliveries=1)
+        agents = [SlowOrderAgent() for _ in range(3)]
+        SlowOrderAgent.max_running = 0
+        for agent in agents:
+            await router.subscribe(agent, "OrderMessage:*:*")
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert SlowOrderAgent.max_running == 1
+        assert all(len(agent.received) == 1 for agent in agents)
+
+    @pytest.mark.asyncio
+    async def test_fire_and_forget_returns_before_handlers_finish(self) -> None:
+        """Test handlers keep running in the background until stop waits."""
+        router = RecordingRouter(fire_and_forget=True)
+        agent = SlowOrderAgent()
+        await router.start()
+        await router.subscribe(agent, "OrderMessage:*:*")
+
+        data = router._serialize_message(OrderMessage(order_id="1"))
+        await router.deliver_message("OrderMessage:request:abc", data)
+
+        assert agent.received == []
+        assert len(router._delivery_tasks) == 1
+
+        await router.stop()
+
+        assert len(agent.received) == 1
+        assert not router._delivery_tasks
+
+
+class TestResolutionCache:
+    """Test the per-snapshot channel resolution cache."""
+
+    @pytest.mark.asyncio
+    async def test_resolved_agents_are_cached_until_subscriptions_change(
+        self,
+    ) -> None:
+        """Test repeated channels hit the cache and subscribing invalidates it."""
+        router = RecordingRouter()
+        first = OrderAgent()
+        second = OrderAgent()
+        await router.subscribe(first, "OrderMessage:*:*")
+
+        state = router._state
+        assert state.agents_for("OrderMessage:request:abc") == (first,)
+        assert list(state.resolved) == ["OrderMessage:request:abc"]
+
+        await router.subscribe(second, "*:request:abc")
+
+        assert not router._state.resolved
+        assert set(router._state.agents_for("OrderMessage:request:abc")) == {
+            first,
+            second,
+        }
+
+    def test_cache_evicts_least_recently_used(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cache stays within its size bound."""
+        from agent_communication.routers import base
+        from agent_communication.routers.base import _SubState
+
+        monkeypatch.setattr(base, "_RESOLUTION_CACHE_SIZE", 2)
+        state = _SubState()
+        state.agents_for("a:b:1")
+        state.agents_for("a:b:2")
+        state.agents_for("a:b:1")
+        state.agents_for("a:b:3")
+
+        assert list(state.resolved) == ["a:b:1", "a:b:3"]
+
+
+class TestSubscriptionTrie:
+    """Test the segment trie used for wildcard subscriptions."""
+
+    def test_trie_insert_match_and_prune(self) -> None:
+        """Test matching follows literal and wildcard edges and prunes on remove."""
+        from agent_communication.routers.base import _SubTrie
+
+        trie = _SubTrie()
+        trie.insert(["Order", "*", "*"], "Order:*:*")
+        trie.insert(["*", "*", "abc"], "*:*:abc")
+
+        assert sorted(trie.match(["Order", "request", "abc"])) == [
+            "*:*:abc",
+            "Order:*:*",
+        ]
+        assert trie.match(["Invoice", "request", "xyz"]) == []
+
+        trie.remove(["Order", "*", "*"])
+
+        assert trie.match(["Order", "request", "abc"]) == ["*:*:abc"]
+        assert "Order" not in trie.children
+
+    @pytest.mark.parametrize("num_patterns", [1, 10, 100])
+    def test_trie_match_agrees_with_fnmatch(self, num_patterns: int) -> None:
+        """Test the trie finds exactly the patterns fnmatch would, at any size."""
+        from fnmatch import fnmatchcase
+
+        from agent_communication.routers.base import _SubTrie
+
+        patterns = [f"Message{i}:*:*" for i in range(num_patterns)]
+        patterns += ["*:request:*", "*:*:abc"]
+        trie = _SubTrie()
+        for pattern in patterns:
+            trie.insert(pattern.split(":"), pattern)
+
+        for channel in ("Message0:request:abc", "Message7:response:xyz", "Other:a:b"):
+            expected = sorted(p for p in patterns if fnmatchcase(channel, p))
+            assert sorted(trie.match(channel.split(":"))) == expected
+
+
+class TestSubscriptionSnapshot:
+    """Test the copy-on-write subscription snapshot read by delivery."""
+
+    @pytest.mark.asyncio
+    async def test_published_snapshot_is_not_mutated(self) -> None:
+        """Test (un)subscribing swaps in a new snapshot instead of editing one."""
+        router = RecordingRouter()
+        first = OrderAgent()
+        second = OrderAgent()
+
+        await router.subscribe(first, "OrderMessage:*:*")
+        before = router._state
+
+        await router.subscribe(second, "OrderMessage:*:*")
+        await router.subscribe(second, "Order*:request:*")
+
+        assert before.subscriptions == {"OrderMessage:*:*": frozenset({first})}
+        assert before.matching_patterns("OrderMessage:request:abc") == [
+            "OrderMessage:*:*"
+        ]
+        assert sorted(router._state.matching_patterns("OrderMessage:request:abc")) == [
+            "Order*:request:*",
+            "OrderMessage:*:*",
+        ]
+
+        await router.unsubscribe(second)
+
+        assert before.agents_for("OrderMessage:request:abc") == (first,)
+        assert router._state.subscriptions == {"OrderMessage:*:*": frozenset({first})}
+        assert router._state.combined_regex is None
+
+    @pytest.mark.asyncio
+    async def test_single_changes_update_the_snapshot_incrementally(self) -> None:
+        """Test per-pattern updates match a full rebuild and share the rest."""
+        router = RecordingRouter()
+        agents = [OrderAgent() for _ in range(3)]
+        patterns = [
+            "OrderMessage:*:*",
+            "OrderMessage:request:*",
+            "OrderMessage:request:abc",
+            "Order*:response:*",
+        ]
+        for i, pattern in enumerate(patterns):
+            await router.subscribe(agents[i % 3], pattern)
+        untouched = router._state.subscriptions["OrderMessage:*:*"]
+        before = router._state
+
+        await router.subscribe(agents[1], "OrderMessage:request:*")
+        await router.unsubscribe(agents[0], "OrderMessage:request:abc")
+        await router.unsubscribe(agents[0], "Order*:response:*")
+        await router.subscribe(agents[2], "Invoice*:*:*")
+
+        incremental = router._state
+        assert incremental.subscriptions["OrderMessage:*:*"] is untouched
+        assert sorted(before.matching_patterns("OrderMessage:request:abc")) == [
+            "OrderMessage:*:*",
+            "OrderMessage:request:*",
+            "OrderMessage:request:abc",
+        ]
+
+        router._publish_state()
+        rebuilt = router._state
+        assert incremental.subscriptions == rebuilt.subscriptions
+        assert incremental.message_classes == rebuilt.message_classes
+        for channel in (
+            "OrderMessage:request:abc",
+            "OrderMessage:response:xyz",
+            "InvoiceMessage:request:abc",
+        ):
+            assert sorted(incremental.matching_patterns(channel)) == sorted(
+                rebuilt.matching_patterns(channel)
+            )